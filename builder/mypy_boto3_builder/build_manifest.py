@@ -0,0 +1,206 @@
+"""
+Build manifest that tracks botocore model hashes of generated service modules.
+"""
+import functools
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from boto3.session import Session
+from botocore.exceptions import DataNotFoundError, UnknownServiceError
+from botocore.loaders import Loader
+
+from mypy_boto3_builder.constants import (
+    BUILDER_PATH,
+    MODEL_TYPE_NAMES,
+    TEMPLATES_PATH,
+)
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.version import __version__ as version
+
+
+__all__ = (
+    "BuildManifest",
+    "get_model_hash",
+    "get_templates_hash",
+    "get_sources_hash",
+    "get_build_hash",
+)
+
+
+def _update_hash(file_hash: "hashlib._Hash", paths: Iterable[Path], root: Path) -> None:
+    for path in paths:
+        file_hash.update(path.relative_to(root).as_posix().encode())
+        file_hash.update(b"\0")
+        file_hash.update(path.read_bytes())
+        file_hash.update(b"\0")
+
+
+def get_model_file_paths(
+    loader: Loader, service_name: ServiceName, type_name: str
+) -> List[Path]:
+    """
+    Get botocore data files for the latest API version of a service model type.
+
+    Includes `*.sdk-extras.json` files that botocore merges into the model.
+
+    Arguments:
+        loader -- botocore data loader.
+        service_name -- Target service name.
+        type_name -- Model type name, e.g. `service-2`.
+
+    Returns:
+        A sorted list of file paths, empty if model type does not exist.
+    """
+    try:
+        api_versions = loader.list_api_versions(service_name.boto3_name, type_name)
+    except (DataNotFoundError, UnknownServiceError):
+        return []
+
+    if not api_versions:
+        return []
+
+    api_version = max(api_versions)
+    for search_path in loader.search_paths:
+        model_path = Path(search_path) / service_name.boto3_name / api_version
+        paths = sorted(model_path.glob(f"{type_name}.*"))
+        if paths:
+            return paths
+
+    return []
+
+
+def get_model_hash(session: Session, service_name: ServiceName) -> str:
+    """
+    Get hash of all botocore model files used to generate service module.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- Target service name.
+
+    Returns:
+        Hex digest.
+    """
+    loader = session._loader  # pylint: disable=protected-access
+    result = hashlib.sha256()
+    for type_name in MODEL_TYPE_NAMES:
+        result.update(type_name.encode())
+        for path in get_model_file_paths(loader, service_name, type_name):
+            _update_hash(result, [path], path.parent)
+
+    return result.hexdigest()
+
+
+def get_templates_hash() -> str:
+    """
+    Get hash of the whole templates tree.
+
+    Returns:
+        Hex digest.
+    """
+    result = hashlib.sha256()
+    paths = sorted(i for i in TEMPLATES_PATH.glob("**/*") if i.is_file())
+    _update_hash(result, paths, TEMPLATES_PATH)
+    return result.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def get_sources_hash() -> str:
+    """
+    Get hash of builder Python sources.
+
+    Returns:
+        Hex digest.
+    """
+    result = hashlib.sha256()
+    _update_hash(result, sorted(BUILDER_PATH.glob("**/*.py")), BUILDER_PATH)
+    return result.hexdigest()
+
+
+def get_build_hash(model_hash: str, templates_hash: str, *build_keys: str) -> str:
+    """
+    Get hash of everything that service module output depends on.
+
+    Builder sources are included, so changes in builder code regenerate
+    modules even if builder version is not bumped.
+
+    Arguments:
+        model_hash -- Hash of botocore model files.
+        templates_hash -- Hash of templates tree.
+        build_keys -- Additional keys, e.g. build and boto3 versions.
+
+    Returns:
+        Hex digest.
+    """
+    result = hashlib.sha256()
+    for key in (version, get_sources_hash(), model_hash, templates_hash, *build_keys):
+        result.update(key.encode())
+        result.update(b"\0")
+    return result.hexdigest()
+
+
+class BuildManifest:
+    """
+    Build manifest that tracks botocore model hashes of generated service modules.
+
+    Arguments:
+        path -- Manifest file path.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.services: Dict[str, str] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "BuildManifest":
+        """
+        Load manifest from `path`.
+
+        Invalid or missing manifest is treated as empty.
+
+        Arguments:
+            path -- Manifest file path.
+
+        Returns:
+            A new BuildManifest.
+        """
+        result = cls(path)
+        if not path.exists():
+            return result
+
+        try:
+            data = json.loads(path.read_text())
+            result.services.update(data["services"])
+        except (ValueError, KeyError, TypeError) as e:
+            get_logger().warning(f"Cannot read build manifest {path}: {e}")
+
+        return result
+
+    def save(self) -> None:
+        """
+        Write manifest to `path`.
+        """
+        data = {"version": version, "services": self.services}
+        self.path.write_text(json.dumps(data, indent=2, sort_keys=True))
+
+    def is_changed(self, service_name: ServiceName, build_hash: str) -> bool:
+        """
+        Whether service module has to be regenerated.
+
+        Arguments:
+            service_name -- Target service name.
+            build_hash -- Current build hash.
+        """
+        return self.services.get(service_name.name) != build_hash
+
+    def update(self, service_name: ServiceName, build_hash: str) -> None:
+        """
+        Set build hash for a generated service module.
+
+        Arguments:
+            service_name -- Target service name.
+            build_hash -- Current build hash.
+        """
+        self.services[service_name.name] = build_hash
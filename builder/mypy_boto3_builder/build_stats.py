@@ -0,0 +1,103 @@
+"""
+Build counters and timers.
+"""
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+
+__all__ = ("BuildStats", "StatsSnapshot")
+
+
+StatsSnapshot = Tuple[Dict[str, int], Dict[str, float]]
+
+
+class BuildStats:
+    """
+    Build counters and timers.
+
+    Worker processes send their stats to the main process with `pop`
+    and `merge`, so the report covers the whole build.
+    """
+
+    counters: Dict[str, int] = {}
+    timers: Dict[str, float] = {}
+
+    @classmethod
+    def increment(cls, name: str, value: int = 1) -> None:
+        """
+        Increment counter `name` by `value`.
+
+        Arguments:
+            name -- Counter name.
+            value -- Increment.
+        """
+        cls.counters[name] = cls.counters.get(name, 0) + value
+
+    @classmethod
+    def add_time(cls, name: str, seconds: float) -> None:
+        """
+        Add `seconds` to timer `name`.
+
+        Arguments:
+            name -- Timer name.
+            seconds -- Time to add.
+        """
+        cls.timers[name] = cls.timers.get(name, 0.0) + seconds
+
+    @classmethod
+    @contextmanager
+    def measure(cls, name: str) -> Iterator[None]:
+        """
+        Add time spent in `with` block to timer `name`.
+
+        Arguments:
+            name -- Timer name.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.add_time(name, time.perf_counter() - start)
+
+    @classmethod
+    def pop(cls) -> StatsSnapshot:
+        """
+        Get collected stats and reset them.
+
+        Returns:
+            A tuple of counters and timers.
+        """
+        result = (cls.counters, cls.timers)
+        cls.counters = {}
+        cls.timers = {}
+        return result
+
+    @classmethod
+    def merge(cls, snapshot: StatsSnapshot) -> None:
+        """
+        Add stats collected in another process.
+
+        Arguments:
+            snapshot -- Result of `pop`.
+        """
+        counters, timers = snapshot
+        for name, value in counters.items():
+            cls.increment(name, value)
+        for name, seconds in timers.items():
+            cls.add_time(name, seconds)
+
+    @classmethod
+    def get_report(cls) -> List[str]:
+        """
+        Get human-readable report lines.
+
+        Returns:
+            A list of lines sorted by name, counters first.
+        """
+        result: List[str] = []
+        for name, value in sorted(cls.counters.items()):
+            result.append(f"{name}: {value}")
+        for name, seconds in sorted(cls.timers.items()):
+            result.append(f"{name}: {seconds:.2f}s")
+        return result
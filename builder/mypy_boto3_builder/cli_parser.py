@@ -2,8 +2,10 @@
 CLI parser.
 """
 import argparse
+import multiprocessing
 from pathlib import Path
 
+from mypy_boto3_builder.constants import CACHE_SIZE
 from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
 from mypy_boto3_builder.version import __version__ as version
 
@@ -64,6 +66,87 @@ def get_cli_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--skip-services", action="store_true", help="Whether to skip service modules"
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes to generate service modules in parallel",
+    )
+    parser.add_argument(
+        "--format-workers",
+        type=int,
+        default=1,
+        help="Number of processes to format modules written by the main process",
+    )
+    parser.add_argument(
+        "--verify-format",
+        action="store_true",
+        help="Check modules emitted without black with black and use black output on mismatch",
+    )
+    parser.add_argument(
+        "--verify-syntax",
+        action="store_true",
+        help="Check parsed request and response syntax with pyparsing grammar",
+    )
+    start_methods = multiprocessing.get_all_start_methods()
+    parser.add_argument(
+        "--start-method",
+        choices=start_methods,
+        default="fork" if "fork" in start_methods else None,
+        help=(
+            "Start method of worker processes, with `fork` workers share"
+            " botocore data preloaded by the main process"
+        ),
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Regenerate service modules even if botocore models are not changed",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=get_absolute_path,
+        help=(
+            "Directory to cache parsed service modules, methods and formatted modules,"
+            " disabled by default"
+        ),
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=CACHE_SIZE,
+        help=(
+            "Max total size of package and format caches in megabytes,"
+            f" default {CACHE_SIZE}"
+        ),
+    )
+    parser.add_argument(
+        "--docstrings",
+        action="store_true",
+        help="Parse all client methods from docstrings instead of botocore shapes (slow)",
+    )
+    parser.add_argument(
+        "--shared-type-defs",
+        action="store_true",
+        help=(
+            "Move TypedDicts that are identical in several services to a shared package,"
+            " all services are parsed before writing"
+        ),
+    )
+    parser.add_argument(
+        "--export-ir",
+        type=get_absolute_path,
+        metavar="IR_PATH",
+        help="Export parsed packages to a JSON IR directory",
+    )
+    parser.add_argument(
+        "--from-ir",
+        type=get_absolute_path,
+        metavar="IR_PATH",
+        help="Render packages from a JSON IR directory without parsing",
+    )
     parser.add_argument(
         "--panic",
         action="store_true",
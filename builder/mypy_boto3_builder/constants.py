@@ -9,14 +9,27 @@ MODULE_NAME = "mypy_boto3"
 # PyPI module name
 PYPI_NAME = "mypy-boto3"
 
+# Module name for TypedDicts shared by service packages
+SHARED_MODULE_NAME = "mypy_boto3_shared"
+
+# PyPI module name for TypedDicts shared by service packages
+SHARED_PYPI_NAME = "mypy-boto3-shared"
+
+# Output directory for TypedDicts shared by service packages,
+# matches `mypy_boto3_*` glob in release and install scripts
+SHARED_PACKAGE_DIR_NAME = f"{SHARED_MODULE_NAME}_package"
+
 # Random region to initialize services
 DUMMY_REGION = "us-west-2"
 
+# Builder package path
+BUILDER_PATH = Path(__file__).parent
+
 # Jinja2 templates for boto3-stubs
-TEMPLATES_PATH = Path(__file__).parent / "templates"
+TEMPLATES_PATH = BUILDER_PATH / "templates"
 
 # Static *.pyi files for boto3-stubs
-BOTO3_STUBS_STATIC_PATH = Path(__file__).parent / "boto3_stubs_static"
+BOTO3_STUBS_STATIC_PATH = BUILDER_PATH / "boto3_stubs_static"
 
 # Boto3 stubs module name
 BOTO3_STUBS_NAME = "boto3-stubs"
@@ -26,3 +39,36 @@ LINE_LENGTH = 100
 
 # type defs module name
 TYPE_DEFS_NAME = "type_defs"
+
+# botocore model types used to generate service modules
+MODEL_TYPE_NAMES = ("service-2", "paginators-1", "waiters-2", "resources-1")
+
+# Build manifest file name in output path
+BUILD_MANIFEST_NAME = "build_manifest.json"
+
+# Default max total size of package and format caches in megabytes
+CACHE_SIZE = 512
+
+# Max number of parsed methods in docstring parse results cache
+METHOD_CACHE_SIZE = 8192
+
+# Docstring parse results cache file name in cache directory
+METHOD_CACHE_NAME = "methods.cache"
+
+# Service catalogue file name in cache directory
+CATALOGUE_NAME = "catalogue.json"
+
+# Decoded botocore model files cache directory name in cache directory
+MODEL_CACHE_NAME = "models"
+
+# Formatted modules cache directory name in cache directory
+FORMAT_CACHE_NAME = "formatted"
+
+# Compiled Jinja2 templates cache directory name in cache directory
+TEMPLATES_CACHE_NAME = "templates"
+
+# Min size of rendered module in bytes to format it per statement with cache
+CHUNK_FORMAT_SIZE = 64 * 1024
+
+# Block size in bytes to read existing files to compare with written content
+WRITE_BLOCK_SIZE = 64 * 1024
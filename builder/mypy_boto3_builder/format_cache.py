@@ -0,0 +1,132 @@
+"""
+On-disk cache of formatted module sources.
+"""
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from black import __version__ as black_version
+
+from mypy_boto3_builder.logger import get_logger
+
+
+__all__ = ("FormatCache",)
+
+
+class FormatCache:
+    """
+    On-disk cache of `black` output by unformatted content hash.
+
+    Rendered templates are the same for unchanged services, so formatting
+    is skipped for them. Least recently used entries are removed
+    when cache size exceeds `max_size`.
+
+    Arguments:
+        path -- Cache directory.
+        max_size -- Max cache size in bytes.
+        build_keys -- Additional keys, e.g. formatter options.
+    """
+
+    SUFFIX = ".formatted"
+
+    def __init__(
+        self, path: Path, max_size: int, build_keys: Iterable[str] = ()
+    ) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.build_keys = tuple(build_keys)
+
+    def get_key(self, content: str, file_path: Path, *keys: str) -> str:
+        """
+        Get cache key for unformatted content.
+
+        Arguments:
+            content -- Unformatted content.
+            file_path -- Target file path.
+            keys -- Entry kind keys.
+
+        Returns:
+            Hex digest.
+        """
+        result = hashlib.sha256()
+        for key in (black_version, file_path.suffix, *self.build_keys, *keys):
+            result.update(key.encode())
+            result.update(b"\0")
+        result.update(content.encode())
+        return result.hexdigest()
+
+    def get_path(self, key: str) -> Path:
+        """
+        Get cache file path.
+
+        Arguments:
+            key -- Cache key.
+
+        Returns:
+            Cache file path.
+        """
+        return self.path / f"{key}{self.SUFFIX}"
+
+    def load(self, key: str) -> Optional[str]:
+        """
+        Load formatted content and mark it as recently used.
+
+        Arguments:
+            key -- Cache key.
+
+        Returns:
+            Formatted content or None on cache miss.
+        """
+        path = self.get_path(key)
+        try:
+            result = path.read_text()
+        except OSError:
+            return None
+        except ValueError as e:
+            get_logger().warning(f"Cannot load cached {path.name}: {e}")
+            return None
+
+        try:
+            os.utime(path.as_posix())
+        except OSError:
+            pass
+
+        return result
+
+    def save(self, key: str, content: str) -> None:
+        """
+        Save formatted content.
+
+        Arguments:
+            key -- Cache key.
+            content -- Formatted content.
+        """
+        path = self.get_path(key)
+        self.path.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(content)
+        os.replace(temp_path.as_posix(), path.as_posix())
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until cache fits `max_size`.
+        """
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self.path.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            get_logger().debug(f"Removed cached {path.name}")
+            total_size -= size
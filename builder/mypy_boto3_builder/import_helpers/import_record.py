@@ -84,6 +84,8 @@ class ImportRecord:
             return False
 
         if self.source == other.source:
+            if self.name == other.name:
+                return self.alias > other.alias
             return self.name > other.name
 
         if self.is_local() and not other.is_local():
@@ -0,0 +1,343 @@
+"""
+Stable JSON intermediate representation of parsed packages.
+
+IR contains everything writers need, so packages can be rendered again
+without parsing botocore models.
+"""
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Type as TypingType
+
+from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
+from mypy_boto3_builder.import_helpers.import_string import ImportString
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.argument import Argument
+from mypy_boto3_builder.structures.attribute import Attribute
+from mypy_boto3_builder.structures.boto3_stubs_package import Boto3StubsPackage
+from mypy_boto3_builder.structures.class_record import ClassRecord
+from mypy_boto3_builder.structures.client import Client
+from mypy_boto3_builder.structures.collection import Collection
+from mypy_boto3_builder.structures.function import Function
+from mypy_boto3_builder.structures.master_package import MasterPackage
+from mypy_boto3_builder.structures.method import Method
+from mypy_boto3_builder.structures.package import Package
+from mypy_boto3_builder.structures.paginator import Paginator
+from mypy_boto3_builder.structures.resource import Resource
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.structures.service_resource import ServiceResource
+from mypy_boto3_builder.structures.shared_package import SharedPackage
+from mypy_boto3_builder.structures.waiter import Waiter
+from mypy_boto3_builder.type_annotations.external_import import ExternalImport
+from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
+from mypy_boto3_builder.type_annotations.internal_import import InternalImport
+from mypy_boto3_builder.type_annotations.type_annotation import TypeAnnotation
+from mypy_boto3_builder.type_annotations.type_class import TypeClass
+from mypy_boto3_builder.type_annotations.type_constant import TypeConstant
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+from mypy_boto3_builder.version import __version__ as version
+
+
+__all__ = (
+    "IR_FORMAT",
+    "dump_package",
+    "load_package",
+    "write_ir",
+    "read_ir",
+    "get_ir_path",
+)
+
+# IR format version, bump on incompatible changes
+IR_FORMAT = 1
+
+TYPE_KEY = "__type__"
+
+STRUCTURE_CLASSES: Tuple[TypingType[Any], ...] = (
+    Argument,
+    Attribute,
+    Boto3StubsPackage,
+    ClassRecord,
+    Client,
+    Collection,
+    Function,
+    MasterPackage,
+    Method,
+    Paginator,
+    Resource,
+    ServicePackage,
+    ServiceResource,
+    SharedPackage,
+    Waiter,
+)
+
+
+class IREncoder:
+    """
+    Encoder of parsed structures to JSON-compatible data.
+
+    `TypeTypedDict` instances are stored in a separate table and referenced
+    by index, as they are shared and can be recursive.
+    `TypeClass` is stored as an `ExternalImport` with the same import record.
+    """
+
+    def __init__(self) -> None:
+        self.typed_dicts: List[Dict[str, Any]] = []
+        self.typed_dict_indexes: Dict[int, int] = {}
+
+    def encode(self, value: Any) -> Any:
+        """
+        Encode `value` recursively.
+
+        Raises:
+            ValueError -- If value cannot be encoded.
+        """
+        if value is None or isinstance(value, (str, bool, int, float)):
+            return value
+        if isinstance(value, list):
+            return [self.encode(i) for i in value]
+        if isinstance(value, ServiceName):
+            return {
+                TYPE_KEY: "ServiceName",
+                "name": value.name,
+                "class_name": value.class_name,
+                "boto3_version": value.boto3_version,
+            }
+        if isinstance(value, FakeAnnotation):
+            return self.encode_type_annotation(value)
+        if isinstance(value, STRUCTURE_CLASSES):
+            result = {TYPE_KEY: value.__class__.__name__}
+            for field in dataclasses.fields(value):
+                result[field.name] = self.encode(getattr(value, field.name))
+            return result
+
+        raise ValueError(f"Cannot encode {value!r}")
+
+    def encode_type_annotation(self, value: FakeAnnotation) -> Dict[str, Any]:
+        """
+        Encode type annotation wrapper.
+
+        Raises:
+            ValueError -- If type annotation cannot be encoded.
+        """
+        if isinstance(value, TypeTypedDict):
+            return {TYPE_KEY: "TypeTypedDict", "index": self.add_typed_dict(value)}
+        if isinstance(value, TypeSubscript):
+            return {
+                TYPE_KEY: "TypeSubscript",
+                "parent": self.encode(value.parent),
+                "children": self.encode(value.children),
+            }
+        if isinstance(value, TypeAnnotation):
+            return {TYPE_KEY: "TypeAnnotation", "name": value.get_import_name()}
+        if isinstance(value, TypeConstant):
+            if value.value is Ellipsis:
+                return {TYPE_KEY: "TypeConstant", "ellipsis": True}
+            return {TYPE_KEY: "TypeConstant", "value": self.encode(value.value)}
+        if isinstance(value, TypeLiteral):
+            return {TYPE_KEY: "TypeLiteral", "children": self.encode(value.children)}
+        if isinstance(value, InternalImport):
+            return {
+                TYPE_KEY: "InternalImport",
+                "name": value.name,
+                "service_name": self.encode(value.service_name),
+                "module_name": value.module_name.name,
+            }
+        if isinstance(value, (ExternalImport, TypeClass)):
+            import_record = value.get_import_record()
+            return {
+                TYPE_KEY: "ExternalImport",
+                "source": import_record.source.parts,
+                "name": import_record.name,
+                "alias": import_record.alias,
+            }
+
+        raise ValueError(f"Cannot encode {value!r}")
+
+    def add_typed_dict(self, value: TypeTypedDict) -> int:
+        """
+        Add `TypeTypedDict` to the table if it is not there yet.
+
+        Returns:
+            TypedDict index in the table.
+        """
+        key = id(value)
+        if key in self.typed_dict_indexes:
+            return self.typed_dict_indexes[key]
+
+        index = len(self.typed_dicts)
+        self.typed_dict_indexes[key] = index
+        data: Dict[str, Any] = {"name": value.name, "docstring": value.docstring}
+        self.typed_dicts.append(data)
+        data["children"] = [
+            {
+                "name": child.name,
+                "type_annotation": self.encode(child.type_annotation),
+                "required": child.required,
+            }
+            for child in value.children
+        ]
+        return index
+
+
+class IRDecoder:
+    """
+    Decoder of data produced by `IREncoder`.
+
+    Arguments:
+        typed_dicts -- Encoded `TypeTypedDict` table.
+    """
+
+    structure_classes = {i.__name__: i for i in STRUCTURE_CLASSES}
+    type_annotations = {
+        name: wrapped_type for wrapped_type, name in TypeAnnotation.type_name_map
+    }
+
+    def __init__(self, typed_dicts: List[Dict[str, Any]]) -> None:
+        self.typed_dicts = [
+            TypeTypedDict(i["name"], docstring=i["docstring"]) for i in typed_dicts
+        ]
+        for typed_dict, data in zip(self.typed_dicts, typed_dicts):
+            for child in data["children"]:
+                typed_dict.add_attribute(
+                    child["name"],
+                    self.decode(child["type_annotation"]),
+                    child["required"],
+                )
+
+    def decode(self, value: Any) -> Any:
+        """
+        Decode `value` recursively.
+
+        Raises:
+            ValueError -- If value cannot be decoded.
+        """
+        if isinstance(value, list):
+            return [self.decode(i) for i in value]
+        if not isinstance(value, dict):
+            return value
+
+        type_name = value[TYPE_KEY]
+        if type_name in self.structure_classes:
+            kwargs = {k: self.decode(v) for k, v in value.items() if k != TYPE_KEY}
+            return self.structure_classes[type_name](**kwargs)
+        if type_name == "ServiceName":
+            service_name = ServiceName(value["name"], value["class_name"])
+            service_name.boto3_version = value["boto3_version"]
+            return service_name
+        if type_name == "TypeTypedDict":
+            return self.typed_dicts[value["index"]]
+        if type_name == "TypeSubscript":
+            return TypeSubscript(
+                self.decode(value["parent"]), self.decode(value["children"])
+            )
+        if type_name == "TypeAnnotation":
+            return TypeAnnotation(self.type_annotations[value["name"]])
+        if type_name == "TypeConstant":
+            if value.get("ellipsis"):
+                return TypeConstant(...)
+            return TypeConstant(value["value"])
+        if type_name == "TypeLiteral":
+            return TypeLiteral(*value["children"])
+        if type_name == "InternalImport":
+            return InternalImport(
+                value["name"],
+                self.decode(value["service_name"]),
+                ServiceModuleName[value["module_name"]],
+            )
+        if type_name == "ExternalImport":
+            return ExternalImport(
+                ImportString(*value["source"]), value["name"], value["alias"]
+            )
+
+        raise ValueError(f"Cannot decode {type_name}")
+
+
+def dump_package(package: Package) -> str:
+    """
+    Dump parsed package to a stable JSON IR.
+
+    Arguments:
+        package -- Parsed package.
+
+    Returns:
+        JSON string.
+    """
+    encoder = IREncoder()
+    data = encoder.encode(package)
+    return json.dumps(
+        {
+            "format": IR_FORMAT,
+            "version": version,
+            "package": data,
+            "typed_dicts": encoder.typed_dicts,
+        },
+        indent=1,
+        sort_keys=True,
+    )
+
+
+def load_package(text: str) -> Package:
+    """
+    Load parsed package from JSON IR.
+
+    Arguments:
+        text -- JSON string produced by `dump_package`.
+
+    Returns:
+        Parsed package.
+
+    Raises:
+        ValueError -- If IR format is not supported.
+    """
+    data = json.loads(text)
+    if data.get("format") != IR_FORMAT:
+        raise ValueError(f"Unsupported IR format {data.get('format')}")
+
+    decoder = IRDecoder(data["typed_dicts"])
+    return decoder.decode(data["package"])
+
+
+def get_ir_path(ir_path: Path, package: Package) -> Path:
+    """
+    Get IR file path for a package.
+
+    Arguments:
+        ir_path -- IR directory.
+        package -- Parsed package.
+
+    Returns:
+        IR file path.
+    """
+    return ir_path / f"{package.name}.json"
+
+
+def write_ir(ir_path: Path, package: Package) -> Path:
+    """
+    Write parsed package IR to `ir_path` directory.
+
+    Arguments:
+        ir_path -- IR directory.
+        package -- Parsed package.
+
+    Returns:
+        IR file path.
+    """
+    ir_path.mkdir(parents=True, exist_ok=True)
+    path = get_ir_path(ir_path, package)
+    path.write_text(dump_package(package))
+    return path
+
+
+def read_ir(path: Path) -> Package:
+    """
+    Read parsed package IR from a file.
+
+    Arguments:
+        path -- IR file path.
+
+    Returns:
+        Parsed package.
+    """
+    return load_package(path.read_text())
@@ -1,12 +1,17 @@
 """
 Jinja2 `Environment` manager.
 """
+from pathlib import Path
 from typing import Any
 
 import jinja2
 
 from mypy_boto3_builder.constants import TEMPLATES_PATH
 from mypy_boto3_builder.version import __version__ as version
+from mypy_boto3_builder.writers.code_emitter import (
+    iter_type_defs,
+    render_import_record_groups,
+)
 
 
 __all__ = ["JinjaManager"]
@@ -15,11 +20,19 @@ __all__ = ["JinjaManager"]
 class JinjaManager:
     """
     Jinja2 `Environment` manager.
+
+    Templates are compiled once and are not checked for changes on disk
+    during a run.
     """
 
     _environment = jinja2.Environment(
         loader=jinja2.FileSystemLoader(TEMPLATES_PATH.as_posix()),
         undefined=jinja2.StrictUndefined,
+        auto_reload=False,
+    )
+    _environment.globals.update(
+        iter_type_defs=iter_type_defs,
+        render_import_record_groups=render_import_record_groups,
     )
 
     @classmethod
@@ -32,6 +45,30 @@ class JinjaManager:
         """
         cls._environment.globals.update(kwargs)
 
+    @classmethod
+    def set_bytecode_cache(cls, path: Path) -> None:
+        """
+        Cache compiled templates in `path` directory.
+
+        Cached template is used while its source checksum is the same,
+        so templates are not compiled from source on every run.
+
+        Arguments:
+            path -- Cache directory.
+        """
+        path.mkdir(parents=True, exist_ok=True)
+        cls._environment.bytecode_cache = jinja2.FileSystemBytecodeCache(
+            path.as_posix()
+        )
+
+    @classmethod
+    def load_templates(cls) -> None:
+        """
+        Compile all templates in advance.
+        """
+        for name in cls._environment.list_templates(extensions=["jinja2"]):
+            cls._environment.get_template(name)
+
     @classmethod
     def get_environment(cls) -> jinja2.Environment:
         """
@@ -1,7 +1,11 @@
 """
 Main entrypoint for builder.
 """
-from typing import List
+import tempfile
+from argparse import Namespace
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from boto3 import __version__ as boto3_version
 from boto3.session import Session
@@ -9,32 +13,136 @@ from boto3.session import Session
 from mypy_boto3_builder.writers.processors import (
     process_boto3_stubs,
     process_master,
-    process_service,
+    process_services,
+    process_ir_package,
+    process_shared,
+    collect_services_signatures,
+)
+from mypy_boto3_builder.build_manifest import (
+    BuildManifest,
+    get_build_hash,
+    get_model_hash,
+    get_templates_hash,
 )
 from mypy_boto3_builder.version import __version__ as version
 from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.cli_parser import get_cli_parser
 from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
 from mypy_boto3_builder.jinja_manager import JinjaManager
+from mypy_boto3_builder.workers import (
+    WorkerOptions,
+    process_services_parallel,
+    collect_services_signatures_parallel,
+)
+from mypy_boto3_builder.method_cache import MethodCache
+from mypy_boto3_builder.model_cache import ModelFileLoader
+from mypy_boto3_builder.format_cache import FormatCache
+from mypy_boto3_builder.package_cache import PackageCache
+from mypy_boto3_builder.build_stats import BuildStats
+from mypy_boto3_builder.ir import read_ir
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.structures.shared_package import SharedPackage
+from mypy_boto3_builder.shared_type_defs import (
+    SharedSignatures,
+    select_shared_signatures,
+)
+from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.writers.utils import Formatter
+from mypy_boto3_builder.parsers.docstring_parser.syntax_parser import SyntaxParser
 from mypy_boto3_builder.constants import (
     MODULE_NAME,
     DUMMY_REGION,
     BOTO3_STUBS_NAME,
     PYPI_NAME,
+    BUILD_MANIFEST_NAME,
+    METHOD_CACHE_NAME,
+    CATALOGUE_NAME,
+    MODEL_CACHE_NAME,
+    FORMAT_CACHE_NAME,
+    TEMPLATES_CACHE_NAME,
+    LINE_LENGTH,
+    SHARED_MODULE_NAME,
+    SHARED_PYPI_NAME,
+    SHARED_PACKAGE_DIR_NAME,
 )
 
 
-def main() -> None:
+def get_jinja_globals(build_version: str) -> Dict[str, str]:
     """
-    Main entrypoint for builder.
+    Get global variables for all templates.
+
+    Arguments:
+        build_version -- Version of generated packages.
+
+    Returns:
+        A dictionary of template globals.
     """
-    parser = get_cli_parser()
-    args = parser.parse_args()
-    logger = get_logger(verbose=args.debug, panic=args.panic)
-    session = Session(region_name=DUMMY_REGION)
-    args.output_path.mkdir(exist_ok=True)
+    return {
+        "master_pypi_name": PYPI_NAME,
+        "master_module_name": MODULE_NAME,
+        "boto3_stubs_name": BOTO3_STUBS_NAME,
+        "boto3_version": boto3_version,
+        "build_version": build_version,
+        "shared_module_name": SHARED_MODULE_NAME,
+        "shared_pypi_name": SHARED_PYPI_NAME,
+    }
+
+
+def get_cache_size(args: Namespace) -> int:
+    """
+    Get max size of each on-disk cache.
+
+    `--cache-size` limits package and format caches together,
+    so it is split between them equally.
+
+    Arguments:
+        args -- CLI arguments.
+
+    Returns:
+        Max cache size in bytes.
+    """
+    return args.cache_size * 1024 * 1024 // 2
+
+
+def build_from_ir(args: Namespace) -> None:
+    """
+    Write packages from IR files without parsing.
+
+    Arguments:
+        args -- Parsed CLI arguments.
+    """
+    logger = get_logger()
+    for ir_file_path in sorted(args.from_ir.glob("*.json")):
+        package = read_ir(ir_file_path)
+        if isinstance(package, ServicePackage):
+            if args.skip_services or package.service_name not in args.service_names:
+                continue
+        elif isinstance(package, SharedPackage):
+            if args.skip_services:
+                continue
+        elif args.skip_master:
+            continue
+
+        logger.info(f"Generating {package.name} module from IR")
+        process_ir_package(package, args.output_path)
+
+
+def get_service_names(
+    session: Session, args: Namespace
+) -> Tuple[List[ServiceName], List[ServiceName]]:
+    """
+    Get service names to build and all service names for master package.
+
+    Arguments:
+        session -- boto3 session.
+        args -- Parsed CLI arguments.
+
+    Returns:
+        A tuple of selected available service names and all supported service names.
+    """
+    logger = get_logger()
     service_names: List[ServiceName] = []
-    master_service_names = []
+    master_service_names: List[ServiceName] = []
     available_services = session.get_available_services()
 
     for available_service in available_services:
@@ -52,37 +160,270 @@ def main() -> None:
         service_name.boto3_version = boto3_version
         service_names.append(service_name)
 
+    return service_names, master_service_names
+
+
+def get_changed_services(
+    session: Session,
+    args: Namespace,
+    service_names: Iterable[ServiceName],
+    manifest: BuildManifest,
+    parser_keys: Sequence[str],
+) -> Dict[ServiceName, str]:
+    """
+    Get build hashes of services that have to be rebuilt.
+
+    Arguments:
+        session -- boto3 session.
+        args -- Parsed CLI arguments.
+        service_names -- Selected service names.
+        manifest -- Build manifest of the previous build.
+        parser_keys -- Parser options that affect parsed packages.
+
+    Returns:
+        A dictionary of changed service names and their build hashes.
+    """
+    logger = get_logger()
+    templates_hash = get_templates_hash()
     build_version = args.build_version or boto3_version
-    JinjaManager.update_globals(
-        master_pypi_name=PYPI_NAME,
-        master_module_name=MODULE_NAME,
-        boto3_stubs_name=BOTO3_STUBS_NAME,
-        boto3_version=boto3_version,
-        build_version=build_version,
+    writer_keys = ("shared_type_defs=True",) if args.shared_type_defs else ()
+    build_hashes: Dict[ServiceName, str] = {}
+    for service_name in service_names:
+        package_path = args.output_path / f"{service_name.module_name}_package"
+        build_hash = get_build_hash(
+            get_model_hash(session, service_name),
+            templates_hash,
+            boto3_version,
+            build_version,
+            *parser_keys,
+            *writer_keys,
+        )
+        if (
+            not args.force
+            and not args.export_ir
+            and not args.shared_type_defs
+            and package_path.exists()
+            and not manifest.is_changed(service_name, build_hash)
+        ):
+            logger.info(f"Service {service_name.name} is not changed, skipping.")
+            continue
+
+        build_hashes[service_name] = build_hash
+
+    return build_hashes
+
+
+def collect_shared_signatures(
+    session: Session,
+    args: Namespace,
+    service_names: Sequence[ServiceName],
+    options: WorkerOptions,
+) -> SharedSignatures:
+    """
+    Collect TypedDict signatures shared by services.
+
+    Arguments:
+        session -- boto3 session.
+        args -- Parsed CLI arguments.
+        service_names -- Service names to parse.
+        options -- Worker options, `package_cache` keeps parsed packages.
+
+    Returns:
+        Shared TypedDict signatures.
+    """
+    if args.workers > 1:
+        service_signatures = collect_services_signatures_parallel(
+            service_names=service_names,
+            workers=args.workers,
+            options=options,
+            session=session,
+            start_method=args.start_method,
+        )
+    else:
+        service_signatures = collect_services_signatures(
+            session=session,
+            service_names=service_names,
+            package_cache=options.package_cache,
+            docstrings=options.docstrings,
+        )
+    shared_signatures = select_shared_signatures(service_signatures)
+    get_logger().info(f"Found {len(shared_signatures)} TypedDicts shared by services")
+    return shared_signatures
+
+
+def build_services(
+    session: Session,
+    args: Namespace,
+    service_names: Sequence[ServiceName],
+    options: WorkerOptions,
+    package_cache_path: Optional[Path],
+) -> None:
+    """
+    Write changed service packages and shared TypedDicts package.
+
+    Arguments:
+        session -- boto3 session.
+        args -- Parsed CLI arguments.
+        service_names -- Selected service names.
+        options -- Worker options.
+        package_cache_path -- Directory to cache parsed service packages.
+    """
+    manifest = BuildManifest.load(args.output_path / BUILD_MANIFEST_NAME)
+    parser_keys = (
+        f"docstrings={args.docstrings}",
+        f"verify_syntax={args.verify_syntax}",
+    )
+    build_hashes = get_changed_services(
+        session, args, service_names, manifest, parser_keys
+    )
+    changed_service_names = list(build_hashes)
+    if package_cache_path:
+        options = replace(
+            options,
+            package_cache=PackageCache(
+                package_cache_path, get_cache_size(args), parser_keys
+            ),
+        )
+
+    shared_package: Optional[SharedPackage] = None
+    if args.shared_type_defs:
+        options = replace(
+            options,
+            shared_signatures=collect_shared_signatures(
+                session, args, changed_service_names, options
+            ),
+        )
+        shared_package = SharedPackage()
+
+    if args.workers > 1:
+        generated_service_names = process_services_parallel(
+            service_names=changed_service_names,
+            output_path=args.output_path,
+            workers=args.workers,
+            options=options,
+            shared_package=shared_package,
+            session=session,
+            start_method=args.start_method,
+        )
+    else:
+        generated_service_names = process_services(
+            session=session,
+            service_names=changed_service_names,
+            output_path=args.output_path,
+            package_cache=options.package_cache,
+            ir_path=options.ir_path,
+            docstrings=options.docstrings,
+            shared_signatures=options.shared_signatures,
+            shared_package=shared_package,
+        )
+    # keep progress of a failed build
+    try:
+        for service_name in generated_service_names:
+            manifest.update(service_name, build_hashes[service_name])
+    finally:
+        manifest.save()
+    if shared_package:
+        get_logger().info(f"Generating {SHARED_MODULE_NAME} module")
+        process_shared(
+            shared_package, args.output_path / SHARED_PACKAGE_DIR_NAME, args.export_ir
+        )
+
+
+def build_packages(args: Namespace, jinja_globals: Dict[str, str]) -> None:
+    """
+    Parse and write service, master and `boto3-stubs` packages.
+
+    Arguments:
+        args -- Parsed CLI arguments.
+        jinja_globals -- Global variables for all templates.
+    """
+    logger = get_logger()
+    session = Session(region_name=DUMMY_REGION)
+    options = WorkerOptions(
+        jinja_globals=jinja_globals,
+        ir_path=args.export_ir,
+        docstrings=args.docstrings,
+        format_cache=Formatter.cache,
+        verify_format=args.verify_format,
+        verify_syntax=args.verify_syntax,
     )
+    if args.cache_dir:
+        model_cache_path = args.cache_dir / MODEL_CACHE_NAME
+        ModelFileLoader.install(session, model_cache_path)
+        options = replace(
+            options,
+            model_cache_path=model_cache_path,
+            templates_cache_path=args.cache_dir / TEMPLATES_CACHE_NAME,
+        )
+    service_names, master_service_names = get_service_names(session, args)
 
-    logger.info(f"Bulding version {build_version}")
+    logger.info(f"Bulding version {jinja_globals['build_version']}")
 
     if not args.skip_services:
-        for index, service_name in enumerate(service_names):
-            logger.info(
-                f"[{index + 1}/{len(service_names)}] Generating {service_name.module_name} module"
-            )
-            output_path = args.output_path / f"{service_name.module_name}_package"
-            process_service(
-                session=session, output_path=output_path, service_name=service_name
-            )
+        # cached docstring parse results are not verified
+        if args.cache_dir and not args.verify_syntax:
+            MethodCache.load(args.cache_dir / METHOD_CACHE_NAME)
+        if args.cache_dir or not args.shared_type_defs:
+            build_services(session, args, service_names, options, args.cache_dir)
+        else:
+            # keep parsed packages between two phases
+            with tempfile.TemporaryDirectory() as temp_cache_dir:
+                build_services(
+                    session, args, service_names, options, Path(temp_cache_dir)
+                )
+        if args.cache_dir:
+            MethodCache.save(args.cache_dir / METHOD_CACHE_NAME)
 
     if not args.skip_master:
         logger.info(f"Generating {MODULE_NAME} module")
         output_path = args.output_path / "master_package"
-        process_master(session, output_path, master_service_names)
+        catalogue_path = args.cache_dir / CATALOGUE_NAME if args.cache_dir else None
+        process_master(
+            session, output_path, master_service_names, args.export_ir, catalogue_path
+        )
 
         logger.info(f"Generating {BOTO3_STUBS_NAME} module")
         output_path = args.output_path / "boto3_stubs_package"
-        process_boto3_stubs(output_path, master_service_names)
+        process_boto3_stubs(output_path, master_service_names, args.export_ir)
+
+
+def main() -> None:
+    """
+    Main entrypoint for builder.
+    """
+    parser = get_cli_parser()
+    args = parser.parse_args()
+    logger = get_logger(verbose=args.debug, panic=args.panic)
+    args.output_path.mkdir(exist_ok=True)
+    build_version = args.build_version or boto3_version
+    jinja_globals = get_jinja_globals(build_version)
+    JinjaManager.update_globals(**jinja_globals)
+    Formatter.verify = args.verify_format
+    SyntaxParser.verify = args.verify_syntax
+    if args.cache_dir:
+        Formatter.cache = FormatCache(
+            args.cache_dir / FORMAT_CACHE_NAME,
+            get_cache_size(args),
+            (f"line_length={LINE_LENGTH}",),
+        )
+        JinjaManager.set_bytecode_cache(args.cache_dir / TEMPLATES_CACHE_NAME)
+
+    with Formatter.start_pool(args.format_workers):
+        if args.from_ir:
+            logger.info(
+                f"Bulding version {build_version} from {NicePath(args.from_ir)}"
+            )
+            build_from_ir(args)
+        else:
+            build_packages(args, jinja_globals)
+
+    if Formatter.cache:
+        Formatter.cache.evict()
+
+    for line in BuildStats.get_report():
+        logger.info(line)
 
-    logger.info(f"Completed")
+    logger.info("Completed")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,199 @@
+"""
+Cache of docstring parse results shared across services.
+"""
+import copy
+import hashlib
+import inspect
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from types import FunctionType
+from typing import Dict, List, Optional, Set, Tuple
+
+from mypy_boto3_builder.build_manifest import get_sources_hash
+from mypy_boto3_builder.build_stats import BuildStats
+from mypy_boto3_builder.constants import METHOD_CACHE_SIZE
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.structures.method import Method
+from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+from mypy_boto3_builder.version import __version__ as version
+
+
+__all__ = ("MethodCache", "MethodCacheEntries")
+
+
+# Parsed method with prefix of its TypedDict names by cache key
+MethodCacheEntries = Dict[str, Tuple[str, Method]]
+
+
+class MethodCache:
+    """
+    LRU cache of methods parsed from docstrings.
+
+    Many methods have identical docstrings across services and resources,
+    e.g. `can_paginate` or resource `load`, so they are parsed once per build.
+    Worker processes send new entries to the main process with `pop_new`
+    and `merge`, so the cache can be saved between builds.
+    """
+
+    max_size = METHOD_CACHE_SIZE
+    entries: "OrderedDict[str, Tuple[str, Method]]" = OrderedDict()
+    new_entries: MethodCacheEntries = {}
+
+    @staticmethod
+    def get_key(name: str, method: FunctionType, docstring: str) -> str:
+        """
+        Get cache key for a method.
+
+        Arguments:
+            name -- Method name.
+            method -- Inspect method.
+            docstring -- Method docstring.
+
+        Returns:
+            Hex digest.
+        """
+        result = hashlib.sha256()
+        for key in (name, repr(inspect.getfullargspec(method)), docstring):
+            result.update(key.encode())
+            result.update(b"\0")
+        return result.hexdigest()
+
+    @classmethod
+    def get(cls, key: str, prefix: str) -> Optional[Method]:
+        """
+        Get a copy of cached method and mark it as recently used.
+
+        Arguments:
+            key -- Cache key.
+            prefix -- TypedDict names prefix for the copy.
+
+        Returns:
+            Parsed Method or None on cache miss.
+        """
+        if key not in cls.entries:
+            BuildStats.increment("method_cache_misses")
+            return None
+
+        BuildStats.increment("method_cache_hits")
+        cls.entries.move_to_end(key)
+        cached_prefix, method = cls.entries[key]
+        return cls._copy(method, cached_prefix, prefix)
+
+    @classmethod
+    def add(cls, key: str, prefix: str, method: Method) -> None:
+        """
+        Add a copy of parsed method and remove least recently used entries.
+
+        Arguments:
+            key -- Cache key.
+            prefix -- TypedDict names prefix of the method.
+            method -- Parsed Method.
+        """
+        entry = (prefix, copy.deepcopy(method))
+        cls.entries[key] = entry
+        cls.new_entries[key] = entry
+        cls._evict()
+
+    @classmethod
+    def pop_new(cls) -> MethodCacheEntries:
+        """
+        Get entries added since the last call and reset them.
+
+        Returns:
+            A dictionary of new entries.
+        """
+        result = cls.new_entries
+        cls.new_entries = {}
+        return result
+
+    @classmethod
+    def merge(cls, entries: MethodCacheEntries) -> None:
+        """
+        Add entries collected in another process.
+
+        Arguments:
+            entries -- Result of `pop_new`.
+        """
+        cls.entries.update(entries)
+        cls._evict()
+
+    @classmethod
+    def _evict(cls) -> None:
+        while len(cls.entries) > cls.max_size:
+            cls.entries.popitem(last=False)
+
+    @staticmethod
+    def _get_version() -> str:
+        return f"{version}-{get_sources_hash()}"
+
+    @classmethod
+    def load(cls, path: Path) -> None:
+        """
+        Load cache saved by `save`.
+
+        Missing, invalid or outdated cache file is ignored.
+
+        Arguments:
+            path -- Cache file path.
+        """
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return
+
+        try:
+            cache_version, entries = pickle.loads(data)
+        except Exception as e:  # pylint: disable=broad-except
+            get_logger().debug(f"Cannot load method cache {path}: {e}")
+            return
+
+        if cache_version != cls._get_version():
+            return
+
+        cls.merge(entries)
+
+    @classmethod
+    def save(cls, path: Path) -> None:
+        """
+        Save cache entries.
+
+        Arguments:
+            path -- Cache file path.
+        """
+        data = pickle.dumps(
+            (cls._get_version(), dict(cls.entries)), pickle.HIGHEST_PROTOCOL
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path.as_posix(), path.as_posix())
+
+    @classmethod
+    def _copy(cls, method: Method, old_prefix: str, new_prefix: str) -> Method:
+        result = copy.deepcopy(method)
+        if old_prefix == new_prefix:
+            return result
+
+        stack: List[FakeAnnotation] = [result.return_type]
+        stack.extend(i.type for i in result.arguments if i.type is not None)
+        visited: Set[int] = set()
+        while stack:
+            type_annotation = stack.pop()
+            if id(type_annotation) in visited:
+                continue
+            visited.add(id(type_annotation))
+            if isinstance(type_annotation, TypeSubscript):
+                stack.extend(type_annotation.children)
+            if isinstance(type_annotation, TypeTypedDict):
+                if type_annotation.name.startswith(old_prefix):
+                    type_annotation.name = (
+                        f"{new_prefix}{type_annotation.name[len(old_prefix):]}"
+                    )
+                    type_annotation.reset_cache()
+                stack.extend(i.type_annotation for i in type_annotation.children)
+
+        return result
@@ -0,0 +1,157 @@
+"""
+On-disk cache of decoded botocore model files.
+"""
+import hashlib
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from boto3.session import Session
+from botocore.loaders import JSONFileLoader
+
+from mypy_boto3_builder.build_stats import BuildStats
+from mypy_boto3_builder.logger import get_logger
+
+
+__all__ = ("ModelFileLoader",)
+
+
+class ModelFileLoader:
+    """
+    Botocore file loader that caches decoded JSON model files.
+
+    Decoded data is saved with `marshal`, so the next builder run skips JSON
+    decoding. Botocore decodes objects to `OrderedDict`, cached objects are
+    plain dicts with the same key order. Cache entry is used while source file
+    path, modification time, size and Python version are the same.
+
+    Arguments:
+        path -- Cache directory.
+        file_loader -- Wrapped botocore file loader.
+    """
+
+    SUFFIX = ".model"
+
+    # Source file extensions in the same order as botocore checks them
+    EXTENSIONS = (".json", ".json.gz")
+
+    def __init__(self, path: Path, file_loader: Any = None) -> None:
+        self.path = path
+        self.file_loader = file_loader or JSONFileLoader()
+
+    @classmethod
+    def install(cls, session: Session, path: Path) -> None:
+        """
+        Wrap file loader of `session` data loader.
+
+        Arguments:
+            session -- boto3 session.
+            path -- Cache directory.
+        """
+        loader = session._loader  # pylint: disable=protected-access
+        if isinstance(loader.file_loader, cls):
+            return
+        loader.file_loader = cls(path, loader.file_loader)
+
+    def exists(self, file_path: str) -> bool:
+        """
+        Check if model file exists.
+
+        Arguments:
+            file_path -- File path without `.json` extension.
+
+        Returns:
+            True if file exists.
+        """
+        return bool(self.file_loader.exists(file_path))
+
+    def get_path(self, source_path: Path) -> Path:
+        """
+        Get cache file path for a source file.
+
+        Arguments:
+            source_path -- Model file path.
+
+        Returns:
+            Cache file path.
+        """
+        digest = hashlib.sha256(source_path.as_posix().encode()).hexdigest()
+        return self.path / f"{digest}{self.SUFFIX}"
+
+    def _get_source(self, file_path: str) -> Optional[Tuple[Path, Tuple[Any, ...]]]:
+        for extension in self.EXTENSIONS:
+            source_path = Path(f"{file_path}{extension}")
+            try:
+                stat = source_path.stat()
+            except OSError:
+                continue
+            return (
+                source_path,
+                (
+                    source_path.as_posix(),
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    sys.implementation.cache_tag,
+                ),
+            )
+        return None
+
+    def _load(self, path: Path, key: Tuple[Any, ...]) -> Any:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        try:
+            cached_key, result = marshal.loads(data)
+        except Exception as e:  # pylint: disable=broad-except
+            get_logger().warning(f"Cannot load cached model {path}: {e}")
+            return None
+
+        if cached_key != key:
+            return None
+
+        return result
+
+    @classmethod
+    def _to_builtin(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {key: cls._to_builtin(value) for key, value in data.items()}
+        if isinstance(data, list):
+            return [cls._to_builtin(i) for i in data]
+        return data
+
+    def _save(self, path: Path, key: Tuple[Any, ...], data: Any) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(marshal.dumps((key, self._to_builtin(data))))
+        os.replace(temp_path.as_posix(), path.as_posix())
+
+    def load_file(self, file_path: str) -> Any:
+        """
+        Load decoded model file from cache or from source file.
+
+        Arguments:
+            file_path -- File path without `.json` extension.
+
+        Returns:
+            Decoded data or None if file does not exist.
+        """
+        source = self._get_source(file_path)
+        if source is None:
+            return self.file_loader.load_file(file_path)
+
+        source_path, key = source
+        path = self.get_path(source_path)
+        result = self._load(path, key)
+        if result is not None:
+            BuildStats.increment("model_cache_hits")
+            return result
+
+        BuildStats.increment("model_cache_misses")
+        result = self.file_loader.load_file(file_path)
+        if result is not None:
+            self._save(path, key, result)
+        return result
@@ -0,0 +1,155 @@
+"""
+On-disk cache of parsed service packages.
+"""
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from boto3 import __version__ as boto3_version
+from boto3.session import Session
+
+from mypy_boto3_builder.build_manifest import get_model_hash, get_sources_hash
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.version import __version__ as version
+
+
+__all__ = ("PackageCache",)
+
+
+class PackageCache:
+    """
+    On-disk cache of parsed `ServicePackage` structures.
+
+    Cache key is a hash of botocore model files, builder version and sources,
+    so templates changes reuse parsed packages. Least recently used entries are
+    removed when cache size exceeds `max_size`.
+
+    Arguments:
+        path -- Cache directory.
+        max_size -- Max cache size in bytes.
+        build_keys -- Additional keys, e.g. parser options.
+    """
+
+    SUFFIX = ".pickle"
+
+    def __init__(
+        self, path: Path, max_size: int, build_keys: Iterable[str] = ()
+    ) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.build_keys = tuple(build_keys)
+
+    def get_key(self, session: Session, service_name: ServiceName) -> str:
+        """
+        Get cache key for a service package.
+
+        Arguments:
+            session -- boto3 session.
+            service_name -- Target service name.
+
+        Returns:
+            Hex digest.
+        """
+        result = hashlib.sha256()
+        for key in (
+            version,
+            boto3_version,
+            get_sources_hash(),
+            get_model_hash(session, service_name),
+            *self.build_keys,
+        ):
+            result.update(key.encode())
+            result.update(b"\0")
+        return result.hexdigest()
+
+    def get_path(self, service_name: ServiceName, key: str) -> Path:
+        """
+        Get cache file path for a service package.
+
+        Arguments:
+            service_name -- Target service name.
+            key -- Cache key.
+
+        Returns:
+            Cache file path.
+        """
+        return self.path / f"{service_name.name}-{key}{self.SUFFIX}"
+
+    def load(self, service_name: ServiceName, key: str) -> Optional[ServicePackage]:
+        """
+        Load cached service package and mark it as recently used.
+
+        Arguments:
+            service_name -- Target service name.
+            key -- Cache key.
+
+        Returns:
+            Cached ServicePackage or None on cache miss.
+        """
+        path = self.get_path(service_name, key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        try:
+            result = pickle.loads(data)
+        except Exception as e:  # pylint: disable=broad-except
+            get_logger().debug(f"Cannot load cached {service_name.name}: {e}")
+            return None
+
+        if not isinstance(result, ServicePackage):
+            return None
+
+        try:
+            os.utime(path.as_posix())
+        except OSError:
+            pass
+
+        return result
+
+    def save(
+        self, service_name: ServiceName, key: str, package: ServicePackage
+    ) -> None:
+        """
+        Save service package to cache and remove least recently used entries.
+
+        Arguments:
+            service_name -- Target service name.
+            key -- Cache key.
+            package -- Parsed ServicePackage.
+        """
+        data = pickle.dumps(package, pickle.HIGHEST_PROTOCOL)
+        path = self.get_path(service_name, key)
+        self.path.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path.as_posix(), path.as_posix())
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until cache fits `max_size`.
+        """
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self.path.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            get_logger().debug(f"Removed cached {path.name}")
+            total_size -= size
@@ -1,44 +1,136 @@
 """
 Getters for boto3 client and resource from session.
 """
-from typing import Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple, Type
+from weakref import WeakKeyDictionary
 
-from boto3.exceptions import ResourceNotExistsError
 from boto3.session import Session
 from boto3.resources.base import ServiceResource as Boto3ServiceResource
-from botocore.client import BaseClient
+from boto3.utils import LazyLoadedWaiterModel, ServiceContext
+from botocore.client import BaseClient, ClientCreator
+from botocore.model import ServiceModel
 
 from mypy_boto3_builder.service_name import ServiceName
 
 
-def get_boto3_client(session: Session, service_name: ServiceName) -> BaseClient:
+# Names of services that have a model by model type name, per session
+_available_services: "WeakKeyDictionary[Session, Dict[str, FrozenSet[str]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_available_service_names(session: Session, type_name: str) -> FrozenSet[str]:
+    """
+    Get names of services that have a botocore model of `type_name`.
+
+    Services are listed once per session and model type.
+
+    Arguments:
+        session -- boto3 session.
+        type_name -- Model type name, e.g. `waiters-2`.
+
+    Returns:
+        A set of boto3 service names.
     """
-    Get boto3 client from `session`.
+    index = _available_services.setdefault(session, {})
+    if type_name not in index:
+        loader = session._loader  # pylint: disable=protected-access
+        index[type_name] = frozenset(loader.list_available_services(type_name))
+    return index[type_name]
+
+
+def has_service_model(
+    session: Session, service_name: ServiceName, type_name: str
+) -> bool:
+    """
+    Check if botocore has a model of `type_name` for a service.
+
+    Missing models are not probed with `UnknownServiceError`.
 
     Arguments:
         session -- boto3 session.
         service_name -- ServiceName instance.
+        type_name -- Model type name, e.g. `waiters-2`.
 
     Returns:
-        Boto3 client.
+        True if model exists.
     """
-    return session.client(service_name.boto3_name)  # type: ignore
+    return service_name.boto3_name in get_available_service_names(session, type_name)
 
 
-def get_boto3_resource(
+def get_boto3_client_class(
     session: Session, service_name: ServiceName
-) -> Optional[Boto3ServiceResource]:
+) -> Type[BaseClient]:
     """
-    Get boto3 resource from `session`.
+    Get boto3 client class from `session` without creating a client.
+
+    Class is built from service model with the same methods a client has,
+    including ones injected by `boto3` on `creating-client-class` event.
+    Endpoint, credentials and retry configuration are not resolved.
 
     Arguments:
         session -- boto3 session.
         service_name -- ServiceName instance.
 
     Returns:
-        Boto3 resource or None.
+        Boto3 client class.
     """
-    try:
-        return session.resource(service_name.boto3_name)  # type: ignore
-    except ResourceNotExistsError:
+    botocore_session = session._session  # pylint: disable=protected-access
+    client_creator = ClientCreator(
+        loader=botocore_session.get_component("data_loader"),
+        endpoint_resolver=None,
+        user_agent=None,
+        event_emitter=botocore_session.get_component("event_emitter"),
+        retry_handler_factory=None,
+        retry_config_translator=None,
+    )
+    return client_creator.create_client_class(service_name.boto3_name)
+
+
+def get_boto3_resource_classes(
+    session: Session, service_name: ServiceName, service_model: ServiceModel
+) -> Optional[Tuple[Type[Boto3ServiceResource], List[Type[Boto3ServiceResource]]]]:
+    """
+    Get boto3 ServiceResource and sub-resource classes without creating a client.
+
+    All classes share one `ServiceContext`, as in `Session.resource`.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- ServiceName instance.
+        service_model -- Botocore service model.
+
+    Returns:
+        A tuple of ServiceResource class and sub-resource classes,
+        or None if service does not have a resource.
+    """
+    if not has_service_model(session, service_name, "resources-1"):
         return None
+
+    loader = session._loader  # pylint: disable=protected-access
+    resource_model = loader.load_service_model(service_name.boto3_name, "resources-1")
+
+    service_context = ServiceContext(
+        service_name=service_name.boto3_name,
+        service_model=service_model,
+        resource_json_definitions=resource_model["resources"],
+        service_waiter_model=LazyLoadedWaiterModel(
+            session._session,  # pylint: disable=protected-access
+            service_name.boto3_name,
+            None,
+        ),
+    )
+    service_resource_class = session.resource_factory.load_from_definition(
+        resource_name=service_name.boto3_name,
+        single_resource_json_definition=resource_model["service"],
+        service_context=service_context,
+    )
+    sub_resource_classes = [
+        session.resource_factory.load_from_definition(
+            resource_name=name,
+            single_resource_json_definition=definition,
+            service_context=service_context,
+        )
+        for name, definition in resource_model["resources"].items()
+    ]
+    return service_resource_class, sub_resource_classes
@@ -2,9 +2,9 @@
 Boto3 client parser, produces `structures.Client`.
 """
 from boto3.session import Session
-from botocore.errorfactory import ClientExceptionsFactory
 from botocore.exceptions import ClientError
 
+from mypy_boto3_builder.build_stats import BuildStats
 from mypy_boto3_builder.structures.client import Client
 from mypy_boto3_builder.structures.attribute import Attribute
 from mypy_boto3_builder.service_name import ServiceName
@@ -13,27 +13,37 @@ from mypy_boto3_builder.type_annotations.type_class import TypeClass
 from mypy_boto3_builder.type_annotations.internal_import import InternalImport
 from mypy_boto3_builder.parsers.helpers import (
     parse_method,
-    get_public_methods,
+    get_public_functions,
 )
-from mypy_boto3_builder.parsers.boto3_utils import get_boto3_client
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_client_class
 from mypy_boto3_builder.parsers.shape_parser import ShapeParser
 
 
 def parse_client(
-    session: Session, service_name: ServiceName, shape_parser: ShapeParser
+    session: Session,
+    service_name: ServiceName,
+    shape_parser: ShapeParser,
+    docstrings: bool = False,
 ) -> Client:
     """
     Parse boto3 client to a structure.
 
+    Client is not created, methods are taken from client class
+    built from service model.
+    Operation methods are generated from botocore shapes,
+    other methods fall back to slow docstring parsing.
+
     Arguments:
         session -- boto3 session.
         service_name -- Target service name.
+        shape_parser -- Shape parser for the service.
+        docstrings -- Parse all methods from docstrings.
 
     Returns:
         Client structure.
     """
-    client = get_boto3_client(session, service_name)
-    public_methods = get_public_methods(client)
+    client_class = get_boto3_client_class(session, service_name)
+    public_methods = get_public_functions(client_class)
 
     # remove methods that will be overriden
     if "get_paginator" in public_methods:
@@ -44,33 +54,27 @@ def parse_client(
     result = Client(
         name=f"{service_name.class_name}Client",
         service_name=service_name,
-        boto3_client=client,
         docstring=(
             f"[{service_name.class_name}.Client documentation]"
             f"({service_name.doc_link}.Client)"
         ),
     )
 
-    shape_method_map = shape_parser.get_client_method_map()
+    shape_method_map = {} if docstrings else shape_parser.get_client_method_map()
     for method_name, public_method in public_methods.items():
         if method_name in shape_method_map:
             method = shape_method_map[method_name]
-        method = parse_method("Client", method_name, public_method, service_name)
+            BuildStats.increment("client_methods_from_shapes")
+        else:
+            method = parse_method("Client", method_name, public_method, service_name)
+            BuildStats.increment("client_methods_from_docstrings")
         method.docstring = (
             f"[Client.{method_name} documentation]"
             f"({service_name.doc_link}.Client.{method_name})"
         )
         result.methods.append(method)
 
-    service_model = client.meta.service_model
-    client_exceptions = ClientExceptionsFactory().create_client_exceptions(
-        service_model
-    )
-    for exception_class_name in dir(client_exceptions):
-        if exception_class_name.startswith("_"):
-            continue
-        if not exception_class_name[0].isupper():
-            continue
+    for exception_class_name in shape_parser.get_exception_names():
         result.exceptions_class.attributes.append(
             Attribute(
                 exception_class_name, TypeClass(ClientError, alias="Boto3ClientError")
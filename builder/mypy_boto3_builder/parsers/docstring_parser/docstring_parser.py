@@ -5,8 +5,6 @@ import re
 import textwrap
 from typing import Dict, List, Optional, Pattern
 
-from pyparsing import ParseException
-
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.argument import Argument
 from mypy_boto3_builder.type_maps.docstring_type_map import get_type_from_docstring
@@ -17,8 +15,14 @@ from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
 from mypy_boto3_builder.type_annotations.type import Type
 from mypy_boto3_builder.utils.strings import get_class_prefix
 from mypy_boto3_builder.logger import get_logger
-from mypy_boto3_builder.parsers.docstring_parser.syntax_grammar import SyntaxGrammar
-from mypy_boto3_builder.parsers.docstring_parser.type_doc_grammar import TypeDocGrammar
+from mypy_boto3_builder.parsers.docstring_parser.syntax_parser import (
+    SyntaxParser,
+    SyntaxParserError,
+)
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_parser import (
+    TypeDocParser,
+    TypeDocParserError,
+)
 from mypy_boto3_builder.parsers.docstring_parser.type_doc_line import TypeDocLine
 from mypy_boto3_builder.parsers.docstring_parser.type_value import TypeValue
 from mypy_boto3_builder.utils.strings import get_line_with_indented
@@ -78,16 +82,14 @@ class DocstringParser:
             input_string[request_syntax_index:], True
         )
 
-        SyntaxGrammar.reset()
-        SyntaxGrammar.enable_packrat()
         try:
-            match = SyntaxGrammar.request_syntax.parseString(request_syntax_string)
-        except ParseException as e:
+            match = SyntaxParser.parse_request_syntax(request_syntax_string)
+        except SyntaxParserError as e:
             self.logger.warning(f"Cannot parse request syntax for {self.prefix}")
             self.logger.debug(e)
             return
 
-        argument_groups = match.asDict().get("arguments", [])
+        argument_groups = match.get("arguments", [])
         for argument_dict in argument_groups:
             argument_name = argument_dict["name"]
             argument_prefix = self.prefix + get_class_prefix(argument_name)
@@ -101,18 +103,16 @@ class DocstringParser:
             return
 
         type_strings = [i for i in input_string.split("\n") if i.startswith(":type ")]
-        TypeDocGrammar.reset()
         for type_string in type_strings:
             try:
-                match = TypeDocGrammar.type_definition.parseString(type_string)
-            except ParseException as e:
+                match_dict = TypeDocParser.parse_type_definition(type_string)
+            except TypeDocParserError as e:
                 self.logger.warning(
                     f"Cannot parse type definition {type_string} for {self.prefix}"
                 )
                 self.logger.debug(e)
                 continue
 
-            match_dict = match.asDict()
             argument_name = match_dict["name"]
             type_str = match_dict["type_name"]
             argument = self._find_argument_or_append(argument_name)
@@ -132,17 +132,16 @@ class DocstringParser:
             start_index = re_match.start()
             param_string = get_line_with_indented(input_string[start_index + 1 :])
 
-            TypeDocGrammar.reset()
             try:
-                match = TypeDocGrammar.param_definition.parseString(param_string)
-            except ParseException as e:
+                match = TypeDocParser.parse_param_definition(param_string)
+            except TypeDocParserError as e:
                 self.logger.warning(
                     f"Cannot parse param definition {param_string} for {self.prefix}"
                 )
                 self.logger.debug(e)
                 continue
 
-            argument_line = TypeDocLine(**match.asDict())
+            argument_line = TypeDocLine(**match)
             if not argument_line.name:
                 continue
 
@@ -181,6 +180,7 @@ class DocstringParser:
             attribute.required = line.required
             if attribute.type_annotation is Type.Any:
                 attribute.type_annotation = get_type_from_docstring(line.type_name)
+                typed_dict.reset_cache()
             if not line.indented:
                 continue
 
@@ -218,15 +218,14 @@ class DocstringParser:
     def _parse_returns(self, input_string: str) -> Optional[FakeAnnotation]:
         if ":return: " not in input_string and ":returns: " not in input_string:
             return None
-        TypeDocGrammar.reset()
         returns_string = input_string[input_string.index(":return") :].split("\n", 1)[0]
         try:
-            match = TypeDocGrammar.returns_definition.parseString(returns_string)
-        except ParseException as e:
+            match = TypeDocParser.parse_returns_definition(returns_string)
+        except TypeDocParserError as e:
             self.logger.warning(f"Cannot parse returns for {self.prefix}: {e}")
             return None
 
-        description = match.asDict()["description"]
+        description = match["description"]
         if description == "None":
             return Type.none
 
@@ -239,15 +238,14 @@ class DocstringParser:
         if ":rtype: " not in input_string:
             return None
 
-        TypeDocGrammar.reset()
         rtype_string = input_string[input_string.index(":rtype: ") :].split("\n", 1)[0]
         try:
-            match = TypeDocGrammar.rtype_definition.parseString(rtype_string)
-        except ParseException as e:
+            match = TypeDocParser.parse_rtype_definition(rtype_string)
+        except TypeDocParserError as e:
             self.logger.warning(f"Cannot parse rtype for {self.prefix}: {e}")
             return None
 
-        type_name = match.asDict()["type_name"]
+        type_name = match["type_name"]
         return get_type_from_docstring(type_name)
 
     def _parse_response_syntax(self, input_string: str) -> Optional[FakeAnnotation]:
@@ -263,16 +261,14 @@ class DocstringParser:
             input_string[response_syntax_index:], True
         )
 
-        SyntaxGrammar.reset()
-        SyntaxGrammar.enable_packrat()
         try:
-            match = SyntaxGrammar.response_syntax.parseString(response_syntax_string)
-        except ParseException as e:
+            match = SyntaxParser.parse_response_syntax(response_syntax_string)
+        except SyntaxParserError as e:
             self.logger.warning(f"Cannot parse response syntax for {self.prefix}")
             self.logger.debug(e)
             return None
 
-        value = match.asDict()["value"]
+        value = match["value"]
         return TypeValue(f"{self.prefix}Response", value).get_type()
 
     def _parse_response_structure(self, input_string: str) -> Optional[TypeDocLine]:
@@ -291,17 +287,14 @@ class DocstringParser:
         )
         response_structure_string = textwrap.dedent(response_structure_string)
 
-        TypeDocGrammar.reset()
         try:
-            match = TypeDocGrammar.response_structure.parseString(
-                response_structure_string
-            )
-        except ParseException as e:
+            match = TypeDocParser.parse_response_structure(response_structure_string)
+        except TypeDocParserError as e:
             self.logger.warning(f"Cannot parse response structure for {self.prefix}")
             self.logger.debug(e)
             return None
 
-        return TypeDocLine(**match.asDict())
+        return TypeDocLine(**match)
 
     def get_return_type(self, input_string: str) -> FakeAnnotation:
         """
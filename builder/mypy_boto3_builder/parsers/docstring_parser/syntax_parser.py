@@ -0,0 +1,430 @@
+"""
+Linear parser for request and response syntax.
+"""
+import re
+from typing import Any, Callable, Dict, List, NoReturn, Optional, Pattern
+
+from pyparsing import ParseException, ParserElement
+
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.docstring_parser.syntax_grammar import SyntaxGrammar
+
+
+__all__ = ("SyntaxParser", "SyntaxParserError")
+
+
+class SyntaxParserError(Exception):
+    pass
+
+
+class SyntaxParser:
+    """
+    Hand-written parser for request and response syntax.
+
+    Accepts the same language as `SyntaxGrammar` and produces the same
+    structures as its `asDict` results. Every value kind is chosen by
+    the next character, and delimiters are consumed only if the next item
+    starts after them, so input is parsed in one pass without backtracking.
+
+    If `verify` is set, results are checked with `SyntaxGrammar`
+    and replaced with its results on mismatch.
+
+    Arguments:
+        text -- Input string.
+    """
+
+    verify = False
+
+    RE_WHITESPACE: Pattern[str] = re.compile(r"[ \t\n\r]*")
+    RE_NAME: Pattern[str] = re.compile(r"[A-Za-z0-9_.\-]+")
+    RE_STRING: Pattern[str] = re.compile(r"(?:[A-Za-z]{1,2})?'[^']*'")
+    RE_ARGUMENT_NAME: Pattern[str] = re.compile(r"[A-Za-z0-9]+")
+    # First character of a name, string, list, dict or set value
+    RE_VALUE_START: Pattern[str] = re.compile(r"[A-Za-z0-9_.\-'\[{]")
+    RE_ARGUMENT_START: Pattern[str] = re.compile(r"[A-Za-z0-9]+[ \t\n\r]*=")
+    RE_DICT_KEY_START: Pattern[str] = re.compile(
+        r"(?:[A-Za-z]{1,2})?'[^']*'[ \t\n\r]*:"
+    )
+    RE_EMPTY_LIST: Pattern[str] = re.compile(
+        r"\[(?P<ellipsis>[ \t\n\r]*\.\.\.)?(?P<comma>[ \t\n\r]*,)?[ \t\n\r]*\]"
+    )
+    RE_EMPTY_DICT: Pattern[str] = re.compile(
+        r"{(?P<ellipsis>[ \t\n\r]*\.\.\.)?(?P<comma>[ \t\n\r]*,)?[ \t\n\r]*}"
+    )
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.pos = 0
+
+    @classmethod
+    def parse_request_syntax(cls, text: str) -> Dict[str, Any]:
+        """
+        Parse `**Request Syntax**` block.
+
+        Arguments:
+            text -- Block text.
+
+        Returns:
+            A dictionary with `arguments` list, same as `SyntaxGrammar.request_syntax`.
+
+        Raises:
+            SyntaxParserError -- If text cannot be parsed.
+        """
+        return cls._parse_checked(
+            text, cls._parse_request_syntax, SyntaxGrammar.request_syntax
+        )
+
+    @classmethod
+    def parse_response_syntax(cls, text: str) -> Dict[str, Any]:
+        """
+        Parse `**Response Syntax**` block.
+
+        Arguments:
+            text -- Block text.
+
+        Returns:
+            A dictionary with list or dict `value`, same as `SyntaxGrammar.response_syntax`.
+
+        Raises:
+            SyntaxParserError -- If text cannot be parsed.
+        """
+        return cls._parse_checked(
+            text, cls._parse_response_syntax, SyntaxGrammar.response_syntax
+        )
+
+    @classmethod
+    def _parse_checked(
+        cls,
+        text: str,
+        parse: Callable[["SyntaxParser"], Dict[str, Any]],
+        element: ParserElement,
+    ) -> Dict[str, Any]:
+        """
+        Parse `text` and check the result with pyparsing `element` in verify mode.
+        """
+        result: Optional[Dict[str, Any]] = None
+        try:
+            result = parse(cls(text))
+        except SyntaxParserError:
+            if not cls.verify:
+                raise
+
+        if not cls.verify and result is not None:
+            return result
+
+        SyntaxGrammar.reset()
+        SyntaxGrammar.enable_packrat()
+        try:
+            expected = element.parseString(text).asDict()
+        except ParseException as e:
+            if result is None:
+                raise SyntaxParserError(str(e)) from e
+            get_logger().warning(f"Syntax parsed by SyntaxParser only: {text!r}")
+            return result
+
+        if result != expected:
+            get_logger().warning(
+                f"SyntaxParser result differs from pyparsing: {text!r}"
+            )
+        return expected
+
+    def _parse_request_syntax(self) -> Dict[str, Any]:
+        self.expect("**Request Syntax**")
+        self.expect("::")
+        self.skip_whitespace()
+        start_index = self.text.find("(", self.pos)
+        if start_index < 0:
+            self.fail("(")
+        self.pos = start_index + 1
+        arguments: List[Dict[str, Any]] = []
+        if self.starts_argument():
+            arguments = self.parse_delimited(self.parse_argument, self.starts_argument)
+        self.consume(",")
+        self.expect(")")
+        if not arguments:
+            return {}
+        return {"arguments": arguments}
+
+    def _parse_response_syntax(self) -> Dict[str, Any]:
+        self.expect("**Response Syntax**")
+        self.expect("::")
+        if self.peek("["):
+            return {"value": self.parse_list()}
+        if self.peek("{"):
+            return {"value": self.parse_dict_or_set(allow_set=False)}
+        self.fail("list or dict")
+
+    def fail(self, expected: str) -> NoReturn:
+        """
+        Raise parse error at current position.
+
+        Raises:
+            SyntaxParserError -- Always.
+        """
+        line = self.text.count("\n", 0, self.pos) + 1
+        raise SyntaxParserError(f"Expected {expected} at {self.pos} (line {line})")
+
+    def skip_whitespace(self) -> None:
+        """
+        Move position to the next non-whitespace character.
+        """
+        match = self.RE_WHITESPACE.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+
+    def peek(self, literal: str) -> bool:
+        """
+        Whether `literal` follows after whitespace.
+        """
+        self.skip_whitespace()
+        return self.text.startswith(literal, self.pos)
+
+    def peek_pattern(self, pattern: Pattern[str]) -> bool:
+        """
+        Whether `pattern` matches after whitespace.
+        """
+        self.skip_whitespace()
+        return pattern.match(self.text, self.pos) is not None
+
+    def consume(self, literal: str) -> bool:
+        """
+        Consume `literal` after whitespace if it is there.
+
+        Returns:
+            True if literal is consumed.
+        """
+        if self.peek(literal):
+            self.pos += len(literal)
+            return True
+        return False
+
+    def expect(self, literal: str) -> None:
+        """
+        Consume `literal` after whitespace.
+
+        Raises:
+            SyntaxParserError -- If literal is not there.
+        """
+        if not self.consume(literal):
+            self.fail(repr(literal))
+
+    def consume_pattern(self, pattern: Pattern[str]) -> str:
+        """
+        Consume `pattern` match after whitespace.
+
+        Returns:
+            Matched string.
+
+        Raises:
+            SyntaxParserError -- If pattern does not match.
+        """
+        self.skip_whitespace()
+        match = pattern.match(self.text, self.pos)
+        if not match:
+            self.fail(pattern.pattern)
+        self.pos = match.end()
+        return match.group()
+
+    def starts_value(self) -> bool:
+        """
+        Whether a value starts at current position.
+        """
+        return self.peek_pattern(self.RE_VALUE_START)
+
+    def starts_argument(self) -> bool:
+        """
+        Whether a `name=value` argument starts at current position.
+        """
+        return self.peek_pattern(self.RE_ARGUMENT_START)
+
+    def consume_delimiter(
+        self, delimiter: str, starts_item: Callable[[], bool]
+    ) -> bool:
+        """
+        Consume `delimiter` only if the next item starts after it.
+
+        Returns:
+            True if delimiter is consumed.
+        """
+        pos = self.pos
+        if self.consume(delimiter) and starts_item():
+            return True
+        self.pos = pos
+        return False
+
+    def parse_delimited(
+        self,
+        parse_item: Callable[[], Any],
+        starts_item: Callable[[], bool],
+        delimiter: str = ",",
+    ) -> List[Any]:
+        """
+        Parse one or more items separated by `delimiter`.
+
+        Delimiter without an item after it is not consumed.
+
+        Arguments:
+            parse_item -- Item parser.
+            starts_item -- Check if the next item starts at current position.
+            delimiter -- Items delimiter.
+
+        Returns:
+            A list of parsed items.
+        """
+        result = [parse_item()]
+        while self.consume_delimiter(delimiter, starts_item):
+            result.append(parse_item())
+        return result
+
+    def parse_argument(self) -> Dict[str, Any]:
+        """
+        Parse `name=value` argument.
+        """
+        name = self.consume_pattern(self.RE_ARGUMENT_NAME)
+        self.expect("=")
+        return {"name": name, "value": self.parse_any_value()}
+
+    def parse_any_value(self) -> Dict[str, Any]:
+        """
+        Parse literal, list, dict, set, union, function call or plain value.
+        """
+        if not self.peek_pattern(self.RE_STRING) and self.peek_pattern(self.RE_NAME):
+            name = self.consume_pattern(self.RE_NAME)
+            item = {"value": name}
+            is_name = True
+        else:
+            item = self.parse_literal_item()
+            is_name = False
+
+        if self.consume_delimiter("|", self.starts_value):
+            return self.parse_literal_tail(item)
+
+        if "value" not in item:
+            return item
+
+        if self.consume_delimiter("or", self.starts_value):
+            rest_items = self.parse_delimited(
+                self.parse_union_item, self.starts_value, "or"
+            )
+            return {"union_first_item": item, "union_rest_items": rest_items}
+
+        if is_name and self.peek("("):
+            return self.parse_func_call_tail(item["value"])
+
+        return item
+
+    def parse_literal_item(self) -> Dict[str, Any]:
+        """
+        Parse list, dict, set or plain value.
+        """
+        if self.peek("["):
+            return self.parse_list()
+        if self.peek("{"):
+            return self.parse_dict_or_set(allow_set=True)
+        return self.parse_plain()
+
+    def parse_literal_tail(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse literal items after a literal `item` and `|`.
+        """
+        rest_items = self.parse_delimited(
+            self.parse_literal_item, self.starts_value, "|"
+        )
+        return {"literal_first_item": item, "literal_rest_items": rest_items}
+
+    def parse_union_item(self) -> Dict[str, Any]:
+        """
+        Parse literal, list, dict, set or plain value.
+        """
+        item = self.parse_literal_item()
+        if self.consume_delimiter("|", self.starts_value):
+            return self.parse_literal_tail(item)
+        return item
+
+    def parse_plain(self) -> Dict[str, Any]:
+        """
+        Parse string or name value.
+        """
+        if self.peek_pattern(self.RE_STRING):
+            return {"value": self.consume_pattern(self.RE_STRING)}
+        return {"value": self.consume_pattern(self.RE_NAME)}
+
+    def parse_empty(self, pattern: Pattern[str]) -> List[str]:
+        """
+        Parse empty list or dict with optional ellipsis and comma.
+        """
+        self.skip_whitespace()
+        match = pattern.match(self.text, self.pos)
+        if not match:
+            return []
+
+        self.pos = match.end()
+        result = [match.group()[0]]
+        if match.group("ellipsis"):
+            result.append("...")
+        if match.group("comma"):
+            result.append(",")
+        result.append(match.group()[-1])
+        return result
+
+    def parse_list(self) -> Dict[str, Any]:
+        """
+        Parse list value.
+        """
+        empty_list = self.parse_empty(self.RE_EMPTY_LIST)
+        if empty_list:
+            return {"empty_list": empty_list}
+
+        self.expect("[")
+        items = self.parse_delimited(self.parse_any_value, self.starts_value)
+        self.consume(",")
+        self.expect("]")
+        return {"list_items": items}
+
+    def parse_dict_item(self) -> Dict[str, Any]:
+        """
+        Parse `'key': value` dict item.
+        """
+        key = self.consume_pattern(self.RE_STRING)
+        self.expect(":")
+        return {"key": key, "value": self.parse_any_value()}
+
+    def parse_dict_or_set(self, allow_set: bool) -> Dict[str, Any]:
+        """
+        Parse dict value, or set value if `allow_set` is set.
+
+        Dict is detected by a string key followed by a colon.
+        """
+        empty_dict = self.parse_empty(self.RE_EMPTY_DICT)
+        if empty_dict:
+            return {"empty_dict": empty_dict}
+
+        self.expect("{")
+        if self.peek_pattern(self.RE_DICT_KEY_START):
+            items = self.parse_delimited(
+                self.parse_dict_item, lambda: self.peek_pattern(self.RE_DICT_KEY_START),
+            )
+            key = "dict_items"
+        elif allow_set:
+            items = self.parse_delimited(self.parse_any_value, self.starts_value)
+            key = "set_items"
+        else:
+            self.fail("dict item")
+
+        self.consume(",")
+        self.expect("}")
+        return {key: items}
+
+    def parse_func_call_tail(self, name: str) -> Dict[str, Any]:
+        """
+        Parse `(args)` after function `name`.
+        """
+        self.expect("(")
+        func_call: Dict[str, Any] = {"name": name}
+        if self.starts_value():
+            func_call["args"] = self.parse_delimited(
+                self.parse_any_value, self.starts_value
+            )
+        self.consume(",")
+        self.expect(")")
+        return {"func_call": func_call}
@@ -0,0 +1,190 @@
+"""
+Line-based parser for argument type doc lines.
+"""
+import re
+from typing import Any, Dict, List, Match, Pattern, Tuple
+
+
+__all__ = ("TypeDocParser", "TypeDocParserError")
+
+
+class TypeDocParserError(Exception):
+    pass
+
+
+class TypeDocParser:
+    """
+    Line-based parser for argument type doc lines.
+
+    Nested lines are collected to an indentation tree in one pass,
+    every line has all its nested lines in `indented`.
+    Results can be passed to `TypeDocLine` as keyword arguments.
+    """
+
+    RE_TYPE_DEFINITION: Pattern[str] = re.compile(r":type\s*([^:]*):[ \t]*(.*)")
+    RE_RTYPE_DEFINITION: Pattern[str] = re.compile(r":rtype:[ \t]*(.*)")
+    RE_RETURNS_DEFINITION: Pattern[str] = re.compile(r":(?:returns|return):[ \t]*(.*)")
+    RE_PARAM_DEFINITION: Pattern[str] = re.compile(r":param\s*([^:]*):[ \t]*(.*)")
+    RE_TYPED_DICT_KEY_LINE: Pattern[str] = re.compile(
+        r"-[ \t]+\*\*(\w+)\*\*[ \t]+\*\((\w+)\)[ \t]+--\*[ \t]*(.*)", re.ASCII
+    )
+    RE_TYPE_LINE: Pattern[str] = re.compile(
+        r"-[ \t]+\*\((\w+)\)[ \t]+--\*[ \t]*(.*)", re.ASCII
+    )
+    RESPONSE_STRUCTURE = "**Response Structure**"
+
+    @classmethod
+    def _match(cls, pattern: Pattern[str], input_string: str) -> Match[str]:
+        match = pattern.match(input_string)
+        if not match:
+            first_line = input_string.split("\n", 1)[0]
+            raise TypeDocParserError(f"Expected {pattern.pattern} in {first_line!r}")
+        return match
+
+    @classmethod
+    def parse_type_definition(cls, input_string: str) -> Dict[str, str]:
+        """
+        Parse `:type name: type_name` line.
+
+        Returns:
+            A dictionary with `name` and `type_name`.
+
+        Raises:
+            TypeDocParserError -- If line cannot be parsed.
+        """
+        match = cls._match(cls.RE_TYPE_DEFINITION, input_string)
+        return {"name": match.group(1), "type_name": match.group(2)}
+
+    @classmethod
+    def parse_rtype_definition(cls, input_string: str) -> Dict[str, str]:
+        """
+        Parse `:rtype: type_name` line.
+
+        Returns:
+            A dictionary with `type_name`.
+
+        Raises:
+            TypeDocParserError -- If line cannot be parsed.
+        """
+        match = cls._match(cls.RE_RTYPE_DEFINITION, input_string)
+        return {"type_name": match.group(1)}
+
+    @classmethod
+    def parse_returns_definition(cls, input_string: str) -> Dict[str, str]:
+        """
+        Parse `:returns: description` line.
+
+        Returns:
+            A dictionary with `description`.
+
+        Raises:
+            TypeDocParserError -- If line cannot be parsed.
+        """
+        match = cls._match(cls.RE_RETURNS_DEFINITION, input_string)
+        return {"description": match.group(1)}
+
+    @classmethod
+    def parse_param_definition(cls, input_string: str) -> Dict[str, Any]:
+        """
+        Parse `:param name: description` line with indented lines.
+
+        Returns:
+            A dictionary with `name`, `description` and `indented` lines.
+
+        Raises:
+            TypeDocParserError -- If line cannot be parsed.
+        """
+        first_line, _, rest = input_string.partition("\n")
+        match = cls._match(cls.RE_PARAM_DEFINITION, first_line)
+        return {
+            "name": match.group(1),
+            "description": match.group(2),
+            "indented": cls.build_tree(rest.splitlines(), 0),
+        }
+
+    @classmethod
+    def parse_response_structure(cls, input_string: str) -> Dict[str, Any]:
+        """
+        Parse `**Response Structure**` block.
+
+        Returns:
+            A dictionary for the first line after header with its `indented` lines.
+
+        Raises:
+            TypeDocParserError -- If block cannot be parsed.
+        """
+        input_string = input_string.lstrip()
+        if not input_string.startswith(cls.RESPONSE_STRUCTURE):
+            raise TypeDocParserError(f"Expected {cls.RESPONSE_STRUCTURE}")
+
+        lines = input_string[len(cls.RESPONSE_STRUCTURE) :].splitlines()
+        for index, line in enumerate(lines):
+            if not line.strip():
+                continue
+            result = cls.parse_line(line.strip())
+            result["indented"] = cls.build_tree(lines[index + 1 :], cls._indent(line))
+            return result
+
+        raise TypeDocParserError(f"Expected line after {cls.RESPONSE_STRUCTURE}")
+
+    @classmethod
+    def parse_line(cls, line: str) -> Dict[str, Any]:
+        """
+        Parse stripped line to a dictionary.
+
+        Lines for TypedDict keys get `name`, `type_name` and `description`,
+        lines for list or dict items get `type_name` and `description`.
+
+        Returns:
+            A dictionary for `TypeDocLine`.
+        """
+        result: Dict[str, Any] = {"line": [line]}
+        match = cls.RE_TYPED_DICT_KEY_LINE.match(line)
+        if match:
+            result["name"], result["type_name"], result["description"] = match.groups()
+            return result
+
+        match = cls.RE_TYPE_LINE.match(line)
+        if match:
+            result["type_name"], result["description"] = match.groups()
+        return result
+
+    @staticmethod
+    def _indent(line: str) -> int:
+        return len(line) - len(line.lstrip())
+
+    @classmethod
+    def build_tree(cls, lines: List[str], parent_indent: int) -> List[Dict[str, Any]]:
+        """
+        Build indentation tree from lines nested into a parent line.
+
+        Empty lines are skipped, tree ends on the first line that is not
+        indented deeper than parent.
+
+        Arguments:
+            lines -- Lines after parent line.
+            parent_indent -- Parent line indentation.
+
+        Returns:
+            A list of parsed nested lines.
+        """
+        result: List[Dict[str, Any]] = []
+        stack: List[Tuple[int, List[Dict[str, Any]]]] = [(parent_indent, result)]
+        for line in lines:
+            stripped_line = line.strip()
+            if not stripped_line:
+                continue
+
+            indent = cls._indent(line)
+            if indent <= parent_indent:
+                break
+
+            while len(stack) > 1 and stack[-1][0] >= indent:
+                stack.pop()
+
+            item = cls.parse_line(stripped_line)
+            item["indented"] = []
+            stack[-1][1].append(item)
+            stack.append((indent, item["indented"]))
+
+        return result
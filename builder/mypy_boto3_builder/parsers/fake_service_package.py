@@ -1,7 +1,6 @@
 """
 Fake parser that produces `structures.ServiceModule` for master module and stubs.
 """
-from boto3.session import Session
 from botocore import xform_name
 
 from mypy_boto3_builder.structures.client import Client
@@ -9,14 +8,13 @@ from mypy_boto3_builder.structures.service_resource import ServiceResource
 from mypy_boto3_builder.structures.waiter import Waiter
 from mypy_boto3_builder.structures.paginator import Paginator
 from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.service_catalogue import CatalogueEntry
 from mypy_boto3_builder.service_name import ServiceName
-from mypy_boto3_builder.parsers.boto3_utils import get_boto3_resource, get_boto3_client
 from mypy_boto3_builder.utils.strings import get_class_prefix
-from mypy_boto3_builder.parsers.shape_parser import ShapeParser
 
 
 def parse_fake_service_package(
-    session: Session, service_name: ServiceName
+    service_name: ServiceName, catalogue_entry: CatalogueEntry
 ) -> ServicePackage:
     """
     Create fake boto3 service module structure.
@@ -24,14 +22,12 @@ def parse_fake_service_package(
     Used by stubs and master package.
 
     Arguments:
-        session -- boto3 session.
         service_name -- Target service name.
+        catalogue_entry -- Service metadata from catalogue.
 
     Returns:
         ServiceModule structure.
     """
-    shape_parser = ShapeParser(session, service_name)
-
     result = ServicePackage(
         name=service_name.module_name,
         pypi_name=service_name.pypi_name,
@@ -39,18 +35,17 @@ def parse_fake_service_package(
         client=Client(),
     )
 
-    boto3_client = get_boto3_client(session, service_name)
-    boto3_resource = get_boto3_resource(session, service_name)
-
-    if boto3_resource is not None:
+    if catalogue_entry.has_resource:
         result.service_resource = ServiceResource()
 
-    for waiter_name in boto3_client.waiter_names:
-        real_class_name = get_class_prefix(waiter_name)
+    for waiter_name in catalogue_entry.waiter_names:
+        real_class_name = get_class_prefix(xform_name(waiter_name))
         waiter_class_name = f"{real_class_name}Waiter"
-        result.waiters.append(Waiter(waiter_class_name, waiter_name=waiter_name))
+        result.waiters.append(
+            Waiter(waiter_class_name, waiter_name=xform_name(waiter_name))
+        )
 
-    for paginator_name in shape_parser.get_paginator_names():
+    for paginator_name in catalogue_entry.paginator_names:
         operation_name = xform_name(paginator_name)
         result.paginators.append(
             Paginator(f"{paginator_name}Paginator", operation_name=operation_name)
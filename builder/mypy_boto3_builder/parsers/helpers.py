@@ -3,10 +3,11 @@ Helpers for parsing methods and attributes.
 """
 import inspect
 import textwrap
-from typing import List, Dict, Any
+from typing import List, Dict
 from types import FunctionType
 
-from boto3.resources.base import ServiceResource as Boto3ServiceResource
+from boto3.resources.model import ResourceModel
+from botocore.model import ServiceModel
 
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.method import Method
@@ -15,25 +16,29 @@ from mypy_boto3_builder.utils.strings import get_class_prefix
 from mypy_boto3_builder.parsers.docstring_parser.argspec_parser import ArgSpecParser
 from mypy_boto3_builder.parsers.docstring_parser.docstring_parser import DocstringParser
 from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.method_cache import MethodCache
 from mypy_boto3_builder.type_maps.method_argument_map import get_method_arguments_stub
-from mypy_boto3_builder.type_maps.method_type_map import get_method_type_stub
+from mypy_boto3_builder.type_maps.method_type_map import (
+    get_method_type_stub,
+    has_method_type_stubs,
+)
 from mypy_boto3_builder.type_maps.docstring_type_map import get_type_from_docstring
 
 
-def get_public_methods(inspect_class: Any) -> Dict[str, FunctionType]:
+def get_public_functions(inspect_class: type) -> Dict[str, FunctionType]:
     """
-    Extract public methods from any class.
+    Extract public functions from class itself, not its instance.
 
     Arguments:
         inspect_class -- Inspect class.
 
     Returns:
-        A dictionary of method name and method.
+        A dictionary of method name and function.
     """
     class_members = inspect.getmembers(inspect_class)
     methods: Dict[str, FunctionType] = {}
     for name, member in class_members:
-        if not inspect.ismethod(member):
+        if not inspect.isfunction(member):
             continue
 
         if name.startswith("_"):
@@ -45,27 +50,27 @@ def get_public_methods(inspect_class: Any) -> Dict[str, FunctionType]:
 
 
 def parse_attributes(
-    service_name: ServiceName, resource_name: str, resource: Boto3ServiceResource
+    service_name: ServiceName,
+    resource_name: str,
+    resource_model: ResourceModel,
+    service_model: ServiceModel,
 ) -> List[Attribute]:
     """
-    Extract attributes from boto3 resource.
+    Extract attributes from boto3 resource model.
 
     Arguments:
-        resource -- boto3 service resource.
+        service_name -- Target service name.
+        resource_name -- Resource name.
+        resource_model -- boto3 resource model.
+        service_model -- Botocore service model.
 
     Returns:
         A list of Attribute structures.
     """
     result: List[Attribute] = []
-    if not resource.meta.client:
-        return result
-    if not resource.meta.resource_model:
-        return result
-
-    service_model = resource.meta.client.meta.service_model
-    if resource.meta.resource_model.shape:
-        shape = service_model.shape_for(resource.meta.resource_model.shape)
-        attributes = resource.meta.resource_model.get_attributes(shape)
+    if resource_model.shape:
+        shape = service_model.shape_for(resource_model.shape)
+        attributes = resource_model.get_attributes(shape)
         for name, attribute in attributes.items():
             argument_type = get_method_type_stub(
                 service_name, resource_name, "_attributes", name
@@ -93,9 +98,19 @@ def parse_method(
     logger = get_logger()
     docstring = textwrap.dedent(inspect.getdoc(method) or "")
     method_name = f"{parent_name}.{name}"
+    prefix = f"{get_class_prefix(parent_name)}{get_class_prefix(name)}"
+
+    has_stubs = has_method_type_stubs(service_name, parent_name, name) or (
+        get_method_arguments_stub(service_name, parent_name, name) is not None
+    )
+    cache_key = ""
+    if not has_stubs:
+        cache_key = MethodCache.get_key(name, method, docstring)
+        cached_method = MethodCache.get(cache_key, prefix)
+        if cached_method:
+            return cached_method
 
     logger.debug(f"Slow parsing of {method_name}: {len(docstring)} chars")
-    prefix = f"{get_class_prefix(parent_name)}{get_class_prefix(name)}"
     arg_spec_parser = ArgSpecParser(prefix, service_name)
 
     arguments = get_method_arguments_stub(service_name, parent_name, name)
@@ -110,4 +125,7 @@ def parse_method(
             service_name, parent_name, name, []
         ).get_return_type(docstring)
 
-    return Method(name=name, arguments=arguments, return_type=return_type)
+    result = Method(name=name, arguments=arguments, return_type=return_type)
+    if cache_key:
+        MethodCache.add(cache_key, prefix, result)
+    return result
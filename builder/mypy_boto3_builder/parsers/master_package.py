@@ -1,31 +1,38 @@
 """
 Parser that produces `structures.MasterModule`.
 """
-from typing import List
+from pathlib import Path
+from typing import List, Optional
 
 from boto3.session import Session
 
+from mypy_boto3_builder.service_catalogue import ServiceCatalogue
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.master_package import MasterPackage
 from mypy_boto3_builder.parsers.fake_service_package import parse_fake_service_package
 
 
 def parse_master_package(
-    session: Session, service_names: List[ServiceName]
+    session: Session,
+    service_names: List[ServiceName],
+    catalogue_path: Optional[Path] = None,
 ) -> MasterPackage:
     """
     Parse data for master package.
 
     Arguments:
         session -- boto3 session.
+        service_names -- List of known service names.
+        catalogue_path -- Service catalogue cache file path.
 
     Returns:
         MasterModule structure.
     """
     result = MasterPackage(service_names=service_names)
+    catalogue = ServiceCatalogue.get(session, result.service_names, catalogue_path)
     for service_name in result.service_names:
         result.service_packages.append(
-            parse_fake_service_package(session, service_name)
+            parse_fake_service_package(service_name, catalogue.get_entry(service_name))
         )
 
     return result
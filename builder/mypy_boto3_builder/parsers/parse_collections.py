@@ -3,7 +3,7 @@ Boto3 ServiceResource collections parser, produces `structures.Collection`.
 """
 from typing import List
 
-from boto3.resources.base import ServiceResource as Boto3ServiceResource
+from boto3.resources.model import ResourceModel
 
 from mypy_boto3_builder.structures.collection import Collection
 from mypy_boto3_builder.structures.method import Method
@@ -18,21 +18,24 @@ from mypy_boto3_builder.parsers.shape_parser import ShapeParser
 
 def parse_collections(
     parent_name: str,
-    resource: Boto3ServiceResource,
+    resource_model: ResourceModel,
     service_name: ServiceName,
     shape_parser: ShapeParser,
 ) -> List[Collection]:
     """
-    Extract collections from boto3 resource.
+    Extract collections from boto3 resource model.
 
     Arguments:
-        resource -- boto3 service resource.
+        parent_name -- Parent resource name.
+        resource_model -- boto3 resource model.
+        service_name -- Target service name.
+        shape_parser -- Shape parser for the service.
 
     Returns:
         A list of Collection structures.
     """
     result: List[Collection] = []
-    for collection in resource.meta.resource_model.collections:
+    for collection in resource_model.collections:
         if not collection.resource:
             continue
         object_class_name = collection.resource.type
@@ -21,7 +21,7 @@ from mypy_boto3_builder.parsers.shape_parser import ShapeParser
 
 def parse_resource(
     name: str,
-    resource: Boto3ServiceResource,
+    resource_class: Type[Boto3ServiceResource],
     service_name: ServiceName,
     shape_parser: ShapeParser,
 ) -> Resource:
@@ -29,7 +29,10 @@ def parse_resource(
     Parse boto3 sub Resource data.
 
     Arguments:
-        resource -- Original boto3 resource.
+        name -- Resource name.
+        resource_class -- Original boto3 resource class.
+        service_name -- Target service name.
+        shape_parser -- Shape parser for the service.
 
     Returns:
         Resource structure.
@@ -42,7 +45,7 @@ def parse_resource(
         ),
     )
     shape_methods_map = shape_parser.get_resource_method_map(name)
-    public_methods = get_resource_public_methods(resource.__class__)
+    public_methods = get_resource_public_methods(resource_class)
     for method_name, public_method in public_methods.items():
         if method_name in shape_methods_map:
             method = shape_methods_map[method_name]
@@ -54,10 +57,13 @@ def parse_resource(
         )
         result.methods.append(method)
 
-    result.attributes.extend(parse_attributes(service_name, name, resource))
-    result.attributes.extend(parse_identifiers(resource))
+    resource_model = resource_class.meta.resource_model
+    result.attributes.extend(
+        parse_attributes(service_name, name, resource_model, shape_parser.service_model)
+    )
+    result.attributes.extend(parse_identifiers(resource_model))
 
-    collections = parse_collections(name, resource, service_name, shape_parser)
+    collections = parse_collections(name, resource_model, service_name, shape_parser)
     for collection in collections:
         result.collections.append(collection)
         result.attributes.append(
@@ -16,7 +16,7 @@ from mypy_boto3_builder.logger import get_logger
 
 
 def parse_service_package(
-    session: Session, service_name: ServiceName
+    session: Session, service_name: ServiceName, docstrings: bool = False
 ) -> ServicePackage:
     """
     Extract all data from boto3 service package.
@@ -24,6 +24,7 @@ def parse_service_package(
     Arguments:
         session -- boto3 session.
         service_name -- Target service name.
+        docstrings -- Parse all client methods from docstrings.
 
     Returns:
         ServiceModule structure.
@@ -32,7 +33,7 @@ def parse_service_package(
     logger.debug("Parsing Shapes")
     shape_parser = ShapeParser(session, service_name)
     logger.debug("Parsing Client")
-    client = parse_client(session, service_name, shape_parser)
+    client = parse_client(session, service_name, shape_parser, docstrings)
     service_resource = parse_service_resource(session, service_name, shape_parser)
 
     result = ServicePackage(
@@ -43,22 +44,21 @@ def parse_service_package(
         service_resource=service_resource,
     )
 
-    for waiter_name in client.boto3_client.waiter_names:
+    for waiter_name in shape_parser.get_waiter_names():
         logger.debug(f"Parsing Waiter {waiter_name}")
-        waiter = client.boto3_client.get_waiter(waiter_name)
         waiter_record = Waiter(
-            name=f"{waiter.name}Waiter",
+            name=f"{waiter_name}Waiter",
             docstring=(
-                f"[Waiter.{waiter.name} documentation]"
-                f"({service_name.doc_link}.Waiter.{waiter.name})"
+                f"[Waiter.{waiter_name} documentation]"
+                f"({service_name.doc_link}.Waiter.{waiter_name})"
             ),
-            waiter_name=waiter_name,
+            waiter_name=xform_name(waiter_name),
         )
 
-        wait_method = shape_parser.get_wait_method(waiter.name)
+        wait_method = shape_parser.get_wait_method(waiter_name)
         wait_method.docstring = (
-            f"[{waiter.name}.wait documentation]"
-            f"({service_name.doc_link}.Waiter.{waiter.name}.wait)"
+            f"[{waiter_name}.wait documentation]"
+            f"({service_name.doc_link}.Waiter.{waiter_name}.wait)"
         )
         waiter_record.methods.append(wait_method)
         result.waiters.append(waiter_record)
@@ -66,7 +66,6 @@ def parse_service_package(
     for paginator_name in shape_parser.get_paginator_names():
         logger.debug(f"Parsing Paginator {paginator_name}")
         operation_name = xform_name(paginator_name)
-        paginator = client.boto3_client.get_paginator(operation_name)
         paginator_record = Paginator(
             name=f"{paginator_name}Paginator",
             operation_name=operation_name,
@@ -1,11 +1,10 @@
 """
 Parser for botocore shape files.
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Tuple
 
 from boto3.session import Session
 from boto3.resources.model import Collection
-from botocore.exceptions import UnknownServiceError
 from botocore import xform_name
 from botocore.session import Session as BotocoreSession
 from botocore.model import (
@@ -18,12 +17,14 @@ from botocore.model import (
     StringShape,
 )
 
+from mypy_boto3_builder.build_stats import BuildStats
 from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
 from mypy_boto3_builder.structures.argument import Argument
 from mypy_boto3_builder.structures.method import Method
 from mypy_boto3_builder.import_helpers.import_string import ImportString
 from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
 from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_annotation import TypeAnnotation
 from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
 from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
 from mypy_boto3_builder.type_annotations.type_constant import TypeConstant
@@ -31,6 +32,7 @@ from mypy_boto3_builder.type_annotations.external_import import ExternalImport
 from mypy_boto3_builder.type_annotations.internal_import import InternalImport
 from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
 from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.boto3_utils import has_service_model
 from mypy_boto3_builder.type_maps.method_type_map import get_method_type_stub
 from mypy_boto3_builder.type_maps.typed_dicts import (
     waiter_config_type,
@@ -62,6 +64,10 @@ class ShapeParser:
         "blob": TypeSubscript(Type.Union, [Type.bytes, Type.IO]),
     }
 
+    # Literals and subscripts without service TypedDicts shared by all services in build.
+    _shared_literal_map: Dict[Tuple[Any, ...], TypeLiteral] = {}
+    _shared_subscript_map: Dict[Tuple[int, Tuple[int, ...]], TypeSubscript] = {}
+
     # Alias map fixes added by botocore for documentation build.
     # https://github.com/boto/botocore/blob/develop/botocore/handlers.py#L773
     # https://github.com/boto/botocore/blob/develop/botocore/handlers.py#L1055
@@ -88,35 +94,59 @@ class ShapeParser:
     }
 
     def __init__(self, session: Session, service_name: ServiceName):
-        loader = session._loader  # pylint: disable=protected-access
-        botocore_session: BotocoreSession = session._session  # pylint: disable=protected-access
-        service_data = botocore_session.get_service_data(service_name.boto3_name)
+        self._session = session
         self.service_name = service_name
-        self.service_model = ServiceModel(service_data, service_name.boto3_name)
+        self._service_data: Optional[Dict[str, Any]] = None
+        self._service_model: Optional[ServiceModel] = None
+        self._models: Dict[str, Shape] = {}
         self._typed_dict_map: Dict[str, TypeTypedDict] = {}
-        self._waiters_shape: Shape = {}
-        try:
-            self._waiters_shape = loader.load_service_model(
-                service_name.boto3_name, "waiters-2"
-            )
-        except UnknownServiceError:
-            pass
-        self._paginators_shape: Shape = {}
-        try:
-            self._paginators_shape = loader.load_service_model(
-                service_name.boto3_name, "paginators-1"
+        self._subscript_map: Dict[Tuple[int, Tuple[int, ...]], TypeSubscript] = {}
+        self.logger = get_logger()
+
+    def _get_service_data(self) -> Dict[str, Any]:
+        if self._service_data is None:
+            botocore_session: BotocoreSession = self._session._session  # pylint: disable=protected-access
+            self._service_data = botocore_session.get_service_data(
+                self.service_name.boto3_name
             )
-        except UnknownServiceError:
-            pass
-        self._resources_shape: Shape = {}
-        try:
-            self._resources_shape = loader.load_service_model(
-                service_name.boto3_name, "resources-1"
+        return self._service_data
+
+    @property
+    def service_model(self) -> ServiceModel:
+        """
+        Botocore service model, loaded on first access.
+        """
+        if self._service_model is None:
+            self._service_model = ServiceModel(
+                self._get_service_data(), self.service_name.boto3_name
             )
-        except UnknownServiceError:
-            pass
+        return self._service_model
+
+    @property
+    def _shapes(self) -> Dict[str, Any]:
+        return self._get_service_data().get("shapes", {})
+
+    def _get_model(self, type_name: str) -> Shape:
+        if type_name not in self._models:
+            self._models[type_name] = {}
+            if has_service_model(self._session, self.service_name, type_name):
+                loader = self._session._loader  # pylint: disable=protected-access
+                self._models[type_name] = loader.load_service_model(
+                    self.service_name.boto3_name, type_name
+                )
+        return self._models[type_name]
 
-        self.logger = get_logger()
+    @property
+    def _waiters_shape(self) -> Shape:
+        return self._get_model("waiters-2")
+
+    @property
+    def _paginators_shape(self) -> Shape:
+        return self._get_model("paginators-1")
+
+    @property
+    def _resources_shape(self) -> Shape:
+        return self._get_model("resources-1")
 
     def _get_operation(self, name: str) -> OperationModel:
         return self.service_model.operation_model(name)
@@ -154,6 +184,35 @@ class ShapeParser:
         result.sort()
         return result
 
+    def get_waiter_names(self) -> List[str]:
+        """
+        Get available waiter names.
+
+        Returns:
+            A list of waiter names.
+        """
+        result: List[str] = []
+        for name in self._waiters_shape.get("waiters", []):
+            result.append(name)
+        result.sort()
+        return result
+
+    def get_exception_names(self) -> List[str]:
+        """
+        Get client exception class names.
+
+        Names are taken from raw error shapes without building shape models,
+        `ClientError` is available for every service.
+
+        Returns:
+            A sorted list of exception class names.
+        """
+        result = {"ClientError"}
+        for name, shape in self._shapes.items():
+            if shape.get("exception", False):
+                result.add(name)
+        return sorted(result)
+
     def _get_argument_alias(self, operation_name: str, argument_name: str) -> str:
         service_map = self.ARGUMENT_ALIASES.get(self.service_name.boto3_name)
         if not service_map:
@@ -267,28 +326,66 @@ class ShapeParser:
 
         return result
 
-    @staticmethod
-    def _parse_shape_string(shape: StringShape) -> FakeAnnotation:
+    @classmethod
+    def _is_service_specific(cls, type_annotation: FakeAnnotation) -> bool:
+        if isinstance(type_annotation, TypeSubscript):
+            return any(cls._is_service_specific(i) for i in type_annotation.children)
+        return isinstance(type_annotation, (TypeTypedDict, InternalImport))
+
+    def _get_subscript(
+        self, parent: TypeAnnotation, children: Iterable[FakeAnnotation]
+    ) -> TypeSubscript:
+        """
+        Get interned `TypeSubscript`.
+
+        Children are interned as well, so they are compared by identity.
+        Subscripts with service TypedDicts are shared only within the service.
+
+        Arguments:
+            parent -- Parent type annotation.
+            children -- Children type annotations.
+
+        Returns:
+            A shared TypeSubscript that must not be changed.
+        """
+        children = list(children)
+        key = (id(parent), tuple(id(i) for i in children))
+        subscript_map = self._shared_subscript_map
+        if any(self._is_service_specific(i) for i in children):
+            subscript_map = self._subscript_map
+
+        if key in subscript_map:
+            BuildStats.increment("interned_annotation_hits")
+            return subscript_map[key]
+
+        result = TypeSubscript(parent, children)
+        subscript_map[key] = result
+        return result
+
+    def _parse_shape_string(self, shape: StringShape) -> FakeAnnotation:
         if not shape.enum:
             return Type.str
 
+        key = tuple(shape.enum)
+        if key in self._shared_literal_map:
+            BuildStats.increment("interned_annotation_hits")
+            return self._shared_literal_map[key]
+
         type_literal = TypeLiteral()
         for option in shape.enum:
             type_literal.add_literal_child(option)
 
+        self._shared_literal_map[key] = type_literal
         return type_literal
 
     def _parse_shape_map(self, shape: MapShape) -> FakeAnnotation:
-        type_subscript = TypeSubscript(Type.Dict)
+        key_type: FakeAnnotation = Type.str
         if shape.key:
-            type_subscript.add_child(self._parse_shape(shape.key))
-        else:
-            type_subscript.add_child(Type.str)
+            key_type = self._parse_shape(shape.key)
+        value_type: FakeAnnotation = Type.Any
         if shape.value:
-            type_subscript.add_child(self._parse_shape(shape.value))
-        else:
-            type_subscript.add_child(Type.Any)
-        return type_subscript
+            value_type = self._parse_shape(shape.value)
+        return self._get_subscript(Type.Dict, [key_type, value_type])
 
     def _parse_shape_structure(self, shape: StructureShape) -> FakeAnnotation:
         if not shape.members.items():
@@ -307,12 +404,10 @@ class ShapeParser:
         return typed_dict
 
     def _parse_shape_list(self, shape: ListShape) -> FakeAnnotation:
-        type_subscript = TypeSubscript(Type.List)
+        member_type: FakeAnnotation = Type.Any
         if shape.member:
-            type_subscript.add_child(self._parse_shape(shape.member))
-        else:
-            type_subscript.add_child(Type.Any)
-        return type_subscript
+            member_type = self._parse_shape(shape.member)
+        return self._get_subscript(Type.List, [member_type])
 
     def _parse_shape(self, shape: Shape) -> FakeAnnotation:
         if shape.type_name in self.SHAPE_TYPE_MAP:
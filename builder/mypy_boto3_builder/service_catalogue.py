@@ -0,0 +1,188 @@
+"""
+Catalogue index of service metadata used by master package.
+"""
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from boto3.session import Session
+from botocore import __version__ as botocore_version
+from botocore.loaders import Loader
+
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.boto3_utils import has_service_model
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.version import __version__ as version
+
+
+__all__ = ("CatalogueEntry", "ServiceCatalogue")
+
+
+@dataclass
+class CatalogueEntry:
+    """
+    Service metadata needed for master package.
+    """
+
+    has_resource: bool = False
+    waiter_names: List[str] = field(default_factory=lambda: [])
+    paginator_names: List[str] = field(default_factory=lambda: [])
+
+
+class ServiceCatalogue:
+    """
+    Catalogue index of service metadata used by master package.
+
+    Built in one pass over small botocore model files, service models
+    are not loaded and no clients or resources are created.
+    Catalogue can be saved as JSON and is valid for the same builder
+    and `botocore` versions.
+    """
+
+    def __init__(self) -> None:
+        self.entries: Dict[str, CatalogueEntry] = {}
+
+    @staticmethod
+    def _get_version() -> str:
+        return f"{version}-{botocore_version}"
+
+    @staticmethod
+    def _get_names(
+        loader: Loader, service_name: str, type_name: str, key: str
+    ) -> List[str]:
+        data = loader.load_service_model(service_name, type_name)
+        return sorted(data.get(key, {}))
+
+    @classmethod
+    def build(
+        cls, session: Session, service_names: Iterable[ServiceName]
+    ) -> "ServiceCatalogue":
+        """
+        Build catalogue from botocore model files.
+
+        Arguments:
+            session -- boto3 session.
+            service_names -- Service names to include.
+
+        Returns:
+            A new ServiceCatalogue.
+        """
+        loader = session._loader  # pylint: disable=protected-access
+        result = cls()
+        for service_name in service_names:
+            name = service_name.boto3_name
+            entry = CatalogueEntry(
+                has_resource=has_service_model(session, service_name, "resources-1")
+            )
+            if has_service_model(session, service_name, "waiters-2"):
+                entry.waiter_names = cls._get_names(
+                    loader, name, "waiters-2", "waiters"
+                )
+            if has_service_model(session, service_name, "paginators-1"):
+                entry.paginator_names = cls._get_names(
+                    loader, name, "paginators-1", "pagination"
+                )
+            result.entries[name] = entry
+
+        return result
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["ServiceCatalogue"]:
+        """
+        Load catalogue saved by `save`.
+
+        Arguments:
+            path -- Catalogue file path.
+
+        Returns:
+            A new ServiceCatalogue or None if file is missing, invalid or outdated.
+        """
+        try:
+            text = path.read_text()
+        except OSError:
+            return None
+
+        try:
+            data = json.loads(text)
+            if data["version"] != cls._get_version():
+                return None
+            result = cls()
+            for name, entry_data in data["services"].items():
+                result.entries[name] = CatalogueEntry(**entry_data)
+        except (ValueError, KeyError, TypeError) as e:
+            get_logger().warning(f"Cannot read service catalogue {path}: {e}")
+            return None
+
+        return result
+
+    def save(self, path: Path) -> None:
+        """
+        Write catalogue to `path`.
+
+        Arguments:
+            path -- Catalogue file path.
+        """
+        data = {
+            "version": self._get_version(),
+            "services": {
+                name: {
+                    "has_resource": entry.has_resource,
+                    "waiter_names": entry.waiter_names,
+                    "paginator_names": entry.paginator_names,
+                }
+                for name, entry in self.entries.items()
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(data, indent=2, sort_keys=True))
+        os.replace(temp_path.as_posix(), path.as_posix())
+
+    @classmethod
+    def get(
+        cls,
+        session: Session,
+        service_names: Iterable[ServiceName],
+        path: Optional[Path] = None,
+    ) -> "ServiceCatalogue":
+        """
+        Load catalogue from `path` or build it and save to `path`.
+
+        Arguments:
+            session -- boto3 session.
+            service_names -- Service names to include.
+            path -- Catalogue file path, catalogue is not cached if not set.
+
+        Returns:
+            ServiceCatalogue with all `service_names`.
+        """
+        service_names = list(service_names)
+        if path:
+            result = cls.load(path)
+            if result and all(i.boto3_name in result.entries for i in service_names):
+                return result
+
+        result = cls.build(session, service_names)
+        if path:
+            result.save(path)
+        return result
+
+    def get_entry(self, service_name: ServiceName) -> CatalogueEntry:
+        """
+        Get service metadata.
+
+        Arguments:
+            service_name -- Target service name.
+
+        Returns:
+            CatalogueEntry.
+
+        Raises:
+            ValueError -- If service is not in catalogue.
+        """
+        try:
+            return self.entries[service_name.boto3_name]
+        except KeyError as e:
+            raise ValueError(f"Service {service_name.name} is not in catalogue") from e
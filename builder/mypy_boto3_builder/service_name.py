@@ -1,7 +1,7 @@
 """
 Description for boto3 service.
 """
-from typing import Tuple
+from typing import Any, Tuple
 from mypy_boto3_builder.constants import PYPI_NAME, MODULE_NAME
 
 __all__ = (
@@ -37,6 +37,12 @@ class ServiceName:
     def __hash__(self) -> int:
         return hash(self.name)
 
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ServiceName):
+            return False
+
+        return self.name == other.name
+
     @property
     def boto3_name(self) -> str:
         return self.name
@@ -0,0 +1,154 @@
+"""
+Detection of TypedDicts that are identical across services.
+"""
+import hashlib
+from typing import Dict, Iterable, Optional, Sequence, Set, Tuple
+
+from mypy_boto3_builder.import_helpers.internal_import_record import (
+    InternalImportRecord,
+)
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+
+__all__ = (
+    "TypedDictSignatures",
+    "SharedSignatures",
+    "get_typed_dict_signature",
+    "get_typed_dict_signatures",
+    "get_shared_names",
+    "select_shared_signatures",
+)
+
+
+# Signature digest and dependency names by TypedDict name,
+# digest is None for TypedDicts that use service modules
+TypedDictSignatures = Dict[str, Tuple[Optional[str], Tuple[str, ...]]]
+
+# Signature digest of TypedDicts in shared module by name
+SharedSignatures = Dict[str, str]
+
+
+def get_typed_dict_signature(
+    typed_dict: TypeTypedDict,
+) -> Tuple[Optional[str], Tuple[str, ...]]:
+    """
+    Get stable digest of TypedDict definition and names of TypedDicts it uses.
+
+    Nested TypedDicts are included only by name, so two definitions
+    are the same only if their dependencies are the same as well.
+
+    Arguments:
+        typed_dict -- Service TypedDict.
+
+    Returns:
+        A tuple of digest and dependency names. Digest is None if TypedDict
+        cannot be moved out of service package.
+    """
+    dependencies: Set[str] = set()
+    for type_annotation in typed_dict.get_children_types():
+        if isinstance(type_annotation, TypeTypedDict):
+            dependencies.add(type_annotation.name)
+            continue
+        import_record = type_annotation.get_import_record()
+        if isinstance(import_record, InternalImportRecord) or import_record.is_local():
+            return None, tuple(sorted(dependencies))
+
+    lines = [typed_dict.name]
+    for child in typed_dict.children:
+        optional_mark = "" if child.required else "?"
+        lines.append(
+            f"{child.name}{optional_mark}: {child.type_annotation.render(typed_dict.name)}"
+        )
+    digest = hashlib.sha1("\n".join(lines).encode()).hexdigest()
+    return digest, tuple(sorted(dependencies))
+
+
+def get_typed_dict_signatures(
+    typed_dicts: Iterable[TypeTypedDict],
+) -> TypedDictSignatures:
+    """
+    Get signatures for all service TypedDicts.
+
+    Arguments:
+        typed_dicts -- Service package TypedDicts.
+
+    Returns:
+        A dictionary of signatures by TypedDict name.
+    """
+    return {i.name: get_typed_dict_signature(i) for i in typed_dicts}
+
+
+def get_shared_names(
+    signatures: TypedDictSignatures, shared_signatures: SharedSignatures
+) -> Set[str]:
+    """
+    Get names of service TypedDicts that can be imported from shared module.
+
+    TypedDict can be imported only if its definition and all its
+    dependencies are the same as in shared module.
+
+    Arguments:
+        signatures -- Service TypedDict signatures.
+        shared_signatures -- Shared module TypedDict signatures.
+
+    Returns:
+        A set of TypedDict names.
+    """
+    result = {
+        name
+        for name, (digest, _) in signatures.items()
+        if digest is not None and shared_signatures.get(name) == digest
+    }
+    changed = True
+    while changed:
+        changed = False
+        for name in sorted(result):
+            _, dependencies = signatures[name]
+            if any(i not in result for i in dependencies):
+                result.discard(name)
+                changed = True
+
+    return result
+
+
+def select_shared_signatures(
+    service_signatures: Sequence[TypedDictSignatures],
+) -> SharedSignatures:
+    """
+    Select TypedDicts to move to shared module.
+
+    For every name the most common definition is selected if at least two
+    services can import it with all its dependencies.
+
+    Arguments:
+        service_signatures -- TypedDict signatures of every service in build.
+
+    Returns:
+        Shared module TypedDict signatures.
+    """
+    counts: Dict[Tuple[str, str], int] = {}
+    for signatures in service_signatures:
+        for name, (digest, _) in signatures.items():
+            if digest is None:
+                continue
+            counts[(name, digest)] = counts.get((name, digest), 0) + 1
+
+    result: SharedSignatures = {}
+    for (name, digest), count in sorted(counts.items()):
+        if count < 2:
+            continue
+        if name in result and counts[(name, result[name])] >= count:
+            continue
+        result[name] = digest
+
+    while True:
+        usages: Dict[str, int] = {}
+        for signatures in service_signatures:
+            for name in get_shared_names(signatures, result):
+                usages[name] = usages.get(name, 0) + 1
+        used_result = {
+            name: digest for name, digest in result.items() if usages.get(name, 0) > 1
+        }
+        if len(used_result) == len(result):
+            return result
+        result = used_result
@@ -4,8 +4,6 @@ Boto3 Client.
 from dataclasses import dataclass, field
 from typing import List
 
-from botocore.client import BaseClient
-
 from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
 from mypy_boto3_builder.structures.class_record import ClassRecord
 
@@ -19,7 +17,6 @@ class Client(ClassRecord):
     name: str = "Client"
     alias_name: str = "Client"
     service_name: ServiceName = ServiceNameCatalog.ec2
-    boto3_client: BaseClient = None
     exceptions_class: ClassRecord = field(
         default_factory=lambda: ClassRecord(name="Exceptions")
     )
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import List, Set, Optional, Iterable, Dict
+from typing import List, Set, Optional, Iterable, Iterator, Dict
 
+from mypy_boto3_builder.constants import SHARED_MODULE_NAME, TYPE_DEFS_NAME
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
 from mypy_boto3_builder.import_helpers.import_string import ImportString
@@ -25,32 +26,63 @@ class ServicePackage(Package):
     paginators: List[Paginator] = field(default_factory=lambda: [])
     typed_dicts: List[TypeTypedDict] = field(default_factory=lambda: [])
     helper_functions: List[Function] = field(default_factory=lambda: [])
+    shared_typed_dicts: List[TypeTypedDict] = field(default_factory=lambda: [])
 
     def extract_typed_dicts(
         self,
         type_annotations: Iterable[FakeAnnotation],
         added: Dict[str, TypeTypedDict],
     ) -> List[TypeTypedDict]:
+        """
+        Get TypedDicts ordered so that every TypedDict follows its dependencies.
+
+        Graph is walked iteratively in sorted order, TypedDicts with
+        the same name are compared by structural fingerprint.
+
+        Arguments:
+            type_annotations -- Type annotations to search.
+            added -- TypedDicts by name that are already extracted.
+
+        Returns:
+            A list of new TypedDicts.
+
+        Raises:
+            ValueError -- If TypedDicts with the same name have different attributes.
+        """
         result: List[TypeTypedDict] = []
-        for type_annotation in sorted(type_annotations):
-            if not isinstance(type_annotation, TypeTypedDict):
+        parents: List[TypeTypedDict] = []
+        stack: List[Iterator[TypeTypedDict]] = [
+            self._iterate_typed_dicts(type_annotations)
+        ]
+        while stack:
+            typed_dict = next(stack[-1], None)
+            if typed_dict is None:
+                stack.pop()
+                if parents:
+                    result.append(parents.pop())
                 continue
-            if type_annotation.name in added:
-                try:
-                    assert added[type_annotation.name].is_same(type_annotation)
-                except AssertionError:
-                    print(type_annotation.render_class())
-                    print(added[type_annotation.name].render_class())
-                    raise ValueError(type_annotation.name)
+
+            if typed_dict.name in added:
+                if not added[typed_dict.name].is_same(typed_dict):
+                    raise ValueError(
+                        f"TypedDict {typed_dict.name} has conflicting definitions:\n"
+                        f"{typed_dict.render_class()}\n"
+                        f"{added[typed_dict.name].render_class()}"
+                    )
                 continue
 
-            added[type_annotation.name] = type_annotation
-            result.extend(
-                self.extract_typed_dicts(type_annotation.get_children_types(), added)
-            )
-            result.append(type_annotation)
+            added[typed_dict.name] = typed_dict
+            parents.append(typed_dict)
+            stack.append(self._iterate_typed_dicts(typed_dict.get_children_types()))
+
         return result
 
+    @staticmethod
+    def _iterate_typed_dicts(
+        type_annotations: Iterable[FakeAnnotation],
+    ) -> Iterator[TypeTypedDict]:
+        return iter(sorted(i for i in type_annotations if isinstance(i, TypeTypedDict)))
+
     def get_types(self) -> Set[FakeAnnotation]:
         types: Set[FakeAnnotation] = set()
         types.update(self.client.get_types())
@@ -183,8 +215,33 @@ class ServicePackage(Package):
 
         return ImportRecordGroup.from_import_records(import_records)
 
+    def use_shared_typed_dicts(self, names: Iterable[str]) -> None:
+        """
+        Import TypedDicts from shared module instead of defining them.
+
+        Arguments:
+            names -- Names of TypedDicts to move from `typed_dicts`.
+        """
+        names = set(names)
+        self.shared_typed_dicts.extend(i for i in self.typed_dicts if i.name in names)
+        self.typed_dicts = [i for i in self.typed_dicts if i.name not in names]
+
+    def get_type_defs_all_names(self) -> List[str]:
+        """
+        Get names of TypedDicts defined or re-exported by `type_defs` module.
+        """
+        result = [i.name for i in self.shared_typed_dicts]
+        result.extend(i.name for i in self.typed_dicts)
+        return result
+
     def get_type_defs_required_import_record_groups(self) -> List[ImportRecordGroup]:
         import_records: Set[ImportRecord] = set()
+        for typed_dict in self.shared_typed_dicts:
+            import_records.add(
+                ImportRecord(
+                    ImportString(SHARED_MODULE_NAME, TYPE_DEFS_NAME), typed_dict.name
+                )
+            )
         if self.typed_dicts:
             import_records.add(
                 ImportRecord(
@@ -2,9 +2,7 @@
 Boto3 ServiceResource.
 """
 from dataclasses import dataclass, field
-from typing import List, Set, Optional
-
-from boto3.resources.base import ServiceResource as Boto3ServiceResource
+from typing import List, Set
 
 from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
 from mypy_boto3_builder.import_helpers.import_string import ImportString
@@ -24,7 +22,6 @@ class ServiceResource(ClassRecord):
     name: str = "ServiceResource"
     alias_name: str = "ServiceResource"
     service_name: ServiceName = ServiceNameCatalog.ec2
-    boto3_service_resource: Optional[Boto3ServiceResource] = None
     collections: List[Collection] = field(default_factory=lambda: [])
     sub_resources: List[Resource] = field(default_factory=lambda: [])
     bases: List[FakeAnnotation] = field(
@@ -0,0 +1,62 @@
+"""
+Structure for TypedDicts shared by service packages.
+"""
+from dataclasses import dataclass, field
+from typing import Iterable, List, Set
+
+from mypy_boto3_builder.constants import SHARED_MODULE_NAME, SHARED_PYPI_NAME
+from mypy_boto3_builder.import_helpers.import_record import ImportRecord
+from mypy_boto3_builder.import_helpers.import_record_group import ImportRecordGroup
+from mypy_boto3_builder.import_helpers.import_string import ImportString
+from mypy_boto3_builder.structures.package import Package
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+
+@dataclass
+class SharedPackage(Package):
+    """
+    Structure for mypy-boto3-shared package.
+    """
+
+    name: str = SHARED_MODULE_NAME
+    pypi_name: str = SHARED_PYPI_NAME
+    typed_dicts: List[TypeTypedDict] = field(default_factory=lambda: [])
+
+    def add_typed_dicts(self, typed_dicts: Iterable[TypeTypedDict]) -> None:
+        """
+        Add TypedDicts that are not added yet.
+
+        Every service package lists dependencies before TypedDicts that use
+        them, so the order is kept when packages are added one by one.
+
+        Arguments:
+            typed_dicts -- Service package `shared_typed_dicts`.
+        """
+        names = {i.name for i in self.typed_dicts}
+        for typed_dict in typed_dicts:
+            if typed_dict.name in names:
+                continue
+            names.add(typed_dict.name)
+            self.typed_dicts.append(typed_dict)
+
+    def get_type_defs_required_import_record_groups(self) -> List[ImportRecordGroup]:
+        import_records: Set[ImportRecord] = set()
+        if self.typed_dicts:
+            import_records.add(
+                ImportRecord(
+                    ImportString("typing"),
+                    "TypedDict",
+                    min_version=(3, 8),
+                    fallback=ImportRecord(
+                        ImportString("typing_extensions"), "TypedDict"
+                    ),
+                )
+            )
+            for types_dict in self.typed_dicts:
+                for type_annotation in types_dict.get_children_types():
+                    import_record = type_annotation.get_import_record()
+                    if import_record.is_type_defs():
+                        continue
+                    import_records.add(import_record)
+
+        return ImportRecordGroup.from_import_records(import_records)
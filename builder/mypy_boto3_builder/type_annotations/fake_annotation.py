@@ -2,7 +2,7 @@
 Parent class for all type annotation wrappers.
 """
 from abc import abstractmethod
-from typing import Set, Any
+from typing import Any, Dict, Optional, Set, Tuple
 from functools import total_ordering
 
 from mypy_boto3_builder.import_helpers.import_record import ImportRecord
@@ -12,16 +12,29 @@ from mypy_boto3_builder.import_helpers.import_record import ImportRecord
 class FakeAnnotation:
     """
     Parent class for all type annotation wrappers.
+
+    Render output and hash are cached, so annotations have to be changed
+    only with `add_child`, `add_attribute` or `add_literal_child`,
+    or `reset_cache` has to be called after a change.
     """
 
+    _rendered: Optional[str] = None
+    _hash: Optional[int] = None
+    _cache_attributes: Tuple[str, ...] = ("_rendered", "_hash")
+
     def __hash__(self) -> int:
-        return hash(self.render())
+        if self._hash is None:
+            self._hash = hash(self.get_rendered())
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, FakeAnnotation):
             raise ValueError(f"Cannot compare FakeAnnotation with {other}")
 
-        return str(self) == str(other)
+        if self is other:
+            return True
+
+        return self.get_rendered() == other.get_rendered()
 
     def __ne__(self, other: Any) -> bool:
         if not isinstance(other, FakeAnnotation):
@@ -30,10 +43,31 @@ class FakeAnnotation:
         return not self == other
 
     def __gt__(self, other: "FakeAnnotation") -> bool:
-        return str(self) > str(other)
+        return self.get_rendered() > other.get_rendered()
 
     def __str__(self) -> str:
-        return self.render()
+        return self.get_rendered()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in self._cache_attributes:
+            state.pop(name, None)
+        return state
+
+    def get_rendered(self) -> str:
+        """
+        Get cached `render` output for local usage.
+        """
+        if self._rendered is None:
+            self._rendered = self.render()
+        return self._rendered
+
+    def reset_cache(self) -> None:
+        """
+        Reset cached render output and hash after a change.
+        """
+        for name in self._cache_attributes:
+            setattr(self, name, None)
 
     @abstractmethod
     def render(self, parent_name: str = "") -> str:
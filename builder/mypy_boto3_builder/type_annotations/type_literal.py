@@ -63,3 +63,4 @@ class TypeLiteral(FakeAnnotation):
         Add new child to `TypeLiteral` annotation.
         """
         self.children.append(child)
+        self.reset_cache()
@@ -23,9 +23,6 @@ class TypeSubscript(FakeAnnotation):
         self.parent = parent
         self.children = list(children)
 
-    def __hash__(self) -> int:
-        return hash(f"{self.parent}.{self.children}")
-
     def render(self, parent_name: str = "") -> str:
         """
         Render type annotation to a valid Python code for local usage.
@@ -53,6 +50,7 @@ class TypeSubscript(FakeAnnotation):
 
     def add_child(self, child: FakeAnnotation) -> None:
         self.children.append(child)
+        self.reset_cache()
 
     def is_dict(self) -> bool:
         return self.parent.is_dict()
@@ -1,7 +1,7 @@
 """
 Wrapper for `typing/typing_extensions.TypedDict` type annotations.
 """
-from typing import Iterable, Set, List
+from typing import Iterable, Set, List, Optional, Tuple
 
 from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
 from mypy_boto3_builder.import_helpers.import_record import ImportRecord
@@ -46,6 +46,13 @@ class TypeTypedDict(FakeAnnotation):
         docstring -- Docstring for render.
     """
 
+    _fingerprint: Optional[int] = None
+    _rendered_children: Optional[Tuple[str, ...]] = None
+    _cache_attributes: Tuple[str, ...] = FakeAnnotation._cache_attributes + (
+        "_fingerprint",
+        "_rendered_children",
+    )
+
     def __init__(
         self,
         name: str,
@@ -104,6 +111,7 @@ class TypeTypedDict(FakeAnnotation):
             required -- Whether argument has to be set.
         """
         self.children.append(TypedDictAttribute(name, type_annotation, required))
+        self.reset_cache()
 
     def is_dict(self) -> bool:
         """
@@ -162,10 +170,40 @@ class TypeTypedDict(FakeAnnotation):
         """
         return TypeTypedDict(self.name, list(self.children), docstring=self.docstring)
 
+    def get_rendered_children(self) -> Tuple[str, ...]:
+        """
+        Get cached rendered attributes.
+
+        Returns:
+            A tuple of rendered attributes.
+        """
+        if self._rendered_children is None:
+            self._rendered_children = tuple(i.render() for i in self.children)
+        return self._rendered_children
+
+    def get_fingerprint(self) -> int:
+        """
+        Get cached structural hash of rendered attributes.
+
+        Returns:
+            Hash that is equal for TypedDicts with the same attributes.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = hash(self.get_rendered_children())
+        return self._fingerprint
+
     def is_same(self, other: "TypeTypedDict") -> bool:
-        children = [i.render() for i in self.children]
-        other_children = [i.render() for i in other.children]
-        return other_children == children
+        """
+        Whether TypedDicts have the same attributes.
+
+        Fingerprints are compared first, rendered attributes are compared
+        only on fingerprint match to rule out hash collisions.
+        """
+        if self is other:
+            return True
+        if self.get_fingerprint() != other.get_fingerprint():
+            return False
+        return self.get_rendered_children() == other.get_rendered_children()
 
     def get_children_types(self) -> Set[FakeAnnotation]:
         result: Set[FakeAnnotation] = set()
@@ -15,7 +15,7 @@ from mypy_boto3_builder.type_maps.typed_dicts import (
 )
 
 
-__all__ = ("get_method_type_stub",)
+__all__ = ("get_method_type_stub", "has_method_type_stubs")
 
 
 ArgumentTypeMap = Dict[str, FakeAnnotation]
@@ -126,3 +126,24 @@ def get_method_type_stub(
     return _get_from_service_map(
         service_name, class_name, method_name, argument_name, TYPE_MAP
     )
+
+
+def has_method_type_stubs(
+    service_name: ServiceName, class_name: str, method_name: str
+) -> bool:
+    """
+    Whether method has stub types for any argument or return type.
+
+    Arguments:
+        service_name -- Service name.
+        class_name -- Parent class name.
+        method_name -- Method name.
+
+    Returns:
+        True if stub types exist.
+    """
+    class_type_map = TYPE_MAP.get(service_name, {})
+    for name in (class_name, "*"):
+        if method_name in class_type_map.get(name, {}):
+            return True
+    return False
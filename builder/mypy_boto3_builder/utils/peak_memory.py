@@ -0,0 +1,58 @@
+"""
+Peak resident memory of the current process.
+"""
+import sys
+from pathlib import Path
+
+
+__all__ = ("get_peak_rss", "reset_peak_rss")
+
+
+STATUS_PATH = Path("/proc/self/status")
+CLEAR_REFS_PATH = Path("/proc/self/clear_refs")
+
+# `clear_refs` value that resets peak RSS, see `man 5 proc`
+RESET_PEAK_RSS = "5"
+
+
+def reset_peak_rss() -> bool:
+    """
+    Reset peak RSS of the current process to its current RSS.
+
+    Supported only on Linux, elsewhere peak RSS covers the whole process lifetime.
+
+    Returns:
+        True if peak RSS is reset.
+    """
+    try:
+        CLEAR_REFS_PATH.write_text(RESET_PEAK_RSS, encoding="utf-8")
+    except OSError:
+        return False
+
+    return True
+
+
+def get_peak_rss() -> int:
+    """
+    Get peak RSS of the current process since the last `reset_peak_rss` call.
+
+    Returns:
+        Peak RSS in bytes, or 0 if it is unknown.
+    """
+    try:
+        for line in STATUS_PATH.read_text(encoding="utf-8").splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return 0
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # `ru_maxrss` is in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == "darwin":
+        return max_rss
+    return max_rss * 1024
@@ -0,0 +1,421 @@
+"""
+Process pool for parallel service modules generation.
+"""
+import gc
+import logging
+import multiprocessing
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from boto3.session import Session
+
+from mypy_boto3_builder.build_stats import BuildStats, StatsSnapshot
+from mypy_boto3_builder.constants import DUMMY_REGION, MODEL_TYPE_NAMES
+from mypy_boto3_builder.format_cache import FormatCache
+from mypy_boto3_builder.jinja_manager import JinjaManager
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.method_cache import MethodCache, MethodCacheEntries
+from mypy_boto3_builder.model_cache import ModelFileLoader
+from mypy_boto3_builder.package_cache import PackageCache
+from mypy_boto3_builder.parsers.boto3_utils import get_available_service_names
+from mypy_boto3_builder.parsers.docstring_parser.syntax_parser import SyntaxParser
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.shared_type_defs import SharedSignatures, TypedDictSignatures
+from mypy_boto3_builder.structures.shared_package import SharedPackage
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+from mypy_boto3_builder.writers.processors import (
+    collect_service_signatures,
+    process_service,
+)
+from mypy_boto3_builder.writers.utils import Formatter
+
+
+__all__ = (
+    "WorkerOptions",
+    "process_services_parallel",
+    "collect_services_signatures_parallel",
+)
+
+
+class RecordBufferHandler(logging.Handler):
+    """
+    Logging handler that keeps records to replay them in the main process.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Store a picklable copy of `record`.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+    def pop_records(self) -> List[logging.LogRecord]:
+        """
+        Get stored records and clear the buffer.
+        """
+        result = self.records
+        self.records = []
+        return result
+
+
+@dataclass
+class WorkerOptions:
+    """
+    Picklable options to initialize worker processes.
+
+    Arguments:
+        jinja_globals -- Global variables for `jinja2.Environment`.
+        package_cache -- Cache of parsed service packages.
+        ir_path -- Directory to export packages IR to.
+        docstrings -- Parse all client methods from docstrings.
+        shared_signatures -- TypedDicts to import from shared package.
+        model_cache_path -- Directory to cache decoded botocore models.
+        format_cache -- Cache of formatted modules.
+        verify_format -- Check emitted modules with `black`.
+        templates_cache_path -- Directory to cache compiled templates.
+        verify_syntax -- Check parsed syntax with pyparsing grammar.
+        level -- Logging level of the main process, set by `create_pool`.
+        panic -- Raise RuntimeError on warning, set by `create_pool`.
+        method_cache_entries -- Docstring parse results from the main process.
+        session -- Preloaded session inherited from the main process.
+        start_time -- Pool creation time, to measure worker startup.
+    """
+
+    jinja_globals: Dict[str, Any] = field(default_factory=dict)
+    package_cache: Optional[PackageCache] = None
+    ir_path: Optional[Path] = None
+    docstrings: bool = False
+    shared_signatures: Optional[SharedSignatures] = None
+    model_cache_path: Optional[Path] = None
+    format_cache: Optional[FormatCache] = None
+    verify_format: bool = False
+    templates_cache_path: Optional[Path] = None
+    verify_syntax: bool = False
+    level: int = logging.INFO
+    panic: bool = False
+    method_cache_entries: Optional[MethodCacheEntries] = None
+    session: Optional[Session] = None
+    start_time: Optional[float] = None
+
+
+# Error attribute with log records of a failed task
+LOG_RECORDS_ATTRIBUTE = "log_records"
+
+
+class WorkerState:
+    """
+    Per-process state of a worker.
+    """
+
+    session: Optional[Session] = None
+    options = WorkerOptions()
+    handler = RecordBufferHandler()
+
+
+def preload_session(session: Session) -> None:
+    """
+    Load data every worker needs before workers are forked.
+
+    Botocore endpoints, available services index and compiled templates
+    are inherited by forked workers instead of being loaded in each of them.
+
+    Arguments:
+        session -- boto3 session to share with workers.
+    """
+    session.get_available_services()
+    session._session.get_component(  # pylint: disable=protected-access
+        "endpoint_resolver"
+    )
+    for type_name in MODEL_TYPE_NAMES:
+        get_available_service_names(session, type_name)
+    JinjaManager.load_templates()
+
+
+def init_worker(options: WorkerOptions) -> None:
+    """
+    Initialize worker process with its own or inherited boto3 `Session`.
+
+    Arguments:
+        options -- Worker options.
+    """
+    logger = get_logger(panic=options.panic)
+    logger.handlers = [WorkerState.handler]
+    logger.set_level(options.level)
+    JinjaManager.update_globals(**options.jinja_globals)
+    if options.templates_cache_path:
+        JinjaManager.set_bytecode_cache(options.templates_cache_path)
+    WorkerState.session = options.session or Session(region_name=DUMMY_REGION)
+    if options.model_cache_path:
+        ModelFileLoader.install(WorkerState.session, options.model_cache_path)
+    WorkerState.options = options
+    # daemonic workers cannot use formatter pool of the main process
+    Formatter.pool = None
+    Formatter.cache = options.format_cache
+    Formatter.verify = options.verify_format
+    SyntaxParser.verify = options.verify_syntax
+    if options.method_cache_entries:
+        MethodCache.merge(options.method_cache_entries)
+    if options.start_time is not None:
+        BuildStats.add_time("workers_startup_time", time.time() - options.start_time)
+
+
+@contextmanager
+def attach_records() -> Iterator[None]:
+    """
+    Attach log records of a failed task to its error while in context.
+
+    Records are removed from the buffer, so they are not replayed
+    with the next task of this worker.
+    """
+    try:
+        yield
+    except Exception as e:
+        setattr(e, LOG_RECORDS_ATTRIBUTE, WorkerState.handler.pop_records())
+        raise
+
+
+def get_task_result(results: Iterator[Any]) -> Any:
+    """
+    Get the next task result from a pool and replay its log records.
+
+    Log records of a failed task are replayed before its error is re-raised.
+
+    Arguments:
+        results -- Results iterator from `Pool.imap`.
+
+    Returns:
+        Task result without log records.
+    """
+    logger = get_logger()
+    try:
+        records, *result = next(results)
+    except Exception as e:
+        for record in getattr(e, LOG_RECORDS_ATTRIBUTE, ()):
+            logger.handle(record)
+        raise
+    for record in records:
+        logger.handle(record)
+    return result
+
+
+def process_service_task(
+    task: Tuple[ServiceName, Path]
+) -> Tuple[
+    List[logging.LogRecord], StatsSnapshot, MethodCacheEntries, List[TypeTypedDict]
+]:
+    """
+    Generate one service module in a worker process.
+
+    Log records of a failed task are attached to its error by `attach_records`.
+
+    Arguments:
+        task -- Target service name and package output path.
+
+    Returns:
+        Log records emitted during generation, collected build stats,
+        new docstring parse results and TypedDicts imported from shared package.
+    """
+    service_name, output_path = task
+    if WorkerState.session is None:
+        raise RuntimeError("Worker is not initialized")
+
+    options = WorkerState.options
+    with attach_records():
+        service_package = process_service(
+            session=WorkerState.session,
+            service_name=service_name,
+            output_path=output_path,
+            package_cache=options.package_cache,
+            ir_path=options.ir_path,
+            docstrings=options.docstrings,
+            shared_signatures=options.shared_signatures,
+        )
+    return (
+        WorkerState.handler.pop_records(),
+        BuildStats.pop(),
+        MethodCache.pop_new(),
+        service_package.shared_typed_dicts,
+    )
+
+
+def collect_service_signatures_task(
+    service_name: ServiceName,
+) -> Tuple[
+    List[logging.LogRecord], StatsSnapshot, MethodCacheEntries, TypedDictSignatures
+]:
+    """
+    Parse one service module in a worker process and get its TypedDict signatures.
+
+    Arguments:
+        service_name -- Target service name.
+
+    Returns:
+        Log records emitted during parsing, collected build stats,
+        new docstring parse results and TypedDict signatures.
+    """
+    if WorkerState.session is None:
+        raise RuntimeError("Worker is not initialized")
+
+    with attach_records():
+        signatures = collect_service_signatures(
+            session=WorkerState.session,
+            service_name=service_name,
+            package_cache=WorkerState.options.package_cache,
+            docstrings=WorkerState.options.docstrings,
+        )
+    return (
+        WorkerState.handler.pop_records(),
+        BuildStats.pop(),
+        MethodCache.pop_new(),
+        signatures,
+    )
+
+
+def create_pool(
+    workers: int,
+    options: WorkerOptions,
+    session: Optional[Session] = None,
+    start_method: Optional[str] = None,
+) -> Any:
+    """
+    Create a pool of initialized worker processes.
+
+    With `fork` start method `session` is preloaded and shared with workers.
+    Objects of the main process are frozen by garbage collector while
+    workers are forked, so their pages stay shared copy-on-write.
+
+    Arguments:
+        workers -- Number of worker processes.
+        options -- Worker options.
+        session -- boto3 session of the main process.
+        start_method -- `multiprocessing` start method, platform default if not set.
+
+    Returns:
+        `multiprocessing.Pool` instance.
+    """
+    logger = get_logger()
+    context = multiprocessing.get_context(start_method)
+    is_fork = context.get_start_method() == "fork"
+    shared_session = session if is_fork else None
+    if shared_session:
+        preload_session(shared_session)
+
+    # gc.freeze is available since Python 3.7
+    can_freeze = is_fork and hasattr(gc, "freeze")
+    if can_freeze:
+        gc.collect()
+        gc.freeze()
+    try:
+        return context.Pool(
+            processes=workers,
+            initializer=init_worker,
+            initargs=(
+                replace(
+                    options,
+                    level=logger.level,
+                    panic=logger.panic,
+                    # forked workers already have main process method cache
+                    method_cache_entries=None if is_fork else dict(MethodCache.entries),
+                    session=shared_session,
+                    start_time=time.time(),
+                ),
+            ),
+        )
+    finally:
+        if can_freeze:
+            gc.unfreeze()
+
+
+def process_services_parallel(
+    service_names: Sequence[ServiceName],
+    output_path: Path,
+    workers: int,
+    options: WorkerOptions,
+    *,
+    shared_package: Optional[SharedPackage] = None,
+    session: Optional[Session] = None,
+    start_method: Optional[str] = None,
+) -> Iterator[ServiceName]:
+    """
+    Generate service modules in a pool of `workers` processes.
+
+    Log records of each service are replayed in `service_names` order,
+    so output does not depend on workers scheduling.
+    Workers share `MethodCache` entries with the main process.
+
+    Arguments:
+        service_names -- Target service names.
+        output_path -- Output path for all packages.
+        workers -- Number of worker processes.
+        options -- Worker options.
+        shared_package -- Shared package to collect imported TypedDicts to.
+        session -- boto3 session to share with forked workers.
+        start_method -- `multiprocessing` start method, platform default if not set.
+
+    Yields:
+        Service names of generated modules.
+    """
+    logger = get_logger()
+    tasks = [
+        (service_name, output_path / f"{service_name.module_name}_package")
+        for service_name in service_names
+    ]
+    with create_pool(workers, options, session, start_method) as pool:
+        results = iter(pool.imap(process_service_task, tasks))
+        for index, service_name in enumerate(service_names):
+            logger.info(
+                f"[{index + 1}/{len(service_names)}]"
+                f" Generating {service_name.module_name} module"
+            )
+            stats, method_cache_entries, shared_typed_dicts = get_task_result(results)
+            BuildStats.merge(stats)
+            MethodCache.merge(method_cache_entries)
+            if shared_package:
+                shared_package.add_typed_dicts(shared_typed_dicts)
+            yield service_name
+
+
+def collect_services_signatures_parallel(
+    service_names: Sequence[ServiceName],
+    workers: int,
+    options: WorkerOptions,
+    session: Optional[Session] = None,
+    start_method: Optional[str] = None,
+) -> List[TypedDictSignatures]:
+    """
+    Parse service modules in a pool of `workers` processes
+    and get their TypedDict signatures.
+
+    Arguments:
+        service_names -- Target service names.
+        workers -- Number of worker processes.
+        options -- Worker options.
+        session -- boto3 session to share with forked workers.
+        start_method -- `multiprocessing` start method, platform default if not set.
+
+    Returns:
+        TypedDict signatures for every service.
+    """
+    logger = get_logger()
+    service_signatures: List[TypedDictSignatures] = []
+    with create_pool(workers, options, session, start_method) as pool:
+        results = iter(pool.imap(collect_service_signatures_task, service_names))
+        for index, service_name in enumerate(service_names):
+            logger.info(
+                f"[{index + 1}/{len(service_names)}]"
+                f" Collecting {service_name.module_name} TypedDicts"
+            )
+            stats, method_cache_entries, signatures = get_task_result(results)
+            BuildStats.merge(stats)
+            MethodCache.merge(method_cache_entries)
+            service_signatures.append(signatures)
+    return service_signatures
@@ -10,7 +10,11 @@ from boto3 import __version__ as boto3_version
 
 from mypy_boto3_builder.structures.boto3_stubs_package import Boto3StubsPackage
 from mypy_boto3_builder.version import __version__ as version
-from mypy_boto3_builder.writers.utils import render_jinja2_template, blackify
+from mypy_boto3_builder.writers.utils import (
+    render_jinja2_template,
+    write_file,
+    Formatter,
+)
 from mypy_boto3_builder.constants import BOTO3_STUBS_STATIC_PATH
 
 
@@ -35,12 +39,14 @@ def write_boto3_stubs_package(
         (package_path / "version.py", module_templates_path / "version.py.jinja2"),
     ]
 
-    for file_path, template_path in file_paths:
-        content = render_jinja2_template(template_path, package=package)
-        content = blackify(content, file_path)
-        if not file_path.exists() or file_path.read_text() != content:
+    rendered_files = [
+        (file_path, render_jinja2_template(template_path, package=package))
+        for file_path, template_path in file_paths
+    ]
+    contents = Formatter.format_files(rendered_files)
+    for (file_path, _), content in zip(file_paths, contents):
+        if write_file(file_path, [content]):
             modified_paths.append(file_path)
-            file_path.write_text(content)
 
     for static_path in BOTO3_STUBS_STATIC_PATH.glob("**/*.pyi"):
         relative_output_path = static_path.relative_to(BOTO3_STUBS_STATIC_PATH)
@@ -0,0 +1,774 @@
+"""
+Per-statement `black` formatter for large modules.
+"""
+import json
+import re
+from bisect import bisect_right
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import black
+from blib2to3.pgen2.tokenize import TokenError
+
+from mypy_boto3_builder.constants import LINE_LENGTH
+from mypy_boto3_builder.format_cache import FormatCache
+
+
+__all__ = ("ChunkFormatter",)
+
+
+# Strings, comments, line continuations, brackets and newlines
+SCAN_RE = re.compile(
+    r"""
+    \"\"\"(?:\\.|[^\\])*?\"\"\"
+    |'''(?:\\.|[^\\])*?'''
+    |"(?:\\.|[^"\\\n])*"
+    |'(?:\\.|[^'\\\n])*'
+    |\#[^\n]*
+    |\\\n
+    |[()\[\]{}\n]
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+INDENT_RE = re.compile(r"[ \t\f]*")
+KEYWORD_RE = re.compile(r"(else|elif|except|finally|class)\b|@")
+CONTINUATION_KEYWORDS = {"else", "elif", "except", "finally"}
+
+# Top-level chunk body wrapper, indented chunks are formatted as its body
+WRAPPER = "class _:\n"
+
+# `ChunkLine` flags
+IS_COMMENT = 1
+IS_DECORATOR = 2
+IS_IMPORT = 4
+IS_CLASS = 8
+IS_DEF = 16
+IS_TRIPLE_QUOTED_STRING = 32
+
+
+@dataclass
+class Chunk:
+    """
+    Top-level statement or a statement of a top-level class body.
+
+    Arguments:
+        text -- Statement source with leading comments.
+        depth -- Indentation level.
+        newlines -- Empty lines before statement.
+    """
+
+    text: str
+    depth: int
+    newlines: int
+
+
+@dataclass
+class ChunkLine:
+    """
+    Formatted logical line with data used by `black.EmptyLineTracker`.
+
+    Arguments:
+        depth -- Indentation level.
+        flags -- Line kind flags.
+        newlines -- Empty lines before line in source.
+        text -- Line formatted by `black`.
+    """
+
+    depth: int
+    flags: int
+    newlines: int
+    text: str
+
+    @property
+    def leaves(self) -> Tuple["ChunkLine"]:
+        """
+        Line acts as its first leaf with empty lines prefix.
+        """
+        return (self,)
+
+    @property
+    def prefix(self) -> str:
+        """
+        Empty lines before line as a leaf prefix.
+        """
+        return "\n" * self.newlines
+
+    @prefix.setter
+    def prefix(self, value: str) -> None:
+        self.newlines = value.count("\n")
+
+    @property
+    def is_comment(self) -> bool:
+        return bool(self.flags & IS_COMMENT)
+
+    @property
+    def is_decorator(self) -> bool:
+        return bool(self.flags & IS_DECORATOR)
+
+    @property
+    def is_import(self) -> bool:
+        return bool(self.flags & IS_IMPORT)
+
+    @property
+    def is_class(self) -> bool:
+        return bool(self.flags & IS_CLASS)
+
+    @property
+    def is_def(self) -> bool:
+        return bool(self.flags & IS_DEF)
+
+    @property
+    def is_triple_quoted_string(self) -> bool:
+        return bool(self.flags & IS_TRIPLE_QUOTED_STRING)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get JSON-serializable line data.
+        """
+        return {
+            "depth": self.depth,
+            "flags": self.flags,
+            "newlines": self.newlines,
+            "text": self.text,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChunkLine":
+        """
+        Create line from `to_dict` output.
+
+        Arguments:
+            data -- Line data.
+
+        Returns:
+            A new ChunkLine.
+
+        Raises:
+            KeyError -- If a field is missing.
+            TypeError -- If `data` is not a dict.
+            ValueError -- If a field has a wrong type.
+        """
+        return cls(
+            depth=int(data["depth"]),
+            flags=int(data["flags"]),
+            newlines=int(data["newlines"]),
+            text=str(data["text"]),
+        )
+
+
+class BlackAdapter:
+    """
+    Single access point to `black` internals used by `ChunkFormatter`.
+
+    `black` has no public API to format separate lines, so parser,
+    `LineGenerator`, `split_line` and `EmptyLineTracker` are used directly.
+    Any failure, including internal API changes, is raised as `ValueError`,
+    so callers can fall back to `blackify`.
+
+    Arguments:
+        line_length -- Max line length.
+    """
+
+    def __init__(self, line_length: int) -> None:
+        self.line_length = line_length
+        self.remove_u_prefix = False
+        self.split_line_features: Set[Any] = set()
+
+    @staticmethod
+    @contextmanager
+    def _wrap_errors() -> Iterator[None]:
+        try:
+            yield
+        except (
+            AttributeError,
+            TypeError,
+            IndentationError,
+            TokenError,
+            black.InvalidInput,
+        ) as e:
+            raise ValueError(f"black failed: {e}") from e
+
+    def parse(self, source: str) -> Tuple[Any, Set[int]]:
+        """
+        Parse chunk source.
+
+        Arguments:
+            source -- Python code.
+
+        Returns:
+            Syntax tree and values of `black.Feature` used in it.
+
+        Raises:
+            ValueError -- If `source` cannot be parsed.
+        """
+        with self._wrap_errors():
+            node = black.lib2to3_parse(source)
+            features = {i.value for i in black.get_features_used(node)}
+        return node, features
+
+    def set_target(self, features: Set[int]) -> List[Any]:
+        """
+        Select target versions for features used in the whole module.
+
+        Arguments:
+            features -- Values of `black.Feature` used in module.
+
+        Returns:
+            JSON-serializable target key for cached lines.
+
+        Raises:
+            ValueError -- If `black` internals fail.
+        """
+        with self._wrap_errors():
+            used = {black.Feature(i) for i in features}
+            versions = {
+                version
+                for version in black.TargetVersion
+                if used <= black.VERSION_TO_FEATURES[version]
+            }
+            self.remove_u_prefix = black.supports_feature(
+                versions, black.Feature.UNICODE_LITERALS
+            )
+            self.split_line_features = {
+                feature
+                for feature in (
+                    black.Feature.TRAILING_COMMA_IN_CALL,
+                    black.Feature.TRAILING_COMMA_IN_DEF,
+                )
+                if black.supports_feature(versions, feature)
+            }
+        return [
+            self.remove_u_prefix,
+            sorted(i.value for i in self.split_line_features),
+        ]
+
+    @staticmethod
+    def _get_flags(line: black.Line) -> int:
+        result = 0
+        for flag, value in (
+            (IS_COMMENT, line.is_comment),
+            (IS_DECORATOR, line.is_decorator),
+            (IS_IMPORT, line.is_import),
+            (IS_CLASS, line.is_class),
+            (IS_DEF, line.is_def),
+            (IS_TRIPLE_QUOTED_STRING, line.is_triple_quoted_string),
+        ):
+            if value:
+                result |= flag
+        return result
+
+    def iter_lines(self, node: Any) -> Iterator[Tuple[int, ChunkLine]]:
+        """
+        Format parsed module or chunk to logical lines.
+
+        Arguments:
+            node -- Syntax tree from `parse`.
+
+        Yields:
+            Source line number, or 0 for standalone comments, and ChunkLine.
+
+        Raises:
+            ValueError -- If `black` internals fail.
+        """
+        with self._wrap_errors():
+            line_generator = black.LineGenerator(
+                remove_u_prefix=self.remove_u_prefix,
+                is_pyi=False,
+                normalize_strings=True,
+            )
+            for line in line_generator.visit(node):
+                newlines = 0
+                if line.leaves:
+                    newlines = line.leaves[0].prefix.count("\n")
+                    line.leaves[0].prefix = ""
+                line_number = next((i.lineno for i in line.leaves if i.lineno), 0)
+                text = "".join(
+                    str(i)
+                    for i in black.split_line(
+                        line,
+                        line_length=self.line_length,
+                        features=self.split_line_features,
+                    )
+                )
+                yield line_number, ChunkLine(
+                    depth=line.depth,
+                    flags=self._get_flags(line),
+                    newlines=newlines,
+                    text=text,
+                )
+
+    def get_lines(self, node: Any, depth: int) -> List[ChunkLine]:
+        """
+        Format parsed chunk to logical lines.
+
+        Arguments:
+            node -- Syntax tree from `parse`.
+            depth -- Chunk indentation level, wrapper line is skipped if set.
+
+        Returns:
+            A list of ChunkLine.
+
+        Raises:
+            ValueError -- If `black` internals fail.
+        """
+        result = [line for _, line in self.iter_lines(node)]
+        if depth:
+            result.pop(0)
+        return result
+
+    def join(self, lines: Sequence[ChunkLine]) -> str:
+        """
+        Join formatted lines with empty lines between them.
+
+        Arguments:
+            lines -- Formatted lines of all chunks.
+
+        Returns:
+            Formatted module.
+
+        Raises:
+            ValueError -- If `black` internals fail.
+        """
+        result: List[str] = []
+        after = 0
+        with self._wrap_errors():
+            tracker = black.EmptyLineTracker(is_pyi=False)
+            for line in lines:
+                result.append("\n" * after)
+                before, after = tracker.maybe_empty_lines(line)
+                result.append("\n" * before)
+                result.append(line.text)
+        return "".join(result)
+
+
+def iter_line_starts(content: str) -> Iterator[int]:
+    """
+    Iterate over offsets of physical lines that are not inside brackets or strings.
+
+    Arguments:
+        content -- Python code.
+
+    Yields:
+        Line start offset.
+
+    Raises:
+        ValueError -- If brackets are not balanced.
+    """
+    yield 0
+    depth = 0
+    for match in SCAN_RE.finditer(content):
+        char = match.group()[0]
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+            if depth < 0:
+                raise ValueError("Unbalanced brackets")
+        elif char == "\n" and not depth:
+            yield match.end()
+
+
+def consume_prefix(lines: Sequence[Tuple[int, int, bool]], column: int) -> int:
+    """
+    Get number of blank and comment lines that belong to a closed block.
+
+    The same as `blib2to3` driver on DEDENT: comments indented at least
+    at `column` stay in the block, with empty lines before them.
+
+    Arguments:
+        lines -- Offset, indent and is comment flag for each line.
+        column -- Indent of the outermost closed block.
+
+    Returns:
+        Number of lines.
+    """
+    result = 0
+    for index, (_, indent, is_comment) in enumerate(lines):
+        if not is_comment:
+            continue
+        if indent < column:
+            break
+        result = index + 1
+    return result
+
+
+def get_indent_end(content: str, offset: int) -> int:
+    """
+    Get offset of the first non-indent character of a physical line.
+
+    Arguments:
+        content -- Python code.
+        offset -- Line start offset.
+
+    Returns:
+        Indent end offset.
+
+    Raises:
+        ValueError -- If indent contains tabs.
+    """
+    result = INDENT_RE.match(content, offset).end()  # type: ignore
+    if content.count(" ", offset, result) != result - offset:
+        raise ValueError("Tabs in indentation")
+    return result
+
+
+def update_indents(indents: List[int], indent: int) -> List[int]:
+    """
+    Push or pop indentation levels for a statement line.
+
+    Arguments:
+        indents -- Stack of open block indents, updated in place.
+        indent -- Statement indent.
+
+    Returns:
+        Indents of closed blocks, innermost first.
+
+    Raises:
+        ValueError -- If dedent does not match any open block.
+    """
+    result: List[int] = []
+    if indent > indents[-1]:
+        indents.append(indent)
+    while indent < indents[-1]:
+        result.append(indents.pop())
+    if indent != indents[-1]:
+        raise ValueError("Inconsistent dedent")
+    return result
+
+
+def get_chunk_start(
+    leading: Sequence[Tuple[int, int, bool]], offset: int
+) -> Tuple[int, int]:
+    """
+    Get chunk start with leading comments and number of empty lines before it.
+
+    Arguments:
+        leading -- Offset, indent and is comment flag for lines before statement.
+        offset -- Statement offset.
+
+    Returns:
+        Chunk start offset and number of empty lines.
+    """
+    for index, (line_offset, _, is_comment) in enumerate(leading):
+        if is_comment:
+            return line_offset, index
+    return offset, len(leading)
+
+
+def split_chunks(content: str) -> List[Chunk]:
+    """
+    Split module to top-level statements and statements of top-level classes.
+
+    Arguments:
+        content -- Python code.
+
+    Returns:
+        A list of Chunk.
+
+    Raises:
+        ValueError -- If module cannot be split.
+    """
+    if "\r" in content:
+        raise ValueError("Unsupported line endings")
+
+    result: List[Chunk] = []
+    indents = [0]
+    pending: List[Tuple[int, int, bool]] = []
+    start = 0
+    depth = 0
+    newlines = 0
+    has_code = False
+    class_indent: Optional[int] = None
+    is_class = False
+    is_decorated = False
+    for offset in iter_line_starts(content):
+        indent_end = get_indent_end(content, offset)
+        indent = indent_end - offset
+        char = content[indent_end : indent_end + 1]
+        if char in ("\n", ""):
+            pending.append((offset, indent, False))
+            continue
+        if char == "#":
+            pending.append((offset, indent, True))
+            continue
+
+        popped = update_indents(indents, indent)
+        match = KEYWORD_RE.match(content, indent_end)
+        keyword = match.group() if match else ""
+        new_depth: Optional[int] = None
+        if keyword in CONTINUATION_KEYWORDS or is_decorated:
+            pass
+        elif not indent:
+            new_depth = 0
+            is_class = False
+        elif is_class and class_indent is None:
+            class_indent = indent
+        elif is_class and indent == class_indent:
+            new_depth = 1
+        elif is_class and indent < class_indent:  # type: ignore
+            raise ValueError("Inconsistent dedent")
+
+        if not indent and keyword == "class":
+            is_class = True
+            class_indent = None
+        is_decorated = keyword == "@"
+
+        if new_depth is None or not has_code:
+            has_code = True
+            pending = []
+            continue
+
+        consumed = consume_prefix(pending, popped[-1]) if popped else 0
+        leading = pending[consumed:]
+        chunk_end = leading[0][0] if leading else offset
+        result.append(Chunk(content[start:chunk_end], depth, newlines))
+        start, newlines = get_chunk_start(leading, offset)
+        depth = new_depth
+        pending = []
+
+    result.append(Chunk(content[start:], depth, newlines))
+    return result
+
+
+def group_lines(
+    lines: Sequence[Tuple[int, ChunkLine]], chunks: Sequence[Chunk]
+) -> List[List[ChunkLine]]:
+    """
+    Split formatted lines of a whole module to chunks.
+
+    Standalone comments have no line number, so the same as in `consume_prefix`
+    comments deeper than the next statement stay in the previous chunk.
+
+    Arguments:
+        lines -- Source line number and formatted line from `BlackAdapter.iter_lines`.
+        chunks -- Module chunks from `split_chunks`.
+
+    Returns:
+        Formatted lines for each chunk.
+
+    Raises:
+        ValueError -- If lines do not match chunks.
+    """
+    starts: List[int] = []
+    line_number = 1
+    for index, chunk in enumerate(chunks):
+        line_number += chunk.newlines
+        starts.append(line_number)
+        text = chunk.text if index else chunk.text.lstrip()
+        line_number += text.count("\n")
+
+    result: List[List[ChunkLine]] = [[] for _ in chunks]
+    pending: List[ChunkLine] = []
+    index = 0
+    for line_number, line in lines:
+        if not line_number:
+            pending.append(line)
+            continue
+        new_index = bisect_right(starts, line_number) - 1
+        if new_index < index:
+            raise ValueError("Lines do not match chunks")
+        consumed = 0
+        if new_index != index:
+            for position, comment in enumerate(pending):
+                if comment.depth > line.depth:
+                    consumed = position + 1
+        result[index].extend(pending[:consumed])
+        result[new_index].extend(pending[consumed:])
+        result[new_index].append(line)
+        index = new_index
+        pending = []
+
+    result[index].extend(pending)
+    if not all(result):
+        raise ValueError("Lines do not match chunks")
+    return result
+
+
+class ChunkFormatter:
+    """
+    Formatter that runs `black` on module chunks and stitches results.
+
+    Module is split to top-level statements, and top-level class bodies
+    are split to statements. Each chunk is formatted by `black` separately
+    and formatted lines are cached by chunk source hash, so only changed
+    chunks are formatted again. Empty lines between chunks are restored
+    by `black.EmptyLineTracker`, so output is the same as for a whole module.
+
+    Chunk index saved for `file_path` marks that its chunks are cached.
+    Without it the module is formatted as a whole and its lines are cached
+    per chunk, so cold builds are as fast as with `black`.
+
+    Arguments:
+        cache -- Cache for formatted chunks.
+        file_path -- Target file path.
+        line_length -- Max line length.
+    """
+
+    def __init__(
+        self, cache: FormatCache, file_path: Path, line_length: int = LINE_LENGTH
+    ) -> None:
+        self.cache = cache
+        self.file_path = file_path
+        self.line_length = line_length
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def is_supported(content: str, file_path: Path) -> bool:
+        """
+        Check if module can be formatted per chunk.
+
+        Arguments:
+            content -- Python code.
+            file_path -- Target file path.
+
+        Returns:
+            True if chunks are formatted the same way as a whole module.
+        """
+        if file_path.suffix != ".py":
+            return False
+        if not content.strip():
+            return False
+        for marker in ("fmt:", "yapf:", "__future__"):
+            if marker in content:
+                return False
+        return True
+
+    @staticmethod
+    def _get_source(chunk: Chunk) -> str:
+        if chunk.depth:
+            return f"{WRAPPER}{chunk.text}"
+        return chunk.text.lstrip()
+
+    def _get_key(self, source: str) -> str:
+        return self.cache.get_key(
+            source, self.file_path, "chunk", f"line_length={self.line_length}"
+        )
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        data = self.cache.load(key)
+        if data is None:
+            return None
+        try:
+            result = json.loads(data)
+            result["features"] = {int(i) for i in result["features"]}
+            result["lines"] = [ChunkLine.from_dict(i) for i in result["lines"]]
+            result["target"] = list(result["target"])
+        except (ValueError, KeyError, TypeError):
+            return None
+        return result
+
+    def _save(
+        self, key: str, features: Set[int], target: List[Any], lines: List[ChunkLine]
+    ) -> None:
+        data = {
+            "features": sorted(features),
+            "target": target,
+            "lines": [i.to_dict() for i in lines],
+        }
+        self.cache.save(key, json.dumps(data))
+
+    def _get_index_key(self) -> str:
+        return self.cache.get_key(
+            self.file_path.as_posix(),
+            self.file_path,
+            "chunk_index",
+            f"line_length={self.line_length}",
+        )
+
+    def format(self, content: str) -> Optional[str]:
+        """
+        Format module per chunk.
+
+        Module at `file_path` that has no chunk index yet is formatted as a whole,
+        that is faster than per chunk with empty cache, and formatted lines
+        fill chunk cache for the next build.
+
+        Arguments:
+            content -- Python code.
+
+        Returns:
+            Formatted code or None if module cannot be split or `black` fails.
+        """
+        index_key = self._get_index_key()
+        try:
+            chunks = split_chunks(content)
+            if self.cache.load(index_key) is None:
+                result, keys = self._format_module(content, chunks)
+            else:
+                result, keys = self._format_chunks(chunks)
+        except ValueError:
+            return None
+
+        if keys:
+            self.cache.save(index_key, json.dumps(keys))
+        return result
+
+    @staticmethod
+    def _stitch(
+        chunks: Sequence[Chunk], chunks_lines: Sequence[List[ChunkLine]]
+    ) -> List[ChunkLine]:
+        result: List[ChunkLine] = []
+        for chunk, lines in zip(chunks, chunks_lines):
+            if not lines:
+                continue
+            result.append(replace(lines[0], newlines=chunk.newlines))
+            result.extend(replace(i) for i in lines[1:])
+        return result
+
+    def _format_module(
+        self, content: str, chunks: Sequence[Chunk]
+    ) -> Tuple[str, List[str]]:
+        adapter = BlackAdapter(self.line_length)
+        node, features = adapter.parse(content.lstrip())
+        target = adapter.set_target(features)
+        numbered_lines = list(adapter.iter_lines(node))
+        self.misses += len(chunks)
+        result = adapter.join([replace(line) for _, line in numbered_lines])
+
+        # per chunk features are known only if module uses none
+        if features:
+            return result, []
+        try:
+            chunks_lines = group_lines(numbered_lines, chunks)
+        except ValueError:
+            return result, []
+        if adapter.join(self._stitch(chunks, chunks_lines)) != result:
+            return result, []
+
+        keys = [self._get_key(self._get_source(chunk)) for chunk in chunks]
+        for key, lines in zip(keys, chunks_lines):
+            self._save(key, set(), target, lines)
+        return result, keys
+
+    def _format_chunks(self, chunks: Sequence[Chunk]) -> Tuple[str, List[str]]:
+        adapter = BlackAdapter(self.line_length)
+        sources = [self._get_source(chunk) for chunk in chunks]
+        keys = [self._get_key(i) for i in sources]
+        entries = [self._load(key) for key in keys]
+        parsed: Dict[int, Tuple[Any, Set[int]]] = {}
+        features: Set[int] = set()
+        for index, entry in enumerate(entries):
+            if entry is None:
+                parsed[index] = adapter.parse(sources[index])
+                features.update(parsed[index][1])
+            else:
+                features.update(entry["features"])
+
+        target = adapter.set_target(features)
+        chunks_lines: List[List[ChunkLine]] = []
+        for index, chunk in enumerate(chunks):
+            entry = entries[index]
+            if entry is not None and entry["target"] == target:
+                self.hits += 1
+                chunks_lines.append(entry["lines"])
+                continue
+            self.misses += 1
+            node, chunk_features = parsed.get(index) or adapter.parse(sources[index])
+            lines = adapter.get_lines(node, chunk.depth)
+            self._save(keys[index], chunk_features, target, lines)
+            chunks_lines.append(lines)
+
+        return adapter.join(self._stitch(chunks, chunks_lines)), keys
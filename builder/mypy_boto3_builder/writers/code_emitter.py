@@ -0,0 +1,463 @@
+"""
+Emitter of generated modules in `black` code style.
+"""
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from mypy_boto3_builder.constants import LINE_LENGTH
+from mypy_boto3_builder.import_helpers.import_record import ImportRecord
+from mypy_boto3_builder.import_helpers.import_record_group import ImportRecordGroup
+from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_annotations.type_typed_dict import (
+    TypeTypedDict,
+    TypedDictAttribute,
+)
+
+
+__all__ = (
+    "CodeEmitter",
+    "CodeNode",
+    "iter_type_defs",
+    "render_import_record_groups",
+)
+
+
+INDENT = "    "
+
+# Statement kinds that affect empty lines between statements
+IMPORT = "import"
+CLASS = "class"
+COMMENT = "comment"
+STATEMENT = "statement"
+
+
+def render_constant(value: Any) -> str:
+    """
+    Render constant the same way as `black` normalizes its `repr`.
+
+    Double quotes are preferred for strings unless they need more escaping.
+
+    Arguments:
+        value -- Constant value.
+
+    Returns:
+        A string with Python code.
+    """
+    result = repr(value)
+    if not isinstance(value, str) or result.startswith('"'):
+        return result
+    if value.count('"') > value.count("'"):
+        return result
+
+    body = result[1:-1].replace("\\'", "'").replace('"', '\\"')
+    return f'"{body}"'
+
+
+class CodeNode:
+    """
+    Code that ends with an optional bracketed list of comma-separated items.
+
+    Arguments:
+        code -- Code before brackets.
+        items -- Items inside brackets.
+        brackets -- Opening and closing brackets, empty for code without items.
+        explode -- Whether split items are put one per line even if they fit.
+    """
+
+    def __init__(
+        self,
+        code: str,
+        items: Sequence["CodeNode"] = (),
+        brackets: str = "",
+        explode: bool = False,
+    ) -> None:
+        self.code = code
+        self.items = list(items)
+        self.brackets = brackets
+        self.explode = explode
+
+    def render(self) -> str:
+        """
+        Render node to one line.
+        """
+        if not self.brackets:
+            return self.code
+
+        items = ", ".join(i.render() for i in self.items)
+        return f"{self.code}{self.brackets[0]}{items}{self.brackets[1]}"
+
+
+def get_annotation_node(
+    annotation: FakeAnnotation, parent_name: str, prefix: str = ""
+) -> CodeNode:
+    """
+    Get code node for a type annotation, so subscript children can be split.
+
+    Arguments:
+        annotation -- Type annotation.
+        parent_name -- Name of TypedDict that contains annotation.
+        prefix -- Code before annotation.
+
+    Returns:
+        A code node.
+    """
+    if isinstance(annotation, TypeLiteral):
+        items = [CodeNode(render_constant(i)) for i in annotation.children]
+        return CodeNode(f"{prefix}Literal", items, "[]")
+
+    if isinstance(annotation, TypeSubscript) and annotation.children:
+        items = [get_annotation_node(i, parent_name) for i in annotation.children]
+        return CodeNode(f"{prefix}{annotation.parent.render()}", items, "[]")
+
+    return CodeNode(f"{prefix}{annotation.render(parent_name)}")
+
+
+class CodeEmitter:
+    """
+    Emitter of module code in `black` code style.
+
+    Only fixed layouts of generated statements are supported: import groups,
+    `__all__` tuple and functional `TypedDict` definitions. Statement is
+    emitted in one line if it fits, otherwise its brackets are split the same
+    way as `black` does it, so output does not have to be formatted.
+
+    There is no fallback to `black` for emitted code. Tests check emitted
+    modules against `black`, and `--verify-format` does it on build.
+
+    Arguments:
+        line_length -- Max line length.
+        docstring -- Whether output follows a module docstring.
+    """
+
+    def __init__(self, line_length: int = LINE_LENGTH, docstring: bool = False) -> None:
+        self.line_length = line_length
+        self._chunks: List[str] = []
+        self._previous: Optional[Tuple[str, int]] = None
+        if docstring:
+            self._previous = (STATEMENT, 0)
+        self._class_depths: List[int] = []
+
+    def add_statement(
+        self, node: CodeNode, depth: int = 0, empty_lines: int = 0, suffix: str = ""
+    ) -> None:
+        """
+        Add a statement split to fit line length.
+
+        Arguments:
+            node -- Statement code node.
+            depth -- Indentation level.
+            empty_lines -- Number of empty lines before statement in source code.
+            suffix -- Code after node, e.g. colon of compound statement header.
+        """
+        self._add_lines(
+            self._get_kind(node.code),
+            self._split(node, depth, suffix),
+            depth,
+            empty_lines,
+        )
+
+    def add_line(self, code: str, depth: int = 0, empty_lines: int = 0) -> None:
+        """
+        Add a statement that is never split.
+
+        Arguments:
+            code -- One-line Python statement, comment or compound statement header.
+            depth -- Indentation level.
+            empty_lines -- Number of empty lines before statement in source code.
+        """
+        self._add_lines(
+            self._get_kind(code), [f"{INDENT * depth}{code}"], depth, empty_lines
+        )
+
+    def _add_lines(
+        self, kind: str, lines: Iterable[str], depth: int, empty_lines: int
+    ) -> None:
+        self._chunks.append("\n" * self._get_empty_lines(kind, depth, empty_lines))
+        for line in lines:
+            self._chunks.append(f"{line}\n")
+
+    @staticmethod
+    def _get_kind(code: str) -> str:
+        if code.startswith(("import ", "from ")):
+            return IMPORT
+        if code.startswith("class "):
+            return CLASS
+        if code.startswith("#"):
+            return COMMENT
+        return STATEMENT
+
+    def _get_empty_lines(self, kind: str, depth: int, empty_lines: int) -> int:
+        before = min(empty_lines, 1 if depth else 2)
+        while self._class_depths and self._class_depths[-1] >= depth:
+            self._class_depths.pop()
+            before = 1 if depth else 2
+
+        previous = self._previous
+        self._previous = (kind, depth)
+        if kind == CLASS:
+            self._class_depths.append(depth)
+        if previous is None:
+            return 0
+
+        previous_kind, previous_depth = previous
+        if kind == CLASS:
+            if previous_kind == CLASS and previous_depth < depth:
+                return 0
+            if previous_kind == COMMENT and previous_depth == depth and not before:
+                return 0
+            return 1 if depth else 2
+        if previous_kind == IMPORT and kind != IMPORT and previous_depth == depth:
+            return before or 1
+        return before
+
+    def _split(self, node: CodeNode, depth: int, suffix: str) -> Iterator[str]:
+        line = f"{INDENT * depth}{node.render()}{suffix}"
+        if len(line) <= self.line_length or not node.items:
+            yield line
+            return
+
+        yield f"{INDENT * depth}{node.code}{node.brackets[0]}"
+        yield from self._split_items(node.items, depth + 1, node.explode)
+        yield f"{INDENT * depth}{node.brackets[1]}{suffix}"
+
+    def _split_items(
+        self, items: Sequence[CodeNode], depth: int, explode: bool
+    ) -> Iterator[str]:
+        if len(items) == 1:
+            yield from self._split(items[0], depth, "")
+            return
+
+        line = INDENT * depth + ", ".join(i.render() for i in items)
+        if not explode and len(line) <= self.line_length:
+            yield line
+            return
+
+        for item in items:
+            yield from self._split(item, depth, ",")
+
+    def add_import(self, source: str, names: Sequence[str], depth: int = 0) -> None:
+        """
+        Add `from ... import ...` statement, split one name per line if it is too long.
+
+        Arguments:
+            source -- Import source.
+            names -- Imported names with optional aliases.
+            depth -- Indentation level.
+        """
+        indent = INDENT * depth
+        line = f"{indent}from {source} import {', '.join(names)}"
+        lines = [line]
+        if len(line) > self.line_length:
+            lines = [
+                f"{indent}from {source} import (",
+                *(f"{indent}{INDENT}{name}," for name in names),
+                f"{indent})",
+            ]
+        self._add_lines(IMPORT, lines, depth, 0)
+
+    def add_import_record(self, import_record: ImportRecord, depth: int = 0) -> None:
+        """
+        Add import statement with a fallback for older Python versions.
+
+        Arguments:
+            import_record -- Import record to render.
+            depth -- Indentation level.
+        """
+        if import_record.fallback:
+            self.add_line(f"if sys.version_info >= {import_record.min_version}:", depth)
+            self.add_import_record_statement(import_record, depth + 1)
+            self.add_line("else:", depth)
+            self.add_import_record_statement(import_record.fallback, depth + 1)
+            return
+
+        self.add_import_record_statement(import_record, depth)
+
+    def add_import_record_statement(
+        self, import_record: ImportRecord, depth: int = 0
+    ) -> None:
+        """
+        Add import statement, local scope imports are used only for type checking.
+
+        Arguments:
+            import_record -- Import record to render.
+            depth -- Indentation level.
+        """
+        if import_record.alias and import_record.alias.endswith("_scope"):
+            self.add_line("# pylint: disable=import-self", depth)
+            self.add_line("if TYPE_CHECKING:", depth)
+            self._add_import_record_line(import_record, depth + 1)
+            self.add_line("else:", depth)
+            self.add_line(f"{import_record.alias} = object", depth + 1)
+            return
+
+        self._add_import_record_line(import_record, depth)
+
+    def _add_import_record_line(self, import_record: ImportRecord, depth: int) -> None:
+        if not import_record.name:
+            self.add_line(import_record.render(), depth)
+            return
+
+        name = import_record.name
+        if import_record.alias:
+            name = f"{name} as {import_record.alias}"
+        self.add_import(str(import_record.source), [name], depth)
+
+    def add_import_record_groups(
+        self, import_record_groups: Iterable[ImportRecordGroup]
+    ) -> None:
+        """
+        Add import statements for import record groups.
+
+        Arguments:
+            import_record_groups -- Groups of import records.
+        """
+        for import_record_group in import_record_groups:
+            if len(import_record_group.import_records) == 1:
+                self.add_import_record(import_record_group.import_records[0])
+                continue
+
+            names = []
+            for import_record in import_record_group.import_records:
+                if import_record.alias:
+                    names.append(f"{import_record.name} as {import_record.alias}")
+                else:
+                    names.append(import_record.name)
+            self.add_import(str(import_record_group.source), names)
+
+    def add_names(self, names: Sequence[str], empty_lines: int = 2) -> None:
+        """
+        Add `__all__` statement.
+
+        Arguments:
+            names -- Exported names.
+            empty_lines -- Number of empty lines before statement.
+        """
+        if len(names) == 1:
+            self.add_line(f'__all__ = ("{names[0]}",)', empty_lines=empty_lines)
+            return
+
+        items = [CodeNode(f'"{name}"') for name in names]
+        self.add_statement(
+            CodeNode("__all__ = ", items, "()", explode=True), empty_lines=empty_lines
+        )
+
+    @staticmethod
+    def _get_typed_dict_node(
+        name: str,
+        attributes: Sequence[TypedDictAttribute],
+        parent_name: str,
+        total: bool,
+    ) -> CodeNode:
+        items = [
+            get_annotation_node(i.type_annotation, parent_name, f'"{i.name}": ')
+            for i in attributes
+        ]
+        arguments = [CodeNode(f'"{name}"'), CodeNode("", items, "{}", explode=True)]
+        if not total:
+            arguments.append(CodeNode("total=False"))
+        return CodeNode(f"{name} = TypedDict", arguments, "()")
+
+    def add_typed_dict(self, typed_dict: TypeTypedDict, empty_lines: int = 1) -> None:
+        """
+        Add functional `TypedDict` definition.
+
+        `TypedDict` with both required and optional keys is defined as a class
+        based on required and optional parts.
+
+        Arguments:
+            typed_dict -- TypedDict to define.
+            empty_lines -- Number of empty lines before definition.
+        """
+        name = typed_dict.name
+        if not typed_dict.has_both():
+            self.add_statement(
+                self._get_typed_dict_node(
+                    name, typed_dict.children, name, not typed_dict.has_optional()
+                ),
+                empty_lines=empty_lines,
+            )
+            return
+
+        required_name = f"_Required{name}"
+        optional_name = f"_Optional{name}"
+        self.add_statement(
+            self._get_typed_dict_node(
+                required_name, typed_dict.get_required(), name, True
+            ),
+            empty_lines=empty_lines,
+        )
+        self.add_statement(
+            self._get_typed_dict_node(
+                optional_name, typed_dict.get_optional(), name, False
+            )
+        )
+        self.add_statement(
+            CodeNode(
+                f"class {name}",
+                [CodeNode(required_name), CodeNode(optional_name)],
+                "()",
+            ),
+            suffix=":",
+        )
+        self.add_line("pass", depth=1)
+
+    def render(self) -> str:
+        """
+        Get emitted code.
+        """
+        return "".join(self._chunks)
+
+    def pop(self) -> str:
+        """
+        Get code emitted since the last `pop` call and release it.
+
+        Empty lines between statements are still tracked, so joined
+        results are the same as `render` output.
+        """
+        result = "".join(self._chunks)
+        self._chunks.clear()
+        return result
+
+
+def render_import_record_groups(
+    import_record_groups: Iterable[ImportRecordGroup],
+) -> str:
+    """
+    Render import statements for import record groups.
+
+    Arguments:
+        import_record_groups -- Groups of import records.
+
+    Returns:
+        Formatted code.
+    """
+    emitter = CodeEmitter()
+    emitter.add_import_record_groups(import_record_groups)
+    return emitter.render()
+
+
+def iter_type_defs(
+    import_record_groups: Iterable[ImportRecordGroup],
+    names: Sequence[str],
+    typed_dicts: Iterable[TypeTypedDict],
+) -> Iterator[str]:
+    """
+    Render type definitions module code that follows module docstring
+    one TypedDict at a time.
+
+    Arguments:
+        import_record_groups -- Required import record groups.
+        names -- Names to export in `__all__`.
+        typed_dicts -- TypedDicts to define.
+
+    Yields:
+        Formatted code parts.
+    """
+    emitter = CodeEmitter(docstring=True)
+    emitter.add_import_record_groups(import_record_groups)
+    emitter.add_names(names)
+    yield emitter.pop()
+    for typed_dict in typed_dicts:
+        emitter.add_typed_dict(typed_dict)
+        yield emitter.pop()
@@ -6,7 +6,11 @@ from typing import List
 
 from mypy_boto3_builder.structures.master_package import MasterPackage
 from mypy_boto3_builder.version import __version__ as version
-from mypy_boto3_builder.writers.utils import render_jinja2_template, blackify
+from mypy_boto3_builder.writers.utils import (
+    render_jinja2_template,
+    write_file,
+    Formatter,
+)
 
 
 def write_master_package(package: MasterPackage, output_path: Path) -> List[Path]:
@@ -40,12 +44,13 @@ def write_master_package(package: MasterPackage, output_path: Path) -> List[Path
         ),
     ]
 
-    for file_path, template_path in file_paths:
-        content = render_jinja2_template(template_path, package=package)
-        content = blackify(content, file_path)
-
-        if not file_path.exists() or file_path.read_text() != content:
+    rendered_files = [
+        (file_path, render_jinja2_template(template_path, package=package))
+        for file_path, template_path in file_paths
+    ]
+    contents = Formatter.format_files(rendered_files)
+    for (file_path, _), content in zip(file_paths, contents):
+        if write_file(file_path, [content]):
             modified_paths.append(file_path)
-            file_path.write_text(content)
 
     return modified_paths
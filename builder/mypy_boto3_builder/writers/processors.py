@@ -2,41 +2,59 @@
 Processors for parsing and writing modules.
 """
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional, Sequence
 
 from boto3.session import Session
 
 from mypy_boto3_builder.version import __version__ as version
+from mypy_boto3_builder.build_stats import BuildStats
+from mypy_boto3_builder.constants import SHARED_PACKAGE_DIR_NAME
+from mypy_boto3_builder.ir import write_ir
 from mypy_boto3_builder.parsers.master_package import parse_master_package
 from mypy_boto3_builder.parsers.service_package import parse_service_package
 from mypy_boto3_builder.structures.boto3_stubs_package import Boto3StubsPackage
 from mypy_boto3_builder.structures.master_package import MasterPackage
+from mypy_boto3_builder.structures.package import Package
 from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.structures.shared_package import SharedPackage
+from mypy_boto3_builder.shared_type_defs import (
+    SharedSignatures,
+    TypedDictSignatures,
+    get_shared_names,
+    get_typed_dict_signatures,
+)
 from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.utils.peak_memory import get_peak_rss, reset_peak_rss
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.package_cache import PackageCache
 from mypy_boto3_builder.writers.boto3_stubs_package import write_boto3_stubs_package
 from mypy_boto3_builder.writers.master_package import write_master_package
 from mypy_boto3_builder.writers.service_package import write_service_package
+from mypy_boto3_builder.writers.shared_package import write_shared_package
 
 
 logger = get_logger()
 
 
 def process_boto3_stubs(
-    output_path: Path, service_names: List[ServiceName]
+    output_path: Path, service_names: List[ServiceName], ir_path: Optional[Path] = None,
 ) -> Boto3StubsPackage:
     """
     Parse and write stubs package `boto3_stubs`.
 
     Arguments:
         output_path -- Package output path.
+        service_names -- List of known service names.
+        ir_path -- Directory to export package IR to.
 
     Return:
         Parsed Boto3StubsPackage.
     """
     logger.debug(f"Parsing boto3 stubs")
     boto3_stub_package = Boto3StubsPackage(service_names=service_names)
+    if ir_path:
+        write_ir(ir_path, boto3_stub_package)
     logger.debug(f"Writing boto3 stubs to {NicePath(output_path)}")
 
     modified_paths = write_boto3_stubs_package(boto3_stub_package, output_path)
@@ -47,7 +65,11 @@ def process_boto3_stubs(
 
 
 def process_master(
-    session: Session, output_path: Path, service_names: List[ServiceName]
+    session: Session,
+    output_path: Path,
+    service_names: List[ServiceName],
+    ir_path: Optional[Path] = None,
+    catalogue_path: Optional[Path] = None,
 ) -> MasterPackage:
     """
     Parse and write master package `mypy_boto3`.
@@ -55,12 +77,17 @@ def process_master(
     Arguments:
         session -- boto3 session.
         output_path -- Package output path.
+        service_names -- List of known service names.
+        ir_path -- Directory to export package IR to.
+        catalogue_path -- Service catalogue cache file path.
 
     Return:
         Parsed MasterPackage.
     """
     logger.debug(f"Parsing master")
-    master_package = parse_master_package(session, service_names)
+    master_package = parse_master_package(session, service_names, catalogue_path)
+    if ir_path:
+        write_ir(ir_path, master_package)
     logger.debug(f"Writing master to {NicePath(output_path)}")
 
     modified_paths = write_master_package(master_package, output_path)
@@ -70,26 +97,256 @@ def process_master(
     return master_package
 
 
+def parse_service(
+    session: Session,
+    service_name: ServiceName,
+    package_cache: Optional[PackageCache] = None,
+    docstrings: bool = False,
+) -> ServicePackage:
+    """
+    Parse service package `mypy_boto3_*` or load it from cache.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- Target service name.
+        package_cache -- Cache of parsed service packages.
+        docstrings -- Parse all client methods from docstrings.
+
+    Return:
+        Parsed ServicePackage.
+    """
+    service_module: Optional[ServicePackage] = None
+    cache_key = ""
+    if package_cache:
+        cache_key = package_cache.get_key(session, service_name)
+        service_module = package_cache.load(service_name, cache_key)
+        if service_module:
+            logger.debug(f"Loaded cached {service_name.boto3_name}")
+
+    if service_module is None:
+        logger.debug(f"Parsing {service_name.boto3_name}")
+        with BuildStats.measure("parse_time"):
+            service_module = parse_service_package(session, service_name, docstrings)
+        if package_cache:
+            package_cache.save(service_name, cache_key, service_module)
+
+    return service_module
+
+
+def collect_service_signatures(
+    session: Session,
+    service_name: ServiceName,
+    package_cache: Optional[PackageCache] = None,
+    docstrings: bool = False,
+) -> TypedDictSignatures:
+    """
+    Parse service package and get its TypedDict signatures.
+
+    Parsed package is saved to `package_cache` to write it without parsing.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- Target service name.
+        package_cache -- Cache of parsed service packages.
+        docstrings -- Parse all client methods from docstrings.
+
+    Return:
+        Service TypedDict signatures.
+    """
+    service_module = parse_service(session, service_name, package_cache, docstrings)
+    return get_typed_dict_signatures(service_module.typed_dicts)
+
+
 def process_service(
-    session: Session, service_name: ServiceName, output_path: Path
+    session: Session,
+    service_name: ServiceName,
+    output_path: Path,
+    *,
+    package_cache: Optional[PackageCache] = None,
+    ir_path: Optional[Path] = None,
+    docstrings: bool = False,
+    shared_signatures: Optional[SharedSignatures] = None,
 ) -> ServicePackage:
     """
     Parse and write service package `mypy_boto3_*`.
 
+    Peak RSS of the process while service is processed is logged.
+
     Arguments:
         session -- boto3 session.
         service_name -- Target service name.
         output_path -- Package output path.
+        package_cache -- Cache of parsed service packages.
+        ir_path -- Directory to export package IR to.
+        docstrings -- Parse all client methods from docstrings.
+        shared_signatures -- TypedDicts to import from shared package.
 
     Return:
         Parsed ServicePackage.
     """
-    logger.debug(f"Parsing {service_name.boto3_name}")
-    service_module = parse_service_package(session, service_name)
+    reset_peak_rss()
+    service_module = parse_service(session, service_name, package_cache, docstrings)
+    if shared_signatures:
+        service_module.use_shared_typed_dicts(
+            get_shared_names(
+                get_typed_dict_signatures(service_module.typed_dicts),
+                shared_signatures,
+            )
+        )
+
+    if ir_path:
+        write_ir(ir_path, service_module)
+
     logger.debug(f"Writing {service_name.boto3_name} to {NicePath(output_path)}")
 
-    modified_paths = write_service_package(service_module, output_path)
+    with BuildStats.measure("write_time"):
+        modified_paths = write_service_package(service_module, output_path)
     for modified_path in modified_paths:
         logger.debug(f"Updated {NicePath(modified_path)}")
 
+    peak_rss = get_peak_rss()
+    if peak_rss:
+        logger.debug(
+            f"Peak RSS for {service_name.boto3_name}: {peak_rss / 1024 / 1024:.1f} MB"
+        )
+
     return service_module
+
+
+def collect_services_signatures(
+    session: Session,
+    service_names: Sequence[ServiceName],
+    package_cache: Optional[PackageCache] = None,
+    docstrings: bool = False,
+) -> List[TypedDictSignatures]:
+    """
+    Parse service packages one by one and get their TypedDict signatures.
+
+    Arguments:
+        session -- boto3 session.
+        service_names -- Target service names.
+        package_cache -- Cache of parsed service packages.
+        docstrings -- Parse all client methods from docstrings.
+
+    Returns:
+        TypedDict signatures for every service.
+    """
+    result: List[TypedDictSignatures] = []
+    for index, service_name in enumerate(service_names):
+        logger.info(
+            f"[{index + 1}/{len(service_names)}] Collecting {service_name.module_name} TypedDicts"
+        )
+        result.append(
+            collect_service_signatures(
+                session=session,
+                service_name=service_name,
+                package_cache=package_cache,
+                docstrings=docstrings,
+            )
+        )
+    return result
+
+
+def process_services(
+    session: Session,
+    service_names: Sequence[ServiceName],
+    output_path: Path,
+    *,
+    package_cache: Optional[PackageCache] = None,
+    ir_path: Optional[Path] = None,
+    docstrings: bool = False,
+    shared_signatures: Optional[SharedSignatures] = None,
+    shared_package: Optional[SharedPackage] = None,
+) -> Iterator[ServiceName]:
+    """
+    Parse and write service packages one by one.
+
+    Arguments:
+        session -- boto3 session.
+        service_names -- Target service names.
+        output_path -- Output path for all packages.
+        package_cache -- Cache of parsed service packages.
+        ir_path -- Directory to export packages IR to.
+        docstrings -- Parse all client methods from docstrings.
+        shared_signatures -- TypedDicts to import from shared package.
+        shared_package -- Shared package to collect imported TypedDicts to.
+
+    Yields:
+        Service names of generated modules.
+    """
+    for index, service_name in enumerate(service_names):
+        logger.info(
+            f"[{index + 1}/{len(service_names)}] Generating {service_name.module_name} module"
+        )
+        service_package = process_service(
+            session=session,
+            service_name=service_name,
+            output_path=output_path / f"{service_name.module_name}_package",
+            package_cache=package_cache,
+            ir_path=ir_path,
+            docstrings=docstrings,
+            shared_signatures=shared_signatures,
+        )
+        if shared_package:
+            shared_package.add_typed_dicts(service_package.shared_typed_dicts)
+        yield service_name
+
+
+def process_shared(
+    shared_package: SharedPackage, output_path: Path, ir_path: Optional[Path] = None,
+) -> SharedPackage:
+    """
+    Write shared TypedDicts package `mypy_boto3_shared`.
+
+    Arguments:
+        shared_package -- Package with TypedDicts collected from service packages.
+        output_path -- Package output path.
+        ir_path -- Directory to export package IR to.
+
+    Return:
+        Written SharedPackage.
+    """
+    if ir_path:
+        write_ir(ir_path, shared_package)
+    logger.debug(f"Writing shared TypedDicts to {NicePath(output_path)}")
+
+    modified_paths = write_shared_package(shared_package, output_path)
+    for modified_path in modified_paths:
+        logger.debug(f"Updated {NicePath(modified_path)}")
+
+    return shared_package
+
+
+def process_ir_package(package: Package, output_path: Path) -> Path:
+    """
+    Write package loaded from IR without parsing.
+
+    Arguments:
+        package -- Package loaded from IR.
+        output_path -- Output path for all packages.
+
+    Return:
+        Package output path.
+
+    Raises:
+        ValueError -- If package type is not supported.
+    """
+    if isinstance(package, ServicePackage):
+        package_path = output_path / f"{package.service_name.module_name}_package"
+        modified_paths = write_service_package(package, package_path)
+    elif isinstance(package, MasterPackage):
+        package_path = output_path / "master_package"
+        modified_paths = write_master_package(package, package_path)
+    elif isinstance(package, Boto3StubsPackage):
+        package_path = output_path / "boto3_stubs_package"
+        modified_paths = write_boto3_stubs_package(package, package_path)
+    elif isinstance(package, SharedPackage):
+        package_path = output_path / SHARED_PACKAGE_DIR_NAME
+        modified_paths = write_shared_package(package, package_path)
+    else:
+        raise ValueError(f"Unsupported package {package.name}")
+
+    for modified_path in modified_paths:
+        logger.debug(f"Updated {NicePath(modified_path)}")
+
+    return package_path
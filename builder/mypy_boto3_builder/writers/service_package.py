@@ -7,8 +7,10 @@ from typing import List
 from mypy_boto3_builder.structures.service_package import ServicePackage
 from mypy_boto3_builder.version import __version__ as version
 from mypy_boto3_builder.writers.utils import (
+    generate_jinja2_template,
     render_jinja2_template,
-    blackify,
+    write_file,
+    Formatter,
 )
 from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
 
@@ -56,7 +58,7 @@ def write_service_package(package: ServicePackage, output_path: Path) -> List[Pa
                 module_templates_path / ServiceModuleName.waiter.template_name,
             )
         )
-    if package.typed_dicts:
+    if package.typed_dicts or package.shared_typed_dicts:
         file_paths.append(
             (
                 package_path / ServiceModuleName.type_defs.file_name,
@@ -64,14 +66,31 @@ def write_service_package(package: ServicePackage, output_path: Path) -> List[Pa
             )
         )
 
+    formatted_paths = {package_path / ServiceModuleName.type_defs.file_name}
+    # already formatted modules are streamed to disk without keeping them in memory
+    streamed_paths = set() if Formatter.verify else formatted_paths
     for file_path, template_path in file_paths:
-        content = render_jinja2_template(
+        if file_path not in streamed_paths:
+            continue
+        parts = generate_jinja2_template(
             template_path, package=package, service_name=package.service_name,
         )
-        content = blackify(content, file_path)
+        if write_file(file_path, parts):
+            modified_paths.append(file_path)
 
-        if not file_path.exists() or file_path.read_text() != content:
+    rendered_files = [
+        (
+            file_path,
+            render_jinja2_template(
+                template_path, package=package, service_name=package.service_name,
+            ),
+        )
+        for file_path, template_path in file_paths
+        if file_path not in streamed_paths
+    ]
+    contents = Formatter.format_files(rendered_files, formatted_paths)
+    for (file_path, _), content in zip(rendered_files, contents):
+        if write_file(file_path, [content]):
             modified_paths.append(file_path)
-            file_path.write_text(content)
 
     return modified_paths
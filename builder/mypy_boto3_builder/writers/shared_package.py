@@ -0,0 +1,61 @@
+"""
+Shared TypedDicts package writer.
+"""
+from pathlib import Path
+from typing import List
+
+from mypy_boto3_builder.constants import TYPE_DEFS_NAME
+from mypy_boto3_builder.structures.shared_package import SharedPackage
+from mypy_boto3_builder.writers.utils import (
+    generate_jinja2_template,
+    render_jinja2_template,
+    write_file,
+    Formatter,
+)
+
+
+def write_shared_package(package: SharedPackage, output_path: Path) -> List[Path]:
+    modified_paths: List[Path] = []
+    package_path = output_path / package.name
+
+    output_path.mkdir(exist_ok=True)
+    package_path.mkdir(exist_ok=True)
+
+    templates_path = Path("shared")
+    module_templates_path = templates_path / "shared"
+    file_paths = [
+        (output_path / "setup.py", templates_path / "setup.py.jinja2"),
+        (output_path / "README.md", templates_path / "README.md.jinja2"),
+        (package_path / "__init__.py", module_templates_path / "__init__.py.jinja2"),
+        (package_path / "py.typed", module_templates_path / "py.typed.jinja2"),
+        (package_path / "version.py", module_templates_path / "version.py.jinja2"),
+    ]
+    if package.typed_dicts:
+        file_paths.append(
+            (
+                package_path / f"{TYPE_DEFS_NAME}.py",
+                module_templates_path / f"{TYPE_DEFS_NAME}.py.jinja2",
+            )
+        )
+
+    formatted_paths = {package_path / f"{TYPE_DEFS_NAME}.py"}
+    # already formatted modules are streamed to disk without keeping them in memory
+    streamed_paths = set() if Formatter.verify else formatted_paths
+    for file_path, template_path in file_paths:
+        if file_path not in streamed_paths:
+            continue
+        parts = generate_jinja2_template(template_path, package=package)
+        if write_file(file_path, parts):
+            modified_paths.append(file_path)
+
+    rendered_files = [
+        (file_path, render_jinja2_template(template_path, package=package))
+        for file_path, template_path in file_paths
+        if file_path not in streamed_paths
+    ]
+    contents = Formatter.format_files(rendered_files, formatted_paths)
+    for (file_path, _), content in zip(rendered_files, contents):
+        if write_file(file_path, [content]):
+            modified_paths.append(file_path)
+
+    return modified_paths
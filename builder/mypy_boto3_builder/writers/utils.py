@@ -1,16 +1,40 @@
 """
-Jinja2 renderer and black formatter.
+Jinja2 renderer, black formatter and file writer.
 """
+import hashlib
+import multiprocessing
+import os
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import black
 from black import NothingChanged, InvalidInput
+from jinja2 import TemplateNotFound
 
-from mypy_boto3_builder.constants import TEMPLATES_PATH, LINE_LENGTH
+from mypy_boto3_builder.build_stats import BuildStats
+from mypy_boto3_builder.constants import (
+    CHUNK_FORMAT_SIZE,
+    LINE_LENGTH,
+    WRITE_BLOCK_SIZE,
+)
+from mypy_boto3_builder.format_cache import FormatCache
+from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.package import Package
 from mypy_boto3_builder.jinja_manager import JinjaManager
+from mypy_boto3_builder.writers.chunk_formatter import ChunkFormatter
 
 
 def blackify(content: str, file_path: Path, fast: bool = True) -> str:
@@ -47,6 +71,215 @@ def blackify(content: str, file_path: Path, fast: bool = True) -> str:
     return content
 
 
+def blackify_chunks(
+    content: str, file_path: Path, cache: FormatCache
+) -> Tuple[str, int, int]:
+    """
+    Format `content` with `black` per statement, reusing cached statements.
+
+    Falls back to `blackify` if `content` cannot be split or `black` internals fail.
+
+    Arguments:
+        content -- Python code to format.
+        file_path -- Target file path.
+        cache -- Cache for formatted statements.
+
+    Returns:
+        Formatted python code, numbers of cached and formatted statements.
+    """
+    formatter = ChunkFormatter(cache, file_path)
+    result = formatter.format(content)
+    if result is None:
+        return blackify(content, file_path), 0, 0
+
+    return result, formatter.hits, formatter.misses
+
+
+class Formatter:
+    """
+    Formatting stage for rendered files.
+
+    Formatted content is looked up in `cache` by unformatted content hash.
+    Other files are formatted with `black` in `pool` if it is started,
+    otherwise in the current process. Worker processes cannot start
+    a pool of their own, so they format files in place.
+
+    Files rendered by `CodeEmitter` are already formatted and skip `black`,
+    unless `verify` is set. Cache misses larger than `CHUNK_FORMAT_SIZE`
+    are formatted per statement if they were formatted before,
+    so only changed statements are formatted.
+    """
+
+    cache: Optional[FormatCache] = None
+    pool: Optional[Any] = None
+    verify = False
+
+    @classmethod
+    @contextmanager
+    def start_pool(cls, workers: int) -> Iterator[None]:
+        """
+        Start a pool of `workers` processes to format files while in context.
+
+        Pool is not started if `workers` is less than 2.
+
+        Arguments:
+            workers -- Number of formatter processes.
+        """
+        if workers < 2:
+            yield
+            return
+
+        with multiprocessing.Pool(processes=workers) as pool:
+            cls.pool = pool
+            try:
+                yield
+                pool.close()
+                pool.join()
+            finally:
+                cls.pool = None
+
+    @classmethod
+    def format_files(
+        cls, files: Sequence[Tuple[Path, str]], formatted_paths: Collection[Path] = ()
+    ) -> List[str]:
+        """
+        Format rendered files with `black`.
+
+        If `verify` is set, already formatted files and files formatted
+        per statement are checked with `black` and replaced with `black`
+        output on mismatch.
+
+        Arguments:
+            files -- Target file paths and rendered contents.
+            formatted_paths -- Paths of files that are already formatted.
+
+        Returns:
+            Formatted contents in the same order.
+        """
+        with BuildStats.measure("format_time"):
+            result = [content for _, content in files]
+            cache_keys: Dict[int, str] = {}
+            tasks: Dict[int, Tuple[str, Path]] = {}
+            chunk_tasks: Dict[int, Tuple[str, Path, FormatCache]] = {}
+            for index, (file_path, content) in enumerate(files):
+                if file_path.suffix not in (".py", ".pyi"):
+                    continue
+                if file_path in formatted_paths and not cls.verify:
+                    continue
+                if cls.cache:
+                    cache_keys[index] = cls.cache.get_key(content, file_path)
+                    cached_content = cls._load_cached(cache_keys[index])
+                    if cached_content is not None:
+                        result[index] = cached_content
+                        continue
+                    if file_path not in formatted_paths and cls._is_chunked(
+                        content, file_path
+                    ):
+                        chunk_tasks[index] = (content, file_path, cls.cache)
+                        continue
+                tasks[index] = (content, file_path)
+
+            formatted_contents = cls._format_tasks(tasks, chunk_tasks)
+            for index, content in formatted_contents.items():
+                file_path = files[index][0]
+                is_emitted = file_path in formatted_paths
+                if cls.verify and (is_emitted or index in chunk_tasks):
+                    content = cls._verify_content(
+                        file_path, result[index], content, is_emitted=is_emitted,
+                    )
+                result[index] = content
+                if cls.cache:
+                    cls.cache.save(cache_keys[index], content)
+
+        return result
+
+    @classmethod
+    def _load_cached(cls, key: str) -> Optional[str]:
+        if cls.cache is None:
+            return None
+        cached_content = cls.cache.load(key)
+        if cached_content is None:
+            BuildStats.increment("format_cache_misses")
+        else:
+            BuildStats.increment("format_cache_hits")
+        return cached_content
+
+    @staticmethod
+    def _is_chunked(content: str, file_path: Path) -> bool:
+        return len(content) >= CHUNK_FORMAT_SIZE and ChunkFormatter.is_supported(
+            content, file_path
+        )
+
+    @classmethod
+    def _format_tasks(
+        cls,
+        tasks: Dict[int, Tuple[str, Path]],
+        chunk_tasks: Dict[int, Tuple[str, Path, FormatCache]],
+    ) -> Dict[int, str]:
+        """
+        Format whole files and files per statement, in `pool` if it is started.
+
+        Returns:
+            Formatted contents by file index.
+        """
+        chunk_formatted: List[Tuple[str, int, int]] = []
+        if cls.pool and len(tasks) + len(chunk_tasks) > 1:
+            if chunk_tasks:
+                chunk_results = cls.pool.starmap_async(
+                    blackify_chunks, chunk_tasks.values(), chunksize=1
+                )
+            formatted = cls.pool.starmap(blackify, tasks.values(), chunksize=1)
+            if chunk_tasks:
+                chunk_formatted = chunk_results.get()
+        else:
+            formatted = [blackify(*task) for task in tasks.values()]
+            chunk_formatted = [blackify_chunks(*task) for task in chunk_tasks.values()]
+
+        formatted_contents = dict(zip(tasks, formatted))
+        for index, (content, hits, misses) in zip(chunk_tasks, chunk_formatted):
+            BuildStats.increment("format_chunk_hits", hits)
+            BuildStats.increment("format_chunk_misses", misses)
+            formatted_contents[index] = content
+        return formatted_contents
+
+    @staticmethod
+    def _verify_content(
+        file_path: Path, content: str, formatted: str, is_emitted: bool
+    ) -> str:
+        """
+        Check emitted or per statement formatted content against `black` output.
+
+        Arguments:
+            file_path -- Target file path.
+            content -- Unformatted content.
+            formatted -- Formatted content, `black` output for emitted files.
+            is_emitted -- Whether `content` is rendered by `CodeEmitter`.
+
+        Returns:
+            `black` output.
+        """
+        if is_emitted:
+            if content != formatted:
+                get_logger().warning(
+                    f"Emitted code in {file_path} differs from black output"
+                )
+            return formatted
+
+        black_content = blackify(content, file_path)
+        if formatted != black_content:
+            get_logger().warning(
+                f"Chunked formatting of {file_path} differs from black output"
+            )
+        return black_content
+
+
+def _get_template(template_path: Path) -> Any:
+    try:
+        return JinjaManager.get_environment().get_template(template_path.as_posix())
+    except TemplateNotFound as e:
+        raise ValueError(f"Template {template_path} not found") from e
+
+
 def render_jinja2_template(
     template_path: Path,
     package: Optional[Package] = None,
@@ -62,10 +295,104 @@ def render_jinja2_template(
 
     Returns:
         A rendered template.
+
+    Raises:
+        ValueError -- If template does not exist.
+    """
+    template = _get_template(template_path)
+    with BuildStats.measure("render_time"):
+        return template.render(package=package, service_name=service_name)
+
+
+def generate_jinja2_template(
+    template_path: Path,
+    package: Optional[Package] = None,
+    service_name: Optional[ServiceName] = None,
+) -> Iterator[str]:
+    """
+    Render Jinja2 template part by part, so it is never kept in memory as a whole.
+
+    Only time spent on rendering is added to `render_time`.
+
+    Arguments:
+        template_path -- Relative path to template in `TEMPLATES_PATH`
+        module -- Module record.
+        service_name -- ServiceName instance.
+
+    Yields:
+        Rendered template parts.
+
+    Raises:
+        ValueError -- If template does not exist.
+    """
+    template = _get_template(template_path)
+    parts = template.generate(package=package, service_name=service_name)
+    while True:
+        start = time.perf_counter()
+        part = next(parts, None)
+        BuildStats.add_time("render_time", time.perf_counter() - start)
+        if part is None:
+            return
+        yield part
+
+
+def get_file_hash(file_path: Path) -> Optional[str]:
+    """
+    Get SHA256 hash of `file_path` content, reading it in blocks.
+
+    Arguments:
+        file_path -- File path.
+
+    Returns:
+        Hex digest or None if file does not exist.
+    """
+    hasher = hashlib.sha256()
+    try:
+        with file_path.open("rb") as f:
+            for block in iter(lambda: f.read(WRITE_BLOCK_SIZE), b""):
+                hasher.update(block)
+    except FileNotFoundError:
+        return None
+
+    return hasher.hexdigest()
+
+
+def write_file(file_path: Path, parts: Iterable[str]) -> bool:
+    """
+    Write content `parts` to `file_path` if content is changed.
+
+    Content is hashed while it is written to a temporary file, and replaces
+    existing file only if size or hash is different. Neither new
+    nor existing content is loaded to memory as a whole.
+
+    Arguments:
+        file_path -- Target file path.
+        parts -- Content parts.
+
+    Returns:
+        True if file is created or updated.
     """
-    template_full_path = TEMPLATES_PATH / template_path
-    if not template_full_path.exists():
-        raise ValueError(f"Template {template_path} not found")
+    temp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        with temp_path.open("wb") as f:
+            for part in parts:
+                data = part.encode()
+                hasher.update(data)
+                f.write(data)
+                size += len(data)
+        if (
+            file_path.exists()
+            and file_path.stat().st_size == size
+            and get_file_hash(file_path) == hasher.hexdigest()
+        ):
+            temp_path.unlink()
+            return False
+    except BaseException:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
 
-    template = JinjaManager.get_environment().get_template(template_path.as_posix())
-    return template.render(package=package, service_name=service_name)
+    os.replace(temp_path.as_posix(), file_path.as_posix())
+    return True
@@ -0,0 +1,54 @@
+"""
+Measure type annotations hashing, comparison and sorting on a parsed service package.
+
+Usage: PYTHONPATH=builder python scripts/benchmark_annotations.py [service_name] [rounds]
+"""
+import sys
+import time
+from typing import Callable
+
+from boto3.session import Session
+
+from mypy_boto3_builder.constants import DUMMY_REGION
+from mypy_boto3_builder.parsers.service_package import parse_service_package
+from mypy_boto3_builder.service_name import ServiceNameCatalog
+
+
+def measure(name: str, func: Callable[[], object], rounds: int) -> None:
+    start = time.perf_counter()
+    func()
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    average = (time.perf_counter() - start) / rounds
+    print(f"{name}: first {first * 1000:.1f}ms, average {average * 1000:.1f}ms")
+
+
+def main() -> None:
+    service_name = ServiceNameCatalog.find(sys.argv[1] if len(sys.argv) > 1 else "ec2")
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    session = Session(region_name=DUMMY_REGION)
+
+    start = time.perf_counter()
+    package = parse_service_package(session, service_name)
+    print(f"parse_service_package: {time.perf_counter() - start:.2f}s")
+
+    types = package.get_types()
+    print(f"{len(types)} types, {len(package.typed_dicts)} typed dicts")
+    measure("get_types", package.get_types, rounds)
+    measure("sorted", lambda: sorted(types), rounds)
+    measure(
+        "extract_typed_dicts",
+        lambda: package.extract_typed_dicts(package.get_types(), {}),
+        rounds,
+    )
+    measure(
+        "get_required_import_records",
+        lambda: package.client.get_required_import_records(),
+        rounds,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compare boto3 client construction with model-only client class construction.
+
+Usage: PYTHONPATH=builder python scripts/benchmark_client_class.py [service_name ...]
+"""
+import sys
+import time
+from typing import Callable, List
+
+from boto3.session import Session
+
+from mypy_boto3_builder.constants import DUMMY_REGION
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_client_class
+from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
+
+
+def measure(
+    name: str,
+    func: Callable[[Session, ServiceName], object],
+    service_names: List[ServiceName],
+) -> None:
+    # new session for every run, so loader cache is cold for both
+    session = Session(region_name=DUMMY_REGION)
+    start = time.perf_counter()
+    for service_name in service_names:
+        func(session, service_name)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    for service_name in service_names:
+        func(session, service_name)
+    warm = time.perf_counter() - start
+    print(
+        f"{name}: {len(service_names)} services,"
+        f" cold {cold:.2f}s, warm {warm:.2f}s,"
+        f" warm average {warm / len(service_names) * 1000:.1f}ms"
+    )
+
+
+def create_client(session: Session, service_name: ServiceName) -> object:
+    return session.client(service_name.boto3_name)  # type: ignore
+
+
+def main() -> None:
+    session = Session(region_name=DUMMY_REGION)
+    if len(sys.argv) > 1:
+        service_names = [ServiceNameCatalog.find(i) for i in sys.argv[1:]]
+    else:
+        available_services = session.get_available_services()
+        service_names = [
+            i for i in ServiceNameCatalog.ITEMS if i.boto3_name in available_services
+        ]
+
+    measure("client class", get_boto3_client_class, service_names)
+    measure("client", create_client, service_names)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Compare type definitions module rendering by CodeEmitter with black formatting.
+
+Usage: PYTHONPATH=builder python scripts/benchmark_code_emitter.py [service_name]
+"""
+import sys
+import time
+from pathlib import Path
+
+from boto3.session import Session
+
+from mypy_boto3_builder.constants import DUMMY_REGION, MODULE_NAME
+from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
+from mypy_boto3_builder.jinja_manager import JinjaManager
+from mypy_boto3_builder.parsers.service_package import parse_service_package
+from mypy_boto3_builder.service_name import ServiceNameCatalog
+from mypy_boto3_builder.writers.utils import blackify, render_jinja2_template
+
+
+def main() -> None:
+    service_name = ServiceNameCatalog.find(sys.argv[1] if len(sys.argv) > 1 else "ec2")
+    session = Session(region_name=DUMMY_REGION)
+    JinjaManager.update_globals(master_module_name=MODULE_NAME)
+    package = parse_service_package(session, service_name)
+    print(f"{len(package.typed_dicts)} typed dicts")
+
+    template_path = Path("service/service") / ServiceModuleName.type_defs.template_name
+    start = time.perf_counter()
+    content = render_jinja2_template(template_path, package=package)
+    print(f"CodeEmitter: {time.perf_counter() - start:.2f}s, {len(content)} chars")
+
+    start = time.perf_counter()
+    formatted = blackify(content, Path("type_defs.py"))
+    print(f"black: {time.perf_counter() - start:.2f}s")
+    print("identical" if formatted == content else "different")
+
+
+if __name__ == "__main__":
+    main()
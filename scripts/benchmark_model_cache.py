@@ -0,0 +1,56 @@
+"""
+Compare botocore model loading with and without compiled model cache.
+
+Usage: PYTHONPATH=builder python scripts/benchmark_model_cache.py [service_name ...]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from boto3.session import Session
+
+from mypy_boto3_builder.build_stats import BuildStats
+from mypy_boto3_builder.constants import DUMMY_REGION
+from mypy_boto3_builder.model_cache import ModelFileLoader
+from mypy_boto3_builder.parsers.boto3_utils import has_service_model
+from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
+
+TYPE_NAMES = ("service-2", "waiters-2", "paginators-1", "resources-1")
+
+
+def measure(name: str, service_names: List[ServiceName], path: Optional[Path]) -> None:
+    # new session for every run, so loader cache is cold
+    session = Session(region_name=DUMMY_REGION)
+    if path:
+        ModelFileLoader.install(session, path)
+    loader = session._loader  # pylint: disable=protected-access
+    start = time.perf_counter()
+    for service_name in service_names:
+        for type_name in TYPE_NAMES:
+            if has_service_model(session, service_name, type_name):
+                loader.load_service_model(service_name.boto3_name, type_name)
+    stats = ", ".join(f"{k} {v}" for k, v in sorted(BuildStats.pop()[0].items()))
+    print(f"{name}: {time.perf_counter() - start:.2f}s {stats}")
+
+
+def main() -> None:
+    session = Session(region_name=DUMMY_REGION)
+    available_services = session.get_available_services()
+    if len(sys.argv) > 1:
+        service_names = [ServiceNameCatalog.find(i) for i in sys.argv[1:]]
+    else:
+        service_names = [
+            i for i in ServiceNameCatalog.ITEMS if i.boto3_name in available_services
+        ]
+    print(f"{len(service_names)} services")
+
+    measure("JSON", service_names, None)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        measure("cold cache", service_names, Path(temp_dir))
+        measure("warm cache", service_names, Path(temp_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Compare `SyntaxParser` with pyparsing `SyntaxGrammar` on botocore docstrings.
+
+Usage: PYTHONPATH=builder python scripts/benchmark_syntax_parser.py [service_name ...]
+"""
+import inspect
+import sys
+import textwrap
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from boto3.session import Session
+from pyparsing import ParseException, ParserElement
+
+from mypy_boto3_builder.constants import DUMMY_REGION
+from mypy_boto3_builder.parsers.docstring_parser.syntax_grammar import SyntaxGrammar
+from mypy_boto3_builder.parsers.docstring_parser.syntax_parser import (
+    SyntaxParser,
+    SyntaxParserError,
+)
+from mypy_boto3_builder.utils.strings import get_line_with_indented
+
+DEFAULT_SERVICE_NAMES = ("s3", "ec2", "dynamodb", "iam", "sqs", "lambda")
+
+
+def get_syntax_strings(docstring: str, header: str) -> List[str]:
+    if header not in docstring:
+        return []
+    index = docstring.index(header)
+    while index > 0 and docstring[index - 1] == " ":
+        index -= 1
+    return [get_line_with_indented(docstring[index:], True)]
+
+
+def get_docstrings(session: Session, service_name: str) -> List[str]:
+    result: List[str] = []
+    objects: List[Any] = [session.client(service_name)]
+    if service_name in session.get_available_resources():
+        objects.append(session.resource(service_name))
+    for obj in objects:
+        for name, member in inspect.getmembers(obj):
+            if name.startswith("_") or not inspect.ismethod(member):
+                continue
+            result.append(textwrap.dedent(inspect.getdoc(member) or ""))
+    return result
+
+
+def parse_grammar(element: ParserElement, text: str) -> Any:
+    SyntaxGrammar.reset()
+    SyntaxGrammar.enable_packrat()
+    try:
+        return element.parseString(text).asDict()
+    except ParseException:
+        return None
+
+
+def parse_linear(parse: Callable[[str], Dict[str, Any]], text: str) -> Any:
+    try:
+        return parse(text)
+    except SyntaxParserError:
+        return None
+
+
+def measure(func: Callable[[str], Any], texts: List[str]) -> Tuple[List[Any], float]:
+    start = time.perf_counter()
+    result = [func(text) for text in texts]
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    session = Session(region_name=DUMMY_REGION)
+    service_names = sys.argv[1:] or DEFAULT_SERVICE_NAMES
+    total_grammar = 0.0
+    total_linear = 0.0
+    total_mismatches = 0
+    for service_name in service_names:
+        docstrings = get_docstrings(session, service_name)
+        mismatches = 0
+        grammar_time = 0.0
+        linear_time = 0.0
+        for header, element, parse in (
+            (
+                "**Request Syntax**",
+                SyntaxGrammar.request_syntax,
+                SyntaxParser.parse_request_syntax,
+            ),
+            (
+                "**Response Syntax**",
+                SyntaxGrammar.response_syntax,
+                SyntaxParser.parse_response_syntax,
+            ),
+        ):
+            texts = [i for d in docstrings for i in get_syntax_strings(d, header)]
+            expected, seconds = measure(
+                lambda text: parse_grammar(element, text), texts
+            )
+            grammar_time += seconds
+            actual, seconds = measure(lambda text: parse_linear(parse, text), texts)
+            linear_time += seconds
+            for text, expected_item, actual_item in zip(texts, expected, actual):
+                if expected_item != actual_item:
+                    mismatches += 1
+                    print(f"Mismatch in {service_name}:\n{text}")
+        print(
+            f"{service_name}: {len(docstrings)} docstrings,"
+            f" pyparsing {grammar_time:.2f}s, linear {linear_time:.2f}s,"
+            f" {mismatches} mismatches"
+        )
+        total_grammar += grammar_time
+        total_linear += linear_time
+        total_mismatches += mismatches
+
+    print(
+        f"Total: pyparsing {total_grammar:.2f}s, linear {total_linear:.2f}s,"
+        f" {total_mismatches} mismatches"
+    )
+    if total_mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
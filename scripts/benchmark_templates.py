@@ -0,0 +1,78 @@
+"""
+Compare Jinja2 templates startup and rendering with and without bytecode cache and auto reload.
+
+Usage: PYTHONPATH=builder python scripts/benchmark_templates.py [service_name] [repeat]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import jinja2
+from boto3.session import Session
+
+from mypy_boto3_builder.constants import DUMMY_REGION, MODULE_NAME, TEMPLATES_PATH
+from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
+from mypy_boto3_builder.jinja_manager import JinjaManager
+from mypy_boto3_builder.parsers.service_package import parse_service_package
+from mypy_boto3_builder.service_name import ServiceNameCatalog
+from mypy_boto3_builder.writers.utils import render_jinja2_template
+
+
+def measure_startup(name: str, path: Optional[Path]) -> None:
+    # new environment for every run, so templates are not loaded yet
+    environment = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATES_PATH.as_posix()),
+        undefined=jinja2.StrictUndefined,
+        auto_reload=False,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(path.as_posix())
+        if path
+        else None,
+    )
+    start = time.perf_counter()
+    for template_name in environment.list_templates(extensions=["jinja2"]):
+        environment.get_template(template_name)
+    print(f"startup {name}: {time.perf_counter() - start:.3f}s")
+
+
+def measure_render(
+    name: str, template_paths: List[Path], package: object, repeat: int
+) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for template_path in template_paths:
+            render_jinja2_template(template_path, package=package)  # type: ignore
+    print(f"render {name}: {time.perf_counter() - start:.3f}s")
+
+
+def main() -> None:
+    service_name = ServiceNameCatalog.find(sys.argv[1] if len(sys.argv) > 1 else "sqs")
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    with tempfile.TemporaryDirectory() as temp_dir:
+        measure_startup("compiled from source", None)
+        measure_startup("bytecode cache cold", Path(temp_dir))
+        measure_startup("bytecode cache warm", Path(temp_dir))
+
+    session = Session(region_name=DUMMY_REGION)
+    JinjaManager.update_globals(master_module_name=MODULE_NAME)
+    JinjaManager.load_templates()
+    package = parse_service_package(session, service_name)
+    template_paths = [
+        Path("service/service") / i.template_name
+        for i in ServiceModuleName
+        if (TEMPLATES_PATH / "service/service" / i.template_name).exists()
+    ]
+    environment = JinjaManager.get_environment()
+    for auto_reload in (True, False):
+        environment.auto_reload = auto_reload
+        measure_render(
+            f"{service_name.name} x{repeat} auto_reload={auto_reload}",
+            template_paths,
+            package,
+            repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compare worker startup time and memory of fork-after-preload and spawn pools.
+
+Memory is read from `/proc/self/smaps_rollup`, so Linux is required.
+
+Usage: PYTHONPATH=builder python scripts/benchmark_workers.py [workers] [service_name ...]
+"""
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from boto3.session import Session
+
+from mypy_boto3_builder.build_stats import BuildStats
+from mypy_boto3_builder.constants import DUMMY_REGION
+from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
+from mypy_boto3_builder.workers import (
+    WorkerOptions,
+    collect_service_signatures_task,
+    create_pool,
+)
+
+
+def get_memory() -> Dict[str, int]:
+    result: Dict[str, int] = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                result[parts[0].rstrip(":")] = int(parts[1])
+    return result
+
+
+def probe(delay: float) -> Tuple[int, float, Dict[str, int]]:
+    time.sleep(delay)
+    startup_time = BuildStats.pop()[1].get("workers_startup_time", 0.0)
+    return os.getpid(), startup_time, get_memory()
+
+
+def measure(start_method: str, workers: int, service_names: List[ServiceName]) -> None:
+    session = Session(region_name=DUMMY_REGION)
+    start = time.perf_counter()
+    with create_pool(
+        workers, WorkerOptions(), session=session, start_method=start_method
+    ) as pool:
+        startup = pool.map(probe, [0.2] * workers, chunksize=1)
+        ready = time.perf_counter() - start
+        for _ in pool.imap(collect_service_signatures_task, service_names):
+            pass
+        parsed = time.perf_counter() - start
+        memory = {pid: mem for pid, _, mem in pool.map(probe, [0.2] * workers, 1)}
+
+    startup_times = [i[1] for i in startup if i[1]]
+    print(
+        f"{start_method}: pool ready {ready:.2f}s, parsed {parsed:.2f}s,"
+        f" worker startup avg {sum(startup_times) / len(startup_times):.2f}s"
+    )
+    for pid, mem in sorted(memory.items()):
+        private = mem["Private_Clean"] + mem["Private_Dirty"]
+        print(
+            f"  worker {pid}: RSS {mem['Rss'] // 1024}MB, PSS {mem['Pss'] // 1024}MB,"
+            f" private {private // 1024}MB"
+        )
+    total_pss = sum(mem["Pss"] for mem in memory.values())
+    print(f"  total workers PSS {total_pss // 1024}MB")
+
+
+def main() -> None:
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    names = sys.argv[2:] or ["s3", "sqs", "ec2", "iam", "dynamodb", "lambda"]
+    service_names = [ServiceNameCatalog.find(i) for i in names]
+    for start_method in ("fork", "spawn"):
+        measure(start_method, workers, service_names)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,8 +22,19 @@ if [[ "$1" == "master" ]]; then
     exit
 fi
 
+SHARED_PACKAGE=${OUTPUT_PATH}/mypy_boto3_shared_package
+if [[ -d ${SHARED_PACKAGE} ]]; then
+    echo Installing $(basename ${SHARED_PACKAGE})
+    cd ${SHARED_PACKAGE}
+    python -m pip install . -v
+    cd -
+fi
+
 for package in $PACKAGES
 do
+    if [[ ${package} == ${SHARED_PACKAGE} ]]; then
+        continue
+    fi
     echo Installing $(basename ${package})
     cd ${package}
     python -m pip install . -v
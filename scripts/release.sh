@@ -13,8 +13,21 @@ if [[ `pip freeze | grep black` == "" ]]; then
     pip install --user black==19.10b0
 fi
 
+SHARED_PACKAGE=${OUTPUT_PATH}/mypy_boto3_shared_package
+if [[ -d ${SHARED_PACKAGE} ]]; then
+    echo Publishing $(basename ${SHARED_PACKAGE})
+    cd ${SHARED_PACKAGE}
+    rm -rf build *.egg-info dist/* > /dev/null
+    python setup.py build sdist 1>/dev/null 2>/dev/null
+    twine upload --non-interactive dist/* > /dev/null || true
+    rm -rf build *.egg-info dist/* > /dev/null
+fi
+
 for package in $PACKAGES
 do
+    if [[ ${package} == ${SHARED_PACKAGE} ]]; then
+        continue
+    fi
     echo Publishing $(basename ${package})
     cd ${package}
     rm -rf build *.egg-info dist/* > /dev/null
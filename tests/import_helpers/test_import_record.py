@@ -75,6 +75,10 @@ class ImportRecordTestCase(unittest.TestCase):
         self.assertGreater(
             ImportRecord(ImportString("zzz")), ImportRecord(ImportString("aaa"))
         )
+        self.assertGreater(
+            ImportRecord(local_source, "name", alias="alias"),
+            ImportRecord(local_source, "name"),
+        )
         self.assertGreater(
             ImportRecord(
                 local_source, "test", fallback=ImportRecord(local_source, "test2")
@@ -0,0 +1,129 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+from mypy_boto3_builder.parsers.docstring_parser.syntax_grammar import SyntaxGrammar
+from mypy_boto3_builder.parsers.docstring_parser.syntax_parser import (
+    SyntaxParser,
+    SyntaxParserError,
+)
+
+
+REQUEST_VALUES = (
+    "'string'",
+    "b'bytes'",
+    "123",
+    "True",
+    "'a'|'b'|'c'",
+    "[]",
+    "[...]",
+    "[..., ]",
+    "[..., 'string']",
+    "['string', ]",
+    "['a'|'b', 123]",
+    "{}",
+    "{...}",
+    "{'Key': 'string', 'Value': [{'Name': 'string'}], }",
+    "{'string', }",
+    "{'Key': 'string' or 123}",
+    "123 or {'Key': 'string'} or ['string']",
+    "datetime(2015, 1, 1)",
+    "datetime()",
+    "'a' order",
+)
+
+INVALID_REQUEST_VALUES = (
+    "foo'x'",
+    "['a',, 'b']",
+    "datetime(1, 2) or 3",
+    "'a' |",
+    "{'Key': }",
+    "Attr('a') | Key('b')",
+    "'a' order 'b'",
+)
+
+
+class SyntaxParserTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        SyntaxGrammar.reset()
+        SyntaxGrammar.enable_packrat()
+
+    def tearDown(self) -> None:
+        SyntaxGrammar.reset()
+
+    def test_parse_request_syntax(self) -> None:
+        for value in REQUEST_VALUES:
+            text = f"**Request Syntax**\n::\n\n  response = client.method(\n    Arg={value},\n    Other=123\n  )\n"
+            with self.subTest(value=value):
+                self.assertEqual(
+                    SyntaxParser.parse_request_syntax(text),
+                    SyntaxGrammar.request_syntax.parseString(text).asDict(),
+                )
+
+        self.assertEqual(
+            SyntaxParser.parse_request_syntax(
+                "**Request Syntax**\n::\n\n  response = client.method()\n"
+            ),
+            {},
+        )
+
+    def test_parse_request_syntax_error(self) -> None:
+        for value in INVALID_REQUEST_VALUES:
+            text = f"**Request Syntax**\n::\n\n  client.method(Arg={value})"
+            with self.subTest(value=value):
+                with self.assertRaises(SyntaxParserError):
+                    SyntaxParser.parse_request_syntax(text)
+        with self.assertRaises(SyntaxParserError):
+            SyntaxParser.parse_request_syntax("**Request Syntax**\n::\n\n  A_B=1)")
+        with self.assertRaises(SyntaxParserError):
+            SyntaxParser.parse_request_syntax(":: client.method()")
+
+    def test_parse_response_syntax(self) -> None:
+        for value in (
+            "{'Key': 'string', 'Items': [{'Name': 'a'|'b'}]}",
+            "[{'Name': 123}, ]",
+            "{}",
+        ):
+            text = f"**Response Syntax**\n::\n\n  {value}\n\nTrailing text"
+            with self.subTest(value=value):
+                self.assertEqual(
+                    SyntaxParser.parse_response_syntax(text),
+                    SyntaxGrammar.response_syntax.parseString(text).asDict(),
+                )
+
+        with self.assertRaises(SyntaxParserError):
+            SyntaxParser.parse_response_syntax("**Response Syntax**\n::\n\n  'string'")
+
+    @patch("mypy_boto3_builder.parsers.docstring_parser.syntax_parser.get_logger")
+    def test_verify(self, get_logger_mock: MagicMock) -> None:
+        SyntaxParser.verify = True
+        try:
+            text = "**Request Syntax**\n::\n\n  client.method(Arg='string')"
+            self.assertEqual(
+                SyntaxParser.parse_request_syntax(text),
+                SyntaxGrammar.request_syntax.parseString(text).asDict(),
+            )
+            get_logger_mock().warning.assert_not_called()
+
+            with patch.object(
+                SyntaxParser, "_parse_request_syntax", return_value={"arguments": []}
+            ):
+                self.assertEqual(
+                    SyntaxParser.parse_request_syntax(text),
+                    SyntaxGrammar.request_syntax.parseString(text).asDict(),
+                )
+            get_logger_mock().warning.assert_called_once()
+
+            get_logger_mock.reset_mock()
+            with patch.object(
+                SyntaxParser, "_parse_request_syntax", return_value={"arguments": []}
+            ):
+                self.assertEqual(
+                    SyntaxParser.parse_request_syntax(":: client.method()"),
+                    {"arguments": []},
+                )
+            get_logger_mock().warning.assert_called_once()
+
+            with self.assertRaises(SyntaxParserError):
+                SyntaxParser.parse_request_syntax(":: client.method()")
+        finally:
+            SyntaxParser.verify = False
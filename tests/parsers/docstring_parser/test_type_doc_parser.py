@@ -0,0 +1,88 @@
+import unittest
+
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_line import TypeDocLine
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_parser import (
+    TypeDocParser,
+    TypeDocParserError,
+)
+
+
+class TypeDocParserTestCase(unittest.TestCase):
+    def test_parse_type_definition(self) -> None:
+        self.assertEqual(
+            TypeDocParser.parse_type_definition(":type Name: list of str"),
+            {"name": "Name", "type_name": "list of str"},
+        )
+        with self.assertRaises(TypeDocParserError):
+            TypeDocParser.parse_type_definition(":type Name")
+
+    def test_parse_rtype_definition(self) -> None:
+        self.assertEqual(
+            TypeDocParser.parse_rtype_definition(":rtype: dict"), {"type_name": "dict"}
+        )
+        with self.assertRaises(TypeDocParserError):
+            TypeDocParser.parse_rtype_definition(":returns: dict")
+
+    def test_parse_returns_definition(self) -> None:
+        self.assertEqual(
+            TypeDocParser.parse_returns_definition(":returns: None"),
+            {"description": "None"},
+        )
+        self.assertEqual(
+            TypeDocParser.parse_returns_definition(":return: True"),
+            {"description": "True"},
+        )
+        with self.assertRaises(TypeDocParserError):
+            TypeDocParser.parse_returns_definition(":rtype: dict")
+
+    def test_parse_param_definition(self) -> None:
+        result = TypeDocLine(
+            **TypeDocParser.parse_param_definition(
+                ":param Entries: **[REQUIRED]**\n\n"
+                "  A list of entries.\n\n"
+                "  - *(dict) --*\n\n"
+                "    - **Id** *(string) --* **[REQUIRED]**\n\n"
+                "      Entry ID.\n\n"
+                "      .. note::\n\n"
+                "        Must be unique.\n\n"
+                "    - **Body** *(string) --*\n\n"
+                "      Entry body.\n"
+            )
+        )
+        self.assertEqual(result.name, "Entries")
+        self.assertTrue(result.required)
+        self.assertEqual(
+            [i.line for i in result.indented], ["A list of entries.", "- *(dict) --*"]
+        )
+        item = result.indented[1]
+        self.assertEqual(item.type_name, "dict")
+        self.assertEqual([i.name for i in item.indented], ["Id", "Body"])
+        self.assertEqual([i.type_name for i in item.indented], ["string", "string"])
+        self.assertEqual([i.required for i in item.indented], [True, False])
+        self.assertEqual(
+            [i.line for i in item.indented[0].indented], ["Entry ID.", ".. note::"]
+        )
+        self.assertEqual(
+            [i.line for i in item.indented[0].indented[1].indented], ["Must be unique."]
+        )
+        with self.assertRaises(TypeDocParserError):
+            TypeDocParser.parse_param_definition(":param Name")
+
+    def test_parse_response_structure(self) -> None:
+        result = TypeDocLine(
+            **TypeDocParser.parse_response_structure(
+                "**Response Structure**\n\n"
+                "- *(dict) --*\n\n"
+                "  - **Items** *(list) --*\n\n"
+                "    - *(string) --*\n\n"
+                "  - **Count** *(integer) --*\n\n"
+                "- *(dict) --* Not nested\n"
+            )
+        )
+        self.assertEqual(result.type_name, "dict")
+        self.assertEqual([i.name for i in result.indented], ["Items", "Count"])
+        self.assertEqual(result.indented[0].indented[0].type_name, "string")
+        with self.assertRaises(TypeDocParserError):
+            TypeDocParser.parse_response_structure("**Response Syntax**")
+        with self.assertRaises(TypeDocParserError):
+            TypeDocParser.parse_response_structure("**Response Structure**\n\n")
@@ -0,0 +1,108 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+from mypy_boto3_builder.parsers.boto3_utils import (
+    get_boto3_client_class,
+    get_boto3_resource_classes,
+    get_available_service_names,
+    has_service_model,
+)
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.parsers.helpers import get_public_functions
+
+
+class Boto3UtilsTestCase(unittest.TestCase):
+    @patch("mypy_boto3_builder.parsers.boto3_utils.ClientCreator")
+    def test_get_boto3_client_class(self, client_creator_mock: MagicMock) -> None:
+        session_mock = MagicMock()
+        service_name_mock = MagicMock()
+        service_name_mock.boto3_name = "s3"
+        result = get_boto3_client_class(session_mock, service_name_mock)
+        self.assertEqual(
+            client_creator_mock.call_args[1]["event_emitter"],
+            session_mock._session.get_component.return_value,
+        )
+        client_creator_mock.return_value.create_client_class.assert_called_with("s3")
+        self.assertEqual(
+            result, client_creator_mock.return_value.create_client_class.return_value
+        )
+
+    def test_get_boto3_resource_classes(self) -> None:
+        session_mock = MagicMock()
+        service_name_mock = MagicMock()
+        service_name_mock.boto3_name = "s3"
+        service_model_mock = MagicMock()
+        session_mock._loader.list_available_services.return_value = ["s3"]
+        session_mock._loader.load_service_model.return_value = {
+            "service": {"has": {}},
+            "resources": {"Bucket": {"load": {}}, "Object": {"load": {}}},
+        }
+        load_from_definition_mock = session_mock.resource_factory.load_from_definition
+        load_from_definition_mock.side_effect = lambda resource_name, **_: (
+            f"{resource_name}Class"
+        )
+        result = get_boto3_resource_classes(
+            session_mock, service_name_mock, service_model_mock
+        )
+        self.assertEqual(result, ("s3Class", ["BucketClass", "ObjectClass"]))
+        session_mock._loader.load_service_model.assert_called_with("s3", "resources-1")
+        service_contexts = [
+            i[1]["service_context"] for i in load_from_definition_mock.call_args_list
+        ]
+        self.assertEqual(len(service_contexts), 3)
+        self.assertTrue(all(i is service_contexts[0] for i in service_contexts))
+        self.assertIs(service_contexts[0].service_model, service_model_mock)
+
+        session_mock = MagicMock()
+        session_mock._loader.list_available_services.return_value = ["ec2"]
+        self.assertIsNone(
+            get_boto3_resource_classes(
+                session_mock, service_name_mock, service_model_mock
+            )
+        )
+
+    def test_get_available_service_names(self) -> None:
+        session_mock = MagicMock()
+        session_mock._loader.list_available_services.return_value = ["s3", "ec2"]
+        self.assertEqual(
+            get_available_service_names(session_mock, "service-2"),
+            frozenset({"s3", "ec2"}),
+        )
+        get_available_service_names(session_mock, "service-2")
+        session_mock._loader.list_available_services.assert_called_once_with(
+            "service-2"
+        )
+
+    def test_has_service_model(self) -> None:
+        session_mock = MagicMock()
+        session_mock._loader.list_available_services.return_value = ["s3"]
+        s3 = ServiceName("s3", "S3")
+        ec2 = ServiceName("ec2", "EC2")
+        self.assertTrue(has_service_model(session_mock, s3, "waiters-2"))
+        self.assertFalse(has_service_model(session_mock, ec2, "waiters-2"))
+        session_mock._loader.list_available_services.assert_called_once_with(
+            "waiters-2"
+        )
+        self.assertFalse(has_service_model(MagicMock(), s3, "waiters-2"))
+
+    def test_get_public_functions(self) -> None:
+        class Parent:
+            def parent_method(self) -> None:
+                pass
+
+        class Child(Parent):
+            attribute = "attribute"
+
+            def method(self) -> None:
+                pass
+
+            def _private_method(self) -> None:
+                pass
+
+            @classmethod
+            def class_method(cls) -> None:
+                pass
+
+        self.assertEqual(
+            sorted(get_public_functions(Child)), ["method", "parent_method"]
+        )
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import patch, MagicMock
 
-from botocore.exceptions import UnknownServiceError
+from botocore.model import ListShape, ShapeResolver, StringShape, StructureShape
 
 from mypy_boto3_builder.parsers.shape_parser import ShapeParser
 
@@ -13,15 +13,30 @@ class ShapeParserTestCase(unittest.TestCase):
         service_name_mock = MagicMock()
         shape_parser = ShapeParser(session_mock, service_name_mock)
         self.assertEqual(shape_parser.service_name, service_name_mock)
+        session_mock._session.get_service_data.assert_not_called()
+        session_mock._loader.load_service_model.assert_not_called()
 
-        session_mock._loader.load_service_model.side_effect = UnknownServiceError(
-            service_name="service_name", known_service_names="known_service_names",
+        session_mock._loader.list_available_services.return_value = []
+        self.assertEqual(shape_parser._waiters_shape, {})
+        session_mock._loader.load_service_model.assert_not_called()
+
+        session_mock._loader.list_available_services.return_value = [
+            service_name_mock.boto3_name
+        ]
+        session_mock._loader.load_service_model.return_value = {"pagination": {}}
+        shape_parser = ShapeParser(session_mock, service_name_mock)
+        self.assertEqual(shape_parser._paginators_shape, {"pagination": {}})
+        self.assertEqual(shape_parser._paginators_shape, {"pagination": {}})
+        session_mock._loader.load_service_model.assert_called_once_with(
+            service_name_mock.boto3_name, "paginators-1"
         )
-        ShapeParser(session_mock, service_name_mock)
 
     def test_get_paginator_names(self) -> None:
         session_mock = MagicMock()
         service_name_mock = MagicMock()
+        session_mock._loader.list_available_services.return_value = [
+            service_name_mock.boto3_name
+        ]
         session_mock._loader.load_service_model.return_value = {
             "pagination": ["c", "a", "b"]
         }
@@ -34,10 +49,51 @@ class ShapeParserTestCase(unittest.TestCase):
         shape_parser = ShapeParser(session_mock, service_name_mock)
         self.assertEqual(shape_parser.get_paginator_names(), [])
 
+    def test_get_waiter_names(self) -> None:
+        session_mock = MagicMock()
+        service_name_mock = MagicMock()
+        session_mock._loader.list_available_services.return_value = [
+            service_name_mock.boto3_name
+        ]
+        session_mock._loader.load_service_model.return_value = {
+            "waiters": {"InstanceRunning": {}, "ImageExists": {}}
+        }
+        shape_parser = ShapeParser(session_mock, service_name_mock)
+        self.assertEqual(
+            shape_parser.get_waiter_names(), ["ImageExists", "InstanceRunning"]
+        )
+
+        session_mock._loader.load_service_model.return_value = {}
+        shape_parser = ShapeParser(session_mock, service_name_mock)
+        self.assertEqual(shape_parser.get_waiter_names(), [])
+
+    @patch("mypy_boto3_builder.parsers.shape_parser.ServiceModel")
+    def test_get_exception_names(self, _ServiceModelMock: MagicMock) -> None:
+        session_mock = MagicMock()
+        service_name_mock = MagicMock()
+        session_mock._loader.list_available_services.return_value = [
+            service_name_mock.boto3_name
+        ]
+        session_mock._session.get_service_data.return_value = {
+            "shapes": {
+                "NotFound": {"type": "structure", "exception": True},
+                "Name": {"type": "string"},
+                "AlreadyExists": {"type": "structure", "exception": True},
+            }
+        }
+        shape_parser = ShapeParser(session_mock, service_name_mock)
+        self.assertEqual(
+            shape_parser.get_exception_names(),
+            ["AlreadyExists", "ClientError", "NotFound"],
+        )
+
     @patch("mypy_boto3_builder.parsers.shape_parser.ServiceModel")
     def test_get_client_method_map(self, ServiceModelMock: MagicMock) -> None:
         session_mock = MagicMock()
         service_name_mock = MagicMock()
+        session_mock._loader.list_available_services.return_value = [
+            service_name_mock.boto3_name
+        ]
         ServiceModelMock().operation_names = ["my_operation"]
         session_mock._loader.load_service_model.return_value = {
             "resources": ["c", "a", "b"]
@@ -51,6 +107,9 @@ class ShapeParserTestCase(unittest.TestCase):
     def test_get_paginate_method(self, ServiceModelMock: MagicMock) -> None:
         session_mock = MagicMock()
         service_name_mock = MagicMock()
+        session_mock._loader.list_available_services.return_value = [
+            service_name_mock.boto3_name
+        ]
         operation_model_mock = MagicMock()
         required_arg_shape_mock = MagicMock()
         optional_arg_shape_mock = MagicMock()
@@ -81,6 +140,9 @@ class ShapeParserTestCase(unittest.TestCase):
     def test_get_collection_filter_method(self, ServiceModelMock: MagicMock) -> None:
         session_mock = MagicMock()
         service_name_mock = MagicMock()
+        session_mock._loader.list_available_services.return_value = [
+            service_name_mock.boto3_name
+        ]
         operation_model_mock = MagicMock()
         required_arg_shape_mock = MagicMock()
         optional_arg_shape_mock = MagicMock()
@@ -104,3 +166,36 @@ class ShapeParserTestCase(unittest.TestCase):
         self.assertEqual(result.arguments[0].name, "cls")
         self.assertEqual(result.arguments[1].name, "optional_arg")
         self.assertEqual(result.arguments[2].name, "InputToken")
+
+    def test_parse_shape_interning(self) -> None:
+        session_mock = MagicMock()
+        session_mock._loader.load_service_model.return_value = {"resources": {}}
+        shape_parser = ShapeParser(session_mock, MagicMock())
+        string_shape = StringShape("Enum", {"type": "string", "enum": ["a", "b"]})
+        list_shape = MagicMock(spec=ListShape, type_name="list", member=string_shape)
+        structure_shape = StructureShape(
+            "Item", {"type": "structure", "members": {}}, ShapeResolver({})
+        )
+        structure_shape.members = {"Key": string_shape}
+        structure_list_shape = MagicMock(
+            spec=ListShape, type_name="list", member=structure_shape
+        )
+
+        literal = shape_parser._parse_shape(string_shape)
+        self.assertIs(shape_parser._parse_shape(string_shape), literal)
+        subscript = shape_parser._parse_shape(list_shape)
+        self.assertEqual(subscript.render(), "List[Literal['a', 'b']]")
+        self.assertIs(subscript.children[0], literal)
+        self.assertIs(shape_parser._parse_shape(list_shape), subscript)
+        self.assertIs(
+            ShapeParser(session_mock, MagicMock())._parse_shape(list_shape), subscript
+        )
+
+        typed_dict_subscript = shape_parser._parse_shape(structure_list_shape)
+        self.assertIs(
+            shape_parser._parse_shape(structure_list_shape), typed_dict_subscript
+        )
+        self.assertIsNot(
+            ShapeParser(session_mock, MagicMock())._parse_shape(structure_list_shape),
+            typed_dict_subscript,
+        )
@@ -0,0 +1,34 @@
+import unittest
+from unittest.mock import MagicMock
+
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+
+class ServicePackageTestCase(unittest.TestCase):
+    def test_extract_typed_dicts(self) -> None:
+        package = ServicePackage("name", "pypi_name", MagicMock(), MagicMock())
+        typed_dict_a = TypeTypedDict("A")
+        typed_dict_b = TypeTypedDict("B")
+        typed_dict_c = TypeTypedDict("C")
+        typed_dict_a.add_attribute("c", typed_dict_c, True)
+        typed_dict_a.add_attribute("b", TypeSubscript(Type.List, [typed_dict_b]), True)
+        typed_dict_b.add_attribute("a", typed_dict_a, False)
+        result = package.extract_typed_dicts([typed_dict_c, Type.str, typed_dict_a], {})
+        self.assertEqual([i.name for i in result], ["B", "C", "A"])
+
+        added = {"C": TypeTypedDict("C")}
+        self.assertEqual(package.extract_typed_dicts([typed_dict_c], added), [])
+        typed_dict_c.add_attribute("key", Type.str, True)
+        with self.assertRaisesRegex(ValueError, "class C:\n     key: str"):
+            package.extract_typed_dicts([typed_dict_c], added)
+
+    def test_extract_typed_dicts_deep(self) -> None:
+        package = ServicePackage("name", "pypi_name", MagicMock(), MagicMock())
+        typed_dicts = [TypeTypedDict(f"Item{i:04}") for i in range(5000)]
+        for parent, child in zip(typed_dicts, typed_dicts[1:]):
+            parent.add_attribute("child", child, True)
+        result = package.extract_typed_dicts([typed_dicts[0]], {})
+        self.assertEqual(result, list(reversed(typed_dicts)))
@@ -0,0 +1,29 @@
+import unittest
+
+from mypy_boto3_builder.structures.shared_package import SharedPackage
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+
+class SharedPackageTestCase(unittest.TestCase):
+    def test_add_typed_dicts(self) -> None:
+        package = SharedPackage()
+        typed_dict_a = TypeTypedDict("A")
+        typed_dict_b = TypeTypedDict("B")
+        package.add_typed_dicts([typed_dict_a])
+        package.add_typed_dicts([TypeTypedDict("A"), typed_dict_b])
+        self.assertEqual(package.typed_dicts, [typed_dict_a, typed_dict_b])
+        self.assertIs(package.typed_dicts[0], typed_dict_a)
+
+    def test_get_type_defs_required_import_record_groups(self) -> None:
+        package = SharedPackage()
+        self.assertEqual(package.get_type_defs_required_import_record_groups(), [])
+        typed_dict = TypeTypedDict("A")
+        typed_dict.add_attribute("key", Type.DictStrAny, True)
+        package.add_typed_dicts([typed_dict])
+        import_strings = [
+            i.render()
+            for group in package.get_type_defs_required_import_record_groups()
+            for i in group.import_records
+        ]
+        self.assertIn("from typing import Any", import_strings)
@@ -0,0 +1,89 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from mypy_boto3_builder.build_manifest import (
+    BuildManifest,
+    get_build_hash,
+    get_model_file_paths,
+    get_model_hash,
+    get_templates_hash,
+)
+from mypy_boto3_builder.service_name import ServiceName
+
+
+class BuildManifestTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service_name = ServiceName("s3", "S3")
+
+    def test_get_model_file_paths(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            model_path = root / "s3" / "2006-03-01"
+            model_path.mkdir(parents=True)
+            (model_path / "service-2.json.gz").write_bytes(b"model")
+            (model_path / "service-2.sdk-extras.json").write_bytes(b"extras")
+            (model_path / "waiters-2.json").write_bytes(b"waiters")
+            loader_mock = MagicMock()
+            loader_mock.search_paths = [root / "missing", root]
+            loader_mock.list_api_versions.return_value = ["2006-03-01"]
+            self.assertEqual(
+                get_model_file_paths(loader_mock, self.service_name, "service-2"),
+                [
+                    model_path / "service-2.json.gz",
+                    model_path / "service-2.sdk-extras.json",
+                ],
+            )
+            loader_mock.list_api_versions.return_value = []
+            self.assertEqual(
+                get_model_file_paths(loader_mock, self.service_name, "service-2"), []
+            )
+
+    @patch("mypy_boto3_builder.build_manifest.get_model_file_paths")
+    def test_get_model_hash(self, get_model_file_paths_mock: MagicMock) -> None:
+        get_model_file_paths_mock.return_value = []
+        session_mock = MagicMock()
+        result = get_model_hash(session_mock, self.service_name)
+        self.assertEqual(result, get_model_hash(session_mock, self.service_name))
+        get_model_file_paths_mock.assert_called_with(
+            session_mock._loader, self.service_name, "resources-1"
+        )
+
+    def test_get_templates_hash(self) -> None:
+        self.assertEqual(len(get_templates_hash()), 64)
+
+    def test_get_build_hash(self) -> None:
+        self.assertEqual(get_build_hash("a", "b", "c"), get_build_hash("a", "b", "c"))
+        self.assertNotEqual(
+            get_build_hash("a", "b", "c"), get_build_hash("a", "b", "d")
+        )
+
+        build_hash = get_build_hash("a", "b", "c")
+        with patch(
+            "mypy_boto3_builder.build_manifest.get_sources_hash"
+        ) as get_sources_hash_mock:
+            get_sources_hash_mock.return_value = "changed"
+            self.assertNotEqual(get_build_hash("a", "b", "c"), build_hash)
+
+    def test_manifest(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "manifest.json"
+            manifest = BuildManifest.load(path)
+            self.assertTrue(manifest.is_changed(self.service_name, "hash"))
+            manifest.update(self.service_name, "hash")
+            self.assertFalse(manifest.is_changed(self.service_name, "hash"))
+            manifest.save()
+
+            manifest = BuildManifest.load(path)
+            self.assertFalse(manifest.is_changed(self.service_name, "hash"))
+            self.assertTrue(manifest.is_changed(self.service_name, "new_hash"))
+
+    @patch("mypy_boto3_builder.build_manifest.get_logger")
+    def test_load_invalid(self, get_logger_mock: MagicMock) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "manifest.json"
+            path.write_text("invalid")
+            manifest = BuildManifest.load(path)
+            self.assertEqual(manifest.services, {})
+            get_logger_mock().warning.assert_called()
@@ -0,0 +1,35 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+from mypy_boto3_builder.build_stats import BuildStats
+
+
+class BuildStatsTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        BuildStats.pop()
+
+    def tearDown(self) -> None:
+        BuildStats.pop()
+
+    def test_increment(self) -> None:
+        BuildStats.increment("counter")
+        BuildStats.increment("counter", 2)
+        self.assertEqual(BuildStats.pop(), ({"counter": 3}, {}))
+        self.assertEqual(BuildStats.pop(), ({}, {}))
+
+    @patch("mypy_boto3_builder.build_stats.time")
+    def test_measure(self, time_mock: MagicMock) -> None:
+        time_mock.perf_counter.side_effect = [1.0, 3.5]
+        with BuildStats.measure("timer"):
+            pass
+        self.assertEqual(BuildStats.timers, {"timer": 2.5})
+
+    def test_merge(self) -> None:
+        BuildStats.increment("counter")
+        BuildStats.merge(({"counter": 2, "other": 1}, {"timer": 1.5}))
+        self.assertEqual(BuildStats.pop(), ({"counter": 3, "other": 1}, {"timer": 1.5}))
+
+    def test_get_report(self) -> None:
+        BuildStats.add_time("timer", 1.234)
+        BuildStats.increment("counter")
+        self.assertEqual(BuildStats.get_report(), ["counter: 1", "timer: 1.23s"])
@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from mypy_boto3_builder.format_cache import FormatCache
+
+
+class FormatCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name)
+        self.format_cache = FormatCache(self.path, 1024, ("line_length=100",))
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_get_key(self) -> None:
+        key = self.format_cache.get_key("content", Path("a.py"))
+        self.assertEqual(len(key), 64)
+        self.assertEqual(key, self.format_cache.get_key("content", Path("b.py")))
+        self.assertNotEqual(key, self.format_cache.get_key("content", Path("a.pyi")))
+        self.assertNotEqual(key, self.format_cache.get_key("other", Path("a.py")))
+        self.assertNotEqual(
+            key, FormatCache(self.path, 1024).get_key("content", Path("a.py"))
+        )
+        self.assertNotEqual(
+            key, self.format_cache.get_key("content", Path("a.py"), "chunk")
+        )
+
+    def test_load_save(self) -> None:
+        self.assertIsNone(self.format_cache.load("key"))
+        self.format_cache.save("key", "formatted")
+        self.assertEqual(self.format_cache.load("key"), "formatted")
+        self.assertEqual(self.format_cache.get_path("key"), self.path / "key.formatted")
+
+    def test_evict(self) -> None:
+        self.format_cache.save("old", "a" * 600)
+        self.format_cache.save("new", "b" * 600)
+        os.utime(self.format_cache.get_path("old").as_posix(), (0, 0))
+        self.format_cache.evict()
+        self.assertIsNone(self.format_cache.load("old"))
+        self.assertEqual(self.format_cache.load("new"), "b" * 600)
@@ -0,0 +1,128 @@
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Dict, List
+
+from botocore.paginate import Paginator as Boto3Paginator
+
+from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
+from mypy_boto3_builder.ir import (
+    dump_package,
+    load_package,
+    read_ir,
+    write_ir,
+)
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.argument import Argument
+from mypy_boto3_builder.structures.boto3_stubs_package import Boto3StubsPackage
+from mypy_boto3_builder.structures.client import Client
+from mypy_boto3_builder.structures.method import Method
+from mypy_boto3_builder.structures.paginator import Paginator
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.type_annotations.external_import import ExternalImport
+from mypy_boto3_builder.type_annotations.internal_import import InternalImport
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_class import TypeClass
+from mypy_boto3_builder.type_annotations.type_constant import TypeConstant
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+
+class IRTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service_name = ServiceName("s3", "S3")
+        self.service_name.boto3_version = "1.2.3"
+        typed_dict = TypeTypedDict("MyTypeDef", docstring="docstring")
+        typed_dict.add_attribute("Self", TypeSubscript(Type.List, [typed_dict]), False)
+        typed_dict.add_attribute("Name", Type.str, True)
+        self.package = ServicePackage(
+            name="mypy_boto3_s3",
+            pypi_name="mypy-boto3-s3",
+            service_name=self.service_name,
+            client=Client(
+                name="Client",
+                service_name=self.service_name,
+                methods=[
+                    Method(
+                        name="method",
+                        arguments=[
+                            Argument("self", None),
+                            Argument("key", TypeLiteral("a", "b"), TypeConstant(...)),
+                            Argument("size", Type.int, TypeConstant(3)),
+                        ],
+                        return_type=typed_dict,
+                        decorators=[Type.overload],
+                    )
+                ],
+            ),
+            paginators=[
+                Paginator(
+                    name="MyPaginator",
+                    bases=[TypeClass(Boto3Paginator, alias="Boto3Paginator")],
+                )
+            ],
+            typed_dicts=[typed_dict],
+        )
+
+    def test_dump_load(self) -> None:
+        text = dump_package(self.package)
+        self.assertEqual(text, dump_package(self.package))
+
+        result = load_package(text)
+        self.assertIsInstance(result, ServicePackage)
+        self.assertEqual(result.service_name, self.service_name)
+        self.assertEqual(result.service_name.boto3_version, "1.2.3")
+        self.assertEqual(dump_package(result), text)
+
+        method = result.client.methods[0]
+        self.assertEqual(method.arguments[1].type.render(), "Literal['a', 'b']")
+        self.assertEqual(method.arguments[1].default.render(), "...")
+        self.assertEqual(method.arguments[2].default.render(), "3")
+        self.assertEqual(method.decorators[0].render(), "overload")
+
+        typed_dict = result.typed_dicts[0]
+        self.assertIs(method.return_type, typed_dict)
+        self.assertIs(typed_dict.children[0].type_annotation.children[0], typed_dict)
+        self.assertEqual(typed_dict.docstring, "docstring")
+        self.assertEqual(
+            typed_dict.render_class(), self.package.typed_dicts[0].render_class(),
+        )
+
+        base = result.paginators[0].bases[0]
+        self.assertIsInstance(base, ExternalImport)
+        self.assertEqual(base.render(), "Boto3Paginator")
+        self.assertEqual(
+            base.get_import_record(),
+            self.package.paginators[0].bases[0].get_import_record(),
+        )
+
+    def test_internal_import(self) -> None:
+        package = Boto3StubsPackage(service_names=[self.service_name])
+        result = load_package(dump_package(package))
+        self.assertIsInstance(result, Boto3StubsPackage)
+        self.assertEqual(result.service_names, [self.service_name])
+
+        self.package.client.methods[0].return_type = InternalImport(
+            "Name", self.service_name, ServiceModuleName.paginator
+        )
+        result = load_package(dump_package(self.package))
+        return_type = result.client.methods[0].return_type
+        self.assertIsInstance(return_type, InternalImport)
+        self.assertEqual(return_type.module_name, ServiceModuleName.paginator)
+        self.assertEqual(return_type.service_name, self.service_name)
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            load_package('{"format": 0}')
+
+        self.package.client.methods[0].arguments[2].default = TypeConstant({"a"})
+        with self.assertRaises(ValueError):
+            dump_package(self.package)
+
+    def test_write_read(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = write_ir(Path(temp_dir) / "ir", self.package)
+            self.assertEqual(path.name, "mypy_boto3_s3.json")
+            result = read_ir(path)
+            self.assertEqual(result.name, "mypy_boto3_s3")
@@ -0,0 +1,26 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from mypy_boto3_builder.jinja_manager import JinjaManager
+
+
+class JinjaManagerTestCase(unittest.TestCase):
+    def test_get_environment(self) -> None:
+        environment = JinjaManager.get_environment()
+        self.assertFalse(environment.auto_reload)
+
+    def test_set_bytecode_cache(self) -> None:
+        environment = JinjaManager.get_environment()
+        bytecode_cache = environment.bytecode_cache
+        template_name = "common/method.py.jinja2"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "templates"
+            try:
+                JinjaManager.set_bytecode_cache(path)
+                environment.cache.clear()
+                environment.get_template(template_name)
+                self.assertEqual(len(list(path.iterdir())), 1)
+            finally:
+                environment.bytecode_cache = bytecode_cache
+                environment.cache.clear()
@@ -0,0 +1,114 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from mypy_boto3_builder.build_stats import BuildStats
+from mypy_boto3_builder.method_cache import MethodCache
+from mypy_boto3_builder.structures.argument import Argument
+from mypy_boto3_builder.structures.method import Method
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+
+class MethodCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        MethodCache.entries.clear()
+        MethodCache.pop_new()
+        BuildStats.pop()
+        nested_typed_dict = TypeTypedDict("BucketLoadTagsTypeDef")
+        nested_typed_dict.add_attribute("Key", Type.str, True)
+        typed_dict = TypeTypedDict("BucketLoadFiltersTypeDef")
+        typed_dict.add_attribute(
+            "Tags", TypeSubscript(Type.List, [nested_typed_dict]), False
+        )
+        typed_dict.add_attribute("Shared", TypeTypedDict("SharedTypeDef"), False)
+        self.method = Method(
+            name="load",
+            arguments=[Argument("self", None), Argument("Filters", typed_dict)],
+            return_type=TypeTypedDict("BucketLoadResponseTypeDef"),
+        )
+
+    def tearDown(self) -> None:
+        MethodCache.entries.clear()
+        MethodCache.pop_new()
+        BuildStats.pop()
+
+    def test_get_key(self) -> None:
+        def method(self: object, Filters: object = None) -> None:
+            pass
+
+        def other_method(self: object) -> None:
+            pass
+
+        key = MethodCache.get_key("load", method, "docstring")
+        self.assertEqual(key, MethodCache.get_key("load", method, "docstring"))
+        self.assertNotEqual(key, MethodCache.get_key("reload", method, "docstring"))
+        self.assertNotEqual(key, MethodCache.get_key("load", other_method, "docstring"))
+        self.assertNotEqual(key, MethodCache.get_key("load", method, "other"))
+
+    def test_get(self) -> None:
+        self.assertIsNone(MethodCache.get("key", "BucketLoad"))
+        MethodCache.add("key", "BucketLoad", self.method)
+
+        result = MethodCache.get("key", "BucketLoad")
+        self.assertEqual(result, self.method)
+        self.assertIsNot(result, self.method)
+
+        result = MethodCache.get("key", "ObjectLoad")
+        self.assertEqual(result.return_type.name, "ObjectLoadResponseTypeDef")
+        typed_dict = result.arguments[1].type
+        self.assertEqual(typed_dict.name, "ObjectLoadFiltersTypeDef")
+        self.assertEqual(
+            typed_dict.children[0].type_annotation.children[0].name,
+            "ObjectLoadTagsTypeDef",
+        )
+        self.assertEqual(typed_dict.children[1].type_annotation.name, "SharedTypeDef")
+        self.assertEqual(self.method.return_type.name, "BucketLoadResponseTypeDef")
+        self.assertEqual(
+            BuildStats.pop(), ({"method_cache_hits": 2, "method_cache_misses": 1}, {}),
+        )
+
+    def test_evict(self) -> None:
+        with patch.object(MethodCache, "max_size", 2):
+            MethodCache.add("first", "BucketLoad", self.method)
+            MethodCache.add("second", "BucketLoad", self.method)
+            MethodCache.get("first", "BucketLoad")
+            MethodCache.add("third", "BucketLoad", self.method)
+        self.assertEqual(list(MethodCache.entries), ["first", "third"])
+
+    def test_pop_new_merge(self) -> None:
+        MethodCache.add("key", "BucketLoad", self.method)
+        entries = MethodCache.pop_new()
+        self.assertEqual(list(entries), ["key"])
+        self.assertEqual(MethodCache.pop_new(), {})
+
+        MethodCache.entries.clear()
+        MethodCache.merge(entries)
+        self.assertEqual(list(MethodCache.entries), ["key"])
+        self.assertEqual(MethodCache.pop_new(), {})
+
+    @patch("mypy_boto3_builder.method_cache.get_logger")
+    def test_save_load(self, get_logger_mock: MagicMock) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cache" / "methods.cache"
+            MethodCache.load(path)
+            self.assertEqual(len(MethodCache.entries), 0)
+
+            MethodCache.add("key", "BucketLoad", self.method)
+            MethodCache.save(path)
+            MethodCache.entries.clear()
+            MethodCache.load(path)
+            self.assertEqual(MethodCache.get("key", "BucketLoad"), self.method)
+
+            MethodCache.entries.clear()
+            with patch.object(MethodCache, "_get_version", return_value="new"):
+                MethodCache.load(path)
+            self.assertEqual(len(MethodCache.entries), 0)
+
+            path.write_bytes(b"invalid")
+            MethodCache.load(path)
+            self.assertEqual(len(MethodCache.entries), 0)
+            get_logger_mock().debug.assert_called()
+            get_logger_mock().warning.assert_not_called()
@@ -0,0 +1,83 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from collections import OrderedDict
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from botocore.loaders import JSONFileLoader
+
+from mypy_boto3_builder.build_stats import BuildStats
+from mypy_boto3_builder.model_cache import ModelFileLoader
+
+
+class ModelFileLoaderTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        BuildStats.pop()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.model_path = self.root / "data" / "service-2"
+        self.model_path.parent.mkdir()
+        self.model_path.with_name("service-2.json").write_text(
+            json.dumps({"b": 1, "a": {"c": [2]}})
+        )
+        self.file_loader = ModelFileLoader(self.root / "cache")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        BuildStats.pop()
+
+    def test_load_file(self) -> None:
+        file_path = self.model_path.as_posix()
+        result = self.file_loader.load_file(file_path)
+        self.assertEqual(result, JSONFileLoader().load_file(file_path))
+        self.assertIsInstance(result, OrderedDict)
+        self.assertEqual(list(result), ["b", "a"])
+        self.assertEqual(BuildStats.pop()[0], {"model_cache_misses": 1})
+
+        result = ModelFileLoader(self.root / "cache").load_file(file_path)
+        self.assertEqual(result, {"b": 1, "a": {"c": [2]}})
+        self.assertEqual(list(result), ["b", "a"])
+        self.assertEqual(BuildStats.pop()[0], {"model_cache_hits": 1})
+
+        source_path = self.model_path.with_name("service-2.json")
+        source_path.write_text(json.dumps({"b": 2}))
+        os.utime(source_path.as_posix(), ns=(0, 0))
+        self.assertEqual(self.file_loader.load_file(file_path), {"b": 2})
+        self.assertEqual(BuildStats.pop()[0], {"model_cache_misses": 1})
+
+        self.assertIsNone(self.file_loader.load_file(f"{file_path}-missing"))
+        self.assertTrue(self.file_loader.exists(file_path))
+        self.assertFalse(self.file_loader.exists(f"{file_path}-missing"))
+
+    def test_load_file_gzip(self) -> None:
+        gzip_path = self.root / "data" / "waiters-2.json.gz"
+        gzip_path.write_bytes(gzip.compress(b'{"waiters": {}}'))
+        file_path = (self.root / "data" / "waiters-2").as_posix()
+        self.assertEqual(self.file_loader.load_file(file_path), {"waiters": {}})
+        self.assertEqual(
+            self.file_loader.get_path(gzip_path).parent, self.root / "cache"
+        )
+        self.assertTrue(self.file_loader.get_path(gzip_path).exists())
+
+    @patch("mypy_boto3_builder.model_cache.get_logger")
+    def test_load_file_invalid(self, get_logger_mock: MagicMock) -> None:
+        file_path = self.model_path.as_posix()
+        source_path = self.model_path.with_name("service-2.json")
+        cache_path = self.file_loader.get_path(source_path)
+        cache_path.parent.mkdir()
+        cache_path.write_bytes(b"invalid")
+        self.assertEqual(self.file_loader.load_file(file_path)["b"], 1)
+        get_logger_mock().warning.assert_called()
+
+    def test_install(self) -> None:
+        session_mock = MagicMock()
+        file_loader = session_mock._loader.file_loader
+        ModelFileLoader.install(session_mock, self.root)
+        self.assertIsInstance(session_mock._loader.file_loader, ModelFileLoader)
+        self.assertIs(session_mock._loader.file_loader.file_loader, file_loader)
+        installed = session_mock._loader.file_loader
+        ModelFileLoader.install(session_mock, self.root)
+        self.assertIs(session_mock._loader.file_loader, installed)
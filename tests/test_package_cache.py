@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from mypy_boto3_builder.package_cache import PackageCache
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.client import Client
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.structures.service_resource import ServiceResource
+
+
+class PackageCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service_name = ServiceName("s3", "S3")
+        self.package = ServicePackage(
+            name="mypy_boto3_s3",
+            pypi_name="mypy-boto3-s3",
+            service_name=self.service_name,
+            client=Client(name="Client", service_name=self.service_name),
+            service_resource=ServiceResource(
+                name="ServiceResource", service_name=self.service_name
+            ),
+        )
+
+    @patch("mypy_boto3_builder.package_cache.get_model_hash")
+    def test_get_key(self, get_model_hash_mock: MagicMock) -> None:
+        package_cache = PackageCache(Path("cache"), 100)
+        get_model_hash_mock.return_value = "model_hash"
+        key = package_cache.get_key("session", self.service_name)
+        self.assertEqual(key, package_cache.get_key("session", self.service_name))
+        get_model_hash_mock.assert_called_with("session", self.service_name)
+        get_model_hash_mock.return_value = "new_model_hash"
+        self.assertNotEqual(key, package_cache.get_key("session", self.service_name))
+
+    def test_save_load(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_cache = PackageCache(Path(temp_dir) / "cache", 1024 * 1024)
+            self.assertIsNone(package_cache.load(self.service_name, "key"))
+
+            package_cache.save(self.service_name, "key", self.package)
+            result = package_cache.load(self.service_name, "key")
+            self.assertIsInstance(result, ServicePackage)
+            self.assertEqual(result.name, "mypy_boto3_s3")
+            self.assertEqual(result.service_resource.name, "ServiceResource")
+            self.assertIsNone(package_cache.load(self.service_name, "other_key"))
+
+    @patch("mypy_boto3_builder.package_cache.get_logger")
+    def test_load_invalid(self, get_logger_mock: MagicMock) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_cache = PackageCache(Path(temp_dir), 1024)
+            package_cache.get_path(self.service_name, "key").write_bytes(b"invalid")
+            self.assertIsNone(package_cache.load(self.service_name, "key"))
+            get_logger_mock().debug.assert_called()
+            get_logger_mock().warning.assert_not_called()
+
+    def test_evict(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_cache = PackageCache(Path(temp_dir), 25)
+            for index, key in enumerate(("old", "used", "new")):
+                path = package_cache.get_path(self.service_name, key)
+                path.write_bytes(b"0123456789")
+                os.utime(path.as_posix(), (index, index))
+
+            os.utime(package_cache.get_path(self.service_name, "used").as_posix())
+            package_cache.evict()
+            self.assertEqual(
+                sorted(i.name for i in Path(temp_dir).iterdir()),
+                ["s3-new.pickle", "s3-used.pickle"],
+            )
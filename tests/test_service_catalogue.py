@@ -0,0 +1,86 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from mypy_boto3_builder.service_catalogue import CatalogueEntry, ServiceCatalogue
+from mypy_boto3_builder.service_name import ServiceName
+
+
+class ServiceCatalogueTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.s3 = ServiceName("s3", "S3")
+        self.sqs = ServiceName("sqs", "SQS")
+        self.session_mock = MagicMock()
+        loader_mock = self.session_mock._loader
+        loader_mock.list_available_services.side_effect = lambda type_name: {
+            "resources-1": ["s3"],
+            "waiters-2": ["s3"],
+            "paginators-1": ["s3", "sqs"],
+        }[type_name]
+        loader_mock.load_service_model.side_effect = lambda name, type_name: {
+            "waiters-2": {"waiters": {"ObjectExists": {}, "BucketExists": {}}},
+            "paginators-1": {"pagination": {"ListQueues": {}}},
+        }[type_name]
+
+    def test_build(self) -> None:
+        catalogue = ServiceCatalogue.build(self.session_mock, [self.s3, self.sqs])
+        self.assertEqual(
+            catalogue.get_entry(self.s3),
+            CatalogueEntry(
+                has_resource=True,
+                waiter_names=["BucketExists", "ObjectExists"],
+                paginator_names=["ListQueues"],
+            ),
+        )
+        self.assertEqual(
+            catalogue.get_entry(self.sqs),
+            CatalogueEntry(paginator_names=["ListQueues"]),
+        )
+        with self.assertRaises(ValueError):
+            catalogue.get_entry(ServiceName("ec2", "EC2"))
+
+    def test_save_load(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cache" / "catalogue.json"
+            self.assertIsNone(ServiceCatalogue.load(path))
+
+            catalogue = ServiceCatalogue.build(self.session_mock, [self.s3])
+            catalogue.save(path)
+            result = ServiceCatalogue.load(path)
+            self.assertIsNotNone(result)
+            self.assertEqual(result.entries, catalogue.entries)
+
+            with patch.object(ServiceCatalogue, "_get_version") as get_version_mock:
+                get_version_mock.return_value = "other"
+                self.assertIsNone(ServiceCatalogue.load(path))
+
+    @patch("mypy_boto3_builder.service_catalogue.get_logger")
+    def test_load_invalid(self, get_logger_mock: MagicMock) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "catalogue.json"
+            path.write_text("invalid")
+            self.assertIsNone(ServiceCatalogue.load(path))
+            get_logger_mock().warning.assert_called()
+
+    def test_get(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "catalogue.json"
+            catalogue = ServiceCatalogue.get(self.session_mock, [self.s3], path)
+            self.assertTrue(path.exists())
+            self.assertEqual(list(catalogue.entries), ["s3"])
+
+            loader_mock = self.session_mock._loader
+            loader_mock.load_service_model.reset_mock()
+            catalogue = ServiceCatalogue.get(self.session_mock, [self.s3], path)
+            self.assertEqual(list(catalogue.entries), ["s3"])
+            loader_mock.load_service_model.assert_not_called()
+
+            catalogue = ServiceCatalogue.get(
+                self.session_mock, [self.s3, self.sqs], path
+            )
+            self.assertEqual(list(catalogue.entries), ["s3", "sqs"])
+            loader_mock.load_service_model.assert_called()
+
+            catalogue = ServiceCatalogue.get(self.session_mock, [self.sqs])
+            self.assertEqual(list(catalogue.entries), ["sqs"])
@@ -25,6 +25,15 @@ class ServiceNameTestCase(unittest.TestCase):
             ServiceName("lambda", "MyService").module_name, "mypy_boto3_lambda"
         )
 
+    def test_eq(self) -> None:
+        self.assertEqual(
+            ServiceName("my-service", "MyService"), ServiceName("my-service", "Other")
+        )
+        self.assertNotEqual(
+            ServiceName("my-service", "MyService"), ServiceName("other", "MyService")
+        )
+        self.assertNotEqual(ServiceName("my-service", "MyService"), "my-service")
+
     def test_is_essential(self) -> None:
         self.assertFalse(ServiceName("my-service", "MyService").is_essential())
         self.assertTrue(ServiceName("lambda", "MyService").is_essential())
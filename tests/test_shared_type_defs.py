@@ -0,0 +1,67 @@
+import unittest
+
+from mypy_boto3_builder.service_name import ServiceNameCatalog
+from mypy_boto3_builder.shared_type_defs import (
+    get_shared_names,
+    get_typed_dict_signature,
+    get_typed_dict_signatures,
+    select_shared_signatures,
+)
+from mypy_boto3_builder.type_annotations.internal_import import InternalImport
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+
+class SharedTypeDefsTestCase(unittest.TestCase):
+    def test_get_typed_dict_signature(self) -> None:
+        tag = TypeTypedDict("TagTypeDef")
+        tag.add_attribute("Key", Type.str, True)
+        tag.add_attribute("Value", Type.str, False)
+        digest, dependencies = get_typed_dict_signature(tag)
+        self.assertEqual(dependencies, ())
+        self.assertEqual(len(digest or ""), 40)
+
+        other_tag = TypeTypedDict("TagTypeDef")
+        other_tag.add_attribute("Key", Type.str, True)
+        other_tag.add_attribute("Value", Type.str, True)
+        self.assertNotEqual(get_typed_dict_signature(other_tag)[0], digest)
+
+        tags = TypeTypedDict("TagsTypeDef")
+        tags.add_attribute("Tags", TypeSubscript(Type.List, [tag]), True)
+        self.assertEqual(get_typed_dict_signature(tags)[1], ("TagTypeDef",))
+
+        resource = TypeTypedDict("ResourceTypeDef")
+        resource.add_attribute(
+            "Bucket", InternalImport("Bucket", ServiceNameCatalog.s3), True
+        )
+        self.assertIsNone(get_typed_dict_signature(resource)[0])
+
+    def test_select_shared_signatures(self) -> None:
+        services = [
+            {"A": ("a1", ()), "B": ("b1", ("A",)), "C": ("c1", ())},
+            {"A": ("a1", ()), "B": ("b1", ("A",)), "C": ("c2", ())},
+            {"A": ("a2", ()), "B": ("b1", ("A",)), "D": (None, ())},
+            {"D": (None, ())},
+        ]
+        self.assertEqual(select_shared_signatures(services), {"A": "a1", "B": "b1"})
+        self.assertEqual(
+            get_shared_names(services[0], {"A": "a1", "B": "b1"}), {"A", "B"}
+        )
+        self.assertEqual(get_shared_names(services[2], {"A": "a1", "B": "b1"}), set())
+
+        self.assertEqual(
+            select_shared_signatures(
+                [
+                    {"A": ("a1", ()), "B": ("b1", ("A",))},
+                    {"A": ("a2", ()), "B": ("b1", ("A",))},
+                ]
+            ),
+            {},
+        )
+
+    def test_get_typed_dict_signatures(self) -> None:
+        self.assertEqual(
+            list(get_typed_dict_signatures([TypeTypedDict("A"), TypeTypedDict("B")])),
+            ["A", "B"],
+        )
@@ -0,0 +1,264 @@
+import logging
+import unittest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from mypy_boto3_builder.build_stats import BuildStats
+from mypy_boto3_builder.method_cache import MethodCache
+from mypy_boto3_builder.parsers.docstring_parser.syntax_parser import SyntaxParser
+from mypy_boto3_builder.structures.shared_package import SharedPackage
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+from mypy_boto3_builder.writers.utils import Formatter
+from mypy_boto3_builder.workers import (
+    RecordBufferHandler,
+    WorkerOptions,
+    WorkerState,
+    collect_service_signatures_task,
+    collect_services_signatures_parallel,
+    create_pool,
+    get_task_result,
+    init_worker,
+    preload_session,
+    process_service_task,
+    process_services_parallel,
+)
+
+
+class RecordBufferHandlerTestCase(unittest.TestCase):
+    def test_emit(self) -> None:
+        handler = RecordBufferHandler()
+        record = logging.LogRecord(
+            "name", logging.INFO, "path", 1, "a %s", ("b",), None
+        )
+        handler.emit(record)
+        records = handler.pop_records()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].msg, "a b")
+        self.assertIsNone(records[0].args)
+        self.assertEqual(handler.pop_records(), [])
+
+
+class WorkersTestCase(unittest.TestCase):
+    @patch("mypy_boto3_builder.workers.Session")
+    @patch("mypy_boto3_builder.workers.JinjaManager")
+    @patch("mypy_boto3_builder.workers.get_logger")
+    def test_init_worker(
+        self,
+        get_logger_mock: MagicMock,
+        JinjaManagerMock: MagicMock,
+        SessionMock: MagicMock,
+    ) -> None:
+        package_cache_mock = MagicMock()
+        options = WorkerOptions(
+            jinja_globals={"key": "value"},
+            package_cache=package_cache_mock,
+            level=logging.DEBUG,
+            panic=True,
+        )
+        init_worker(options)
+        get_logger_mock.assert_called_with(panic=True)
+        get_logger_mock().set_level.assert_called_with(logging.DEBUG)
+        self.assertEqual(get_logger_mock().handlers, [WorkerState.handler])
+        JinjaManagerMock.update_globals.assert_called_with(key="value")
+        self.assertEqual(WorkerState.session, SessionMock())
+        self.assertEqual(WorkerState.options, options)
+
+        init_worker(WorkerOptions(templates_cache_path=Path("templates")))
+        JinjaManagerMock.set_bytecode_cache.assert_called_with(Path("templates"))
+
+        with patch("mypy_boto3_builder.workers.ModelFileLoader") as ModelFileLoaderMock:
+            init_worker(WorkerOptions(model_cache_path=Path("models")))
+            ModelFileLoaderMock.install.assert_called_with(
+                SessionMock(), Path("models")
+            )
+
+        session_mock = MagicMock()
+        format_cache_mock = MagicMock()
+        Formatter.pool = MagicMock()
+        init_worker(
+            WorkerOptions(
+                session=session_mock, start_time=0.0, format_cache=format_cache_mock,
+            )
+        )
+        self.assertEqual(WorkerState.session, session_mock)
+        self.assertIn("workers_startup_time", BuildStats.pop()[1])
+        self.assertIsNone(Formatter.pool)
+        self.assertEqual(Formatter.cache, format_cache_mock)
+        Formatter.cache = None
+
+        init_worker(WorkerOptions(verify_syntax=True))
+        self.assertTrue(SyntaxParser.verify)
+        SyntaxParser.verify = False
+        WorkerState.options = WorkerOptions()
+
+    @patch("mypy_boto3_builder.workers.JinjaManager")
+    def test_preload_session(self, JinjaManagerMock: MagicMock) -> None:
+        session_mock = MagicMock()
+        preload_session(session_mock)
+        session_mock._session.get_component.assert_called_with("endpoint_resolver")
+        session_mock._loader.list_available_services.assert_called_with("resources-1")
+        JinjaManagerMock.load_templates.assert_called_with()
+
+    @patch("mypy_boto3_builder.workers.preload_session")
+    @patch("mypy_boto3_builder.workers.gc")
+    @patch("mypy_boto3_builder.workers.multiprocessing")
+    def test_create_pool(
+        self,
+        multiprocessing_mock: MagicMock,
+        gc_mock: MagicMock,
+        preload_session_mock: MagicMock,
+    ) -> None:
+        context_mock = multiprocessing_mock.get_context()
+        context_mock.get_start_method.return_value = "fork"
+        session_mock = MagicMock()
+        options = WorkerOptions(docstrings=True)
+        result = create_pool(2, options, session=session_mock, start_method="fork")
+        self.assertEqual(result, context_mock.Pool.return_value)
+        multiprocessing_mock.get_context.assert_called_with("fork")
+        preload_session_mock.assert_called_with(session_mock)
+        gc_mock.freeze.assert_called_with()
+        gc_mock.unfreeze.assert_called_with()
+        (worker_options,) = context_mock.Pool.call_args[1]["initargs"]
+        self.assertTrue(worker_options.docstrings)
+        self.assertIsNone(worker_options.method_cache_entries)
+        self.assertEqual(worker_options.session, session_mock)
+        self.assertIsNotNone(worker_options.start_time)
+        self.assertIsNone(options.session)
+
+        preload_session_mock.reset_mock()
+        gc_mock.reset_mock()
+        context_mock.get_start_method.return_value = "spawn"
+        create_pool(2, options, session=session_mock, start_method="spawn")
+        preload_session_mock.assert_not_called()
+        gc_mock.freeze.assert_not_called()
+        (worker_options,) = context_mock.Pool.call_args[1]["initargs"]
+        self.assertEqual(worker_options.method_cache_entries, dict(MethodCache.entries))
+        self.assertIsNone(worker_options.session)
+
+    @patch("mypy_boto3_builder.workers.process_service")
+    def test_process_service_task(self, process_service_mock: MagicMock) -> None:
+        WorkerState.session = None
+        with self.assertRaises(RuntimeError):
+            process_service_task(("service_name", Path("my_path")))
+
+        WorkerState.session = MagicMock()
+        process_service_mock().shared_typed_dicts = ["typed_dict"]
+        self.assertEqual(
+            process_service_task(("service_name", Path("my_path"))),
+            ([], ({}, {}), {}, ["typed_dict"]),
+        )
+        process_service_mock.assert_called_with(
+            session=WorkerState.session,
+            service_name="service_name",
+            output_path=Path("my_path"),
+            package_cache=WorkerState.options.package_cache,
+            ir_path=WorkerState.options.ir_path,
+            docstrings=WorkerState.options.docstrings,
+            shared_signatures=WorkerState.options.shared_signatures,
+        )
+
+        record_mock = MagicMock()
+        WorkerState.handler.records.append(record_mock)
+        process_service_mock.side_effect = ValueError()
+        with self.assertRaises(ValueError) as context:
+            process_service_task(("service_name", Path("my_path")))
+        self.assertEqual(WorkerState.handler.records, [])
+        self.assertEqual(getattr(context.exception, "log_records"), [record_mock])
+
+    @patch("mypy_boto3_builder.workers.get_logger")
+    def test_get_task_result(self, get_logger_mock: MagicMock) -> None:
+        record_mock = MagicMock()
+        self.assertEqual(
+            get_task_result(iter([([record_mock], "stats", "entries")])),
+            ["stats", "entries"],
+        )
+        get_logger_mock().handle.assert_called_with(record_mock)
+
+        get_logger_mock.reset_mock()
+        error = ValueError()
+        setattr(error, "log_records", [record_mock])
+        results = MagicMock()
+        results.__next__.side_effect = error
+        with self.assertRaises(ValueError):
+            get_task_result(results)
+        get_logger_mock().handle.assert_called_with(record_mock)
+
+    @patch("mypy_boto3_builder.workers.collect_service_signatures")
+    def test_collect_service_signatures_task(
+        self, collect_service_signatures_mock: MagicMock
+    ) -> None:
+        WorkerState.session = None
+        with self.assertRaises(RuntimeError):
+            collect_service_signatures_task("service_name")
+
+        WorkerState.session = MagicMock()
+        collect_service_signatures_mock.return_value = {"A": ("digest", ())}
+        self.assertEqual(
+            collect_service_signatures_task("service_name"),
+            ([], ({}, {}), {}, {"A": ("digest", ())}),
+        )
+        collect_service_signatures_mock.assert_called_with(
+            session=WorkerState.session,
+            service_name="service_name",
+            package_cache=WorkerState.options.package_cache,
+            docstrings=WorkerState.options.docstrings,
+        )
+
+    @patch("mypy_boto3_builder.workers.multiprocessing")
+    @patch("mypy_boto3_builder.workers.get_logger")
+    def test_process_services_parallel(
+        self, get_logger_mock: MagicMock, multiprocessing_mock: MagicMock
+    ) -> None:
+        service_name_mock = MagicMock()
+        service_name_mock.module_name = "module_name"
+        record_mock = MagicMock()
+        pool_mock = multiprocessing_mock.get_context().Pool().__enter__()
+        method_mock = MagicMock()
+        typed_dict = TypeTypedDict("A")
+        pool_mock.imap.return_value = [
+            (
+                [record_mock],
+                ({"counter": 1}, {}),
+                {"key": ("prefix", method_mock)},
+                [typed_dict],
+            )
+        ]
+        shared_package = SharedPackage()
+        result = process_services_parallel(
+            [service_name_mock],
+            Path("my_path"),
+            2,
+            WorkerOptions(jinja_globals={"key": "value"}),
+            shared_package=shared_package,
+        )
+        self.assertEqual(list(result), [service_name_mock])
+        self.assertEqual(shared_package.typed_dicts, [typed_dict])
+        pool_mock.imap.assert_called_with(
+            process_service_task,
+            [(service_name_mock, Path("my_path/module_name_package"))],
+        )
+        get_logger_mock().handle.assert_called_with(record_mock)
+        self.assertEqual(BuildStats.pop(), ({"counter": 1}, {}))
+        self.assertEqual(MethodCache.entries.pop("key"), ("prefix", method_mock))
+
+    @patch("mypy_boto3_builder.workers.multiprocessing")
+    @patch("mypy_boto3_builder.workers.get_logger")
+    def test_collect_services_signatures_parallel(
+        self, get_logger_mock: MagicMock, multiprocessing_mock: MagicMock
+    ) -> None:
+        service_name_mock = MagicMock()
+        service_name_mock.module_name = "module_name"
+        record_mock = MagicMock()
+        pool_mock = multiprocessing_mock.get_context().Pool().__enter__()
+        pool_mock.imap.return_value = [
+            ([record_mock], ({"counter": 1}, {}), {}, {"A": ("digest", ())})
+        ]
+        result = collect_services_signatures_parallel(
+            [service_name_mock], 2, WorkerOptions(jinja_globals={"key": "value"})
+        )
+        self.assertEqual(result, [{"A": ("digest", ())}])
+        pool_mock.imap.assert_called_with(
+            collect_service_signatures_task, [service_name_mock]
+        )
+        get_logger_mock().handle.assert_called_with(record_mock)
+        self.assertEqual(BuildStats.pop(), ({"counter": 1}, {}))
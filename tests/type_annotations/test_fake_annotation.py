@@ -0,0 +1,34 @@
+import copy
+import pickle
+import unittest
+from typing import List
+
+from mypy_boto3_builder.type_annotations.type_annotation import TypeAnnotation
+from mypy_boto3_builder.type_annotations.type_class import TypeClass
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+
+
+class FakeAnnotationTestCase(unittest.TestCase):
+    def test_cache(self) -> None:
+        subscript = TypeSubscript(TypeAnnotation(List), [TypeClass(str)])
+        self.assertEqual(str(subscript), "List[str]")
+        self.assertEqual(hash(subscript), hash("List[str]"))
+        subscript.add_child(TypeClass(int))
+        self.assertEqual(str(subscript), "List[str, int]")
+        self.assertEqual(hash(subscript), hash("List[str, int]"))
+        self.assertNotEqual(
+            subscript, TypeSubscript(TypeAnnotation(List), [TypeClass(str)])
+        )
+
+    def test_add_literal_child(self) -> None:
+        literal = TypeLiteral("a")
+        self.assertEqual(str(literal), "Literal['a']")
+        literal.add_literal_child("b")
+        self.assertEqual(str(literal), "Literal['a', 'b']")
+
+    def test_getstate(self) -> None:
+        subscript = TypeSubscript(TypeAnnotation(List), [TypeClass(str)])
+        hash(subscript)
+        self.assertNotIn("_rendered", copy.deepcopy(subscript).__dict__)
+        self.assertNotIn("_hash", pickle.loads(pickle.dumps(subscript)).__dict__)
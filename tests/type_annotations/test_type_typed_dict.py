@@ -0,0 +1,20 @@
+import unittest
+from unittest.mock import patch
+
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+
+class TypeTypedDictTestCase(unittest.TestCase):
+    def test_is_same(self) -> None:
+        typed_dict = TypeTypedDict("A")
+        typed_dict.add_attribute("key", Type.str, True)
+        other = TypeTypedDict("A")
+        self.assertFalse(typed_dict.is_same(other))
+        other.add_attribute("key", Type.str, True)
+        self.assertTrue(typed_dict.is_same(other))
+        self.assertEqual(typed_dict.get_rendered_children(), ("key: str",))
+
+        other.add_attribute("value", Type.int, False)
+        with patch.object(TypeTypedDict, "get_fingerprint", return_value=1):
+            self.assertFalse(typed_dict.is_same(other))
@@ -1,7 +1,10 @@
 import unittest
 
 from mypy_boto3_builder.service_name import ServiceNameCatalog
-from mypy_boto3_builder.type_maps.method_type_map import get_method_type_stub
+from mypy_boto3_builder.type_maps.method_type_map import (
+    get_method_type_stub,
+    has_method_type_stubs,
+)
 
 
 class MethodTypeMapTestCase(unittest.TestCase):
@@ -26,3 +29,17 @@ class MethodTypeMapTestCase(unittest.TestCase):
                 ServiceNameCatalog.logs, "Client", "copy_object", "Unknown"
             )
         )
+
+    def test_has_method_type_stubs(self) -> None:
+        self.assertTrue(
+            has_method_type_stubs(ServiceNameCatalog.s3, "Client", "copy_object")
+        )
+        self.assertTrue(
+            has_method_type_stubs(ServiceNameCatalog.ec2, "Any", "create_tags")
+        )
+        self.assertFalse(
+            has_method_type_stubs(ServiceNameCatalog.s3, "Client", "get_object")
+        )
+        self.assertFalse(
+            has_method_type_stubs(ServiceNameCatalog.logs, "Client", "copy_object")
+        )
@@ -0,0 +1,24 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+from mypy_boto3_builder.utils.peak_memory import get_peak_rss, reset_peak_rss
+
+
+class PeakMemoryTestCase(unittest.TestCase):
+    @patch("mypy_boto3_builder.utils.peak_memory.CLEAR_REFS_PATH")
+    def test_reset_peak_rss(self, CLEAR_REFS_PATH_MOCK: MagicMock) -> None:
+        self.assertTrue(reset_peak_rss())
+        CLEAR_REFS_PATH_MOCK.write_text.assert_called_with("5", encoding="utf-8")
+
+        CLEAR_REFS_PATH_MOCK.write_text.side_effect = PermissionError()
+        self.assertFalse(reset_peak_rss())
+
+    @patch("mypy_boto3_builder.utils.peak_memory.STATUS_PATH")
+    def test_get_peak_rss(self, STATUS_PATH_MOCK: MagicMock) -> None:
+        STATUS_PATH_MOCK.read_text.return_value = (
+            "VmPeak:\t  2048 kB\nVmHWM:\t  1024 kB\n"
+        )
+        self.assertEqual(get_peak_rss(), 1024 * 1024)
+
+        STATUS_PATH_MOCK.read_text.side_effect = FileNotFoundError()
+        self.assertGreater(get_peak_rss(), 0)
@@ -9,17 +9,20 @@ class Boto3StubsPackageTestCase(unittest.TestCase):
     @patch("mypy_boto3_builder.writers.boto3_stubs_package.shutil")
     @patch("mypy_boto3_builder.writers.boto3_stubs_package.filecmp")
     @patch("mypy_boto3_builder.writers.boto3_stubs_package.BOTO3_STUBS_STATIC_PATH")
-    @patch("mypy_boto3_builder.writers.boto3_stubs_package.blackify")
+    @patch("mypy_boto3_builder.writers.boto3_stubs_package.write_file")
+    @patch("mypy_boto3_builder.writers.boto3_stubs_package.Formatter")
     @patch("mypy_boto3_builder.writers.boto3_stubs_package.render_jinja2_template")
     def test_write_master_package(
         self,
         render_jinja2_template_mock: MagicMock,
-        blackify_mock: MagicMock,
+        FormatterMock: MagicMock,
+        write_file_mock: MagicMock,
         BOTO3_STUBS_STATIC_PATH_MOCK: MagicMock,
         filecmp_mock: MagicMock,
         shutil_mock: MagicMock,
     ) -> None:
         package_mock = MagicMock()
+        FormatterMock.format_files.side_effect = lambda files: [i for _, i in files]
         output_path_mock = MagicMock()
         static_path_mock = MagicMock()
         BOTO3_STUBS_STATIC_PATH_MOCK.glob.return_value = [
@@ -33,8 +36,12 @@ class Boto3StubsPackageTestCase(unittest.TestCase):
         render_jinja2_template_mock.assert_called_with(
             Path("boto3-stubs/boto3-stubs/version.py.jinja2"), package=package_mock,
         )
-        blackify_mock.assert_called_with(
-            render_jinja2_template_mock(), output_path_mock
+        rendered_files = FormatterMock.format_files.call_args[0][0]
+        self.assertEqual(
+            rendered_files[-1], (output_path_mock, render_jinja2_template_mock())
+        )
+        write_file_mock.assert_called_with(
+            output_path_mock, [render_jinja2_template_mock()]
         )
 
         filecmp_mock.cmp.return_value = False
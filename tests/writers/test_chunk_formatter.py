@@ -0,0 +1,190 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import black
+
+from mypy_boto3_builder.format_cache import FormatCache
+from mypy_boto3_builder.writers.chunk_formatter import (
+    IS_CLASS,
+    BlackAdapter,
+    ChunkFormatter,
+    ChunkLine,
+    consume_prefix,
+    group_lines,
+    split_chunks,
+)
+
+
+SOURCE = '''"""
+Module docstring.
+"""
+import sys
+from typing import Any, Dict
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+# Comment before constant
+CONSTANT = {'key': 'value', "other": [1, 2, 3]}
+
+
+
+@decorator
+class Client(BaseClient,):
+    """
+    Client docstring.
+    """
+    exceptions: Exceptions
+    def __init__(self, name: str) -> None:
+        self.name = name
+        # inner block comment
+
+    # method comment
+    @property
+    def very_long_method_name(self, argument_name: str, *, other_argument_name: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Method docstring.
+        """
+        if argument_name:
+            return {}
+        else:
+            return {'argument_name': argument_name}
+# top-level comment
+class Empty: pass
+def function(value: str = "a \\" quoted ( string", other: str = \'\'\'
+multiline (
+\'\'\') -> None:
+    pass
+__all__ = ("Client", 'Empty', "function")
+'''
+
+
+class ChunkFormatterTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = FormatCache(Path(self.temp_dir.name), 1024 * 1024)
+        self.file_path = Path("client.py")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_split_chunks(self) -> None:
+        chunks = split_chunks(SOURCE)
+        self.assertEqual(len(chunks), 12)
+        self.assertEqual([i.depth for i in chunks].count(1), 3)
+        self.assertTrue(chunks[0].text.startswith('"""'))
+        self.assertTrue(chunks[3].text.startswith("if sys.version_info"))
+        self.assertIn("else:", chunks[3].text)
+        self.assertTrue(chunks[4].text.startswith("# Comment"))
+        self.assertEqual(chunks[5].newlines, 3)
+        self.assertTrue(chunks[5].text.startswith("@decorator\nclass Client"))
+        self.assertTrue(chunks[7].text.endswith("# inner block comment\n"))
+        self.assertEqual(chunks[8].newlines, 1)
+        self.assertTrue(chunks[8].text.startswith("    # method comment"))
+        self.assertTrue(chunks[9].text.startswith("# top-level comment"))
+        self.assertTrue(chunks[10].text.endswith("    pass\n"))
+        with self.assertRaises(ValueError):
+            split_chunks("value = )\n")
+
+    def test_consume_prefix(self) -> None:
+        lines = [(0, 0, False), (1, 8, True), (2, 4, True), (3, 0, True)]
+        self.assertEqual(consume_prefix(lines, 8), 2)
+        self.assertEqual(consume_prefix(lines, 4), 3)
+        self.assertEqual(consume_prefix(lines, 12), 0)
+
+    def test_format(self) -> None:
+        expected = black.format_str(SOURCE, mode=black.FileMode(line_length=100))
+        formatter = ChunkFormatter(self.cache, self.file_path)
+        self.assertEqual(formatter.format(SOURCE), expected)
+        self.assertEqual(formatter.hits, 0)
+        self.assertEqual(formatter.misses, 12)
+
+        formatter = ChunkFormatter(self.cache, self.file_path)
+        self.assertEqual(formatter.format(SOURCE), expected)
+        self.assertEqual(formatter.hits, 12)
+        self.assertEqual(formatter.misses, 0)
+
+        source = SOURCE.replace("exceptions: Exceptions", "exceptions: 'Exceptions'")
+        formatter = ChunkFormatter(self.cache, self.file_path)
+        self.assertEqual(
+            formatter.format(source),
+            black.format_str(source, mode=black.FileMode(line_length=100)),
+        )
+        self.assertEqual(formatter.hits, 11)
+        self.assertEqual(formatter.misses, 1)
+
+        self.assertIsNone(formatter.format("value = (\n"))
+        self.assertIsNone(formatter.format("def f():\n    pass\n  pass\n"))
+
+    def test_format_changed_chunks(self) -> None:
+        ChunkFormatter(self.cache, self.file_path).format(SOURCE)
+        for old, new in (
+            ("self.name = name", "self.name = name.lower()"),
+            ("class Empty: pass", "class Empty: value = 1"),
+            ("# top-level comment", "# top-level comment\nVALUE = 1"),
+        ):
+            with self.subTest(old=old):
+                source = SOURCE.replace(old, new)
+                formatter = ChunkFormatter(self.cache, self.file_path)
+                self.assertEqual(
+                    formatter.format(source),
+                    black.format_str(source, mode=black.FileMode(line_length=100)),
+                )
+                self.assertGreater(formatter.hits, 0)
+
+    def test_format_features(self) -> None:
+        source = 'value = f"{1_000}"\n'
+        for _ in range(2):
+            formatter = ChunkFormatter(self.cache, self.file_path)
+            self.assertEqual(formatter.format(source), source)
+            self.assertEqual(formatter.hits, 0)
+
+    def test_group_lines(self) -> None:
+        chunks = split_chunks(SOURCE)
+        adapter = BlackAdapter(100)
+        node, _ = adapter.parse(SOURCE)
+        adapter.set_target(set())
+        result = group_lines(list(adapter.iter_lines(node)), chunks)
+        self.assertEqual(len(result), len(chunks))
+        self.assertTrue(result[7][-1].text.endswith("# inner block comment\n"))
+        self.assertTrue(result[8][0].text.endswith("# method comment\n"))
+        with self.assertRaises(ValueError):
+            group_lines(list(adapter.iter_lines(node)), chunks + chunks[-1:])
+
+    def test_format_black_error(self) -> None:
+        formatter = ChunkFormatter(self.cache, self.file_path)
+        with patch.object(black, "LineGenerator", side_effect=AttributeError):
+            self.assertIsNone(formatter.format(SOURCE))
+        with self.assertRaises(ValueError):
+            BlackAdapter(100).parse("value = (\n")
+
+    def test_chunk_line(self) -> None:
+        line = ChunkLine(depth=1, flags=IS_CLASS, newlines=2, text="class A: ...\n")
+        self.assertTrue(line.is_class)
+        self.assertFalse(line.is_def)
+        self.assertEqual(line.prefix, "\n\n")
+        line.prefix = ""
+        self.assertEqual(line.newlines, 0)
+        self.assertEqual(ChunkLine.from_dict(line.to_dict()), line)
+        with self.assertRaises(KeyError):
+            ChunkLine.from_dict({"depth": 1})
+
+    def test_format_target_versions(self) -> None:
+        source = "def f(*args,\n):\n    pass\ndef g(a, *args: str) -> None:\n    g(aaaaaa, *args)\n"
+        for line_length in (10, 100):
+            with self.subTest(line_length=line_length):
+                formatter = ChunkFormatter(self.cache, self.file_path, line_length)
+                self.assertEqual(
+                    formatter.format(source),
+                    black.format_str(
+                        source, mode=black.FileMode(line_length=line_length)
+                    ),
+                )
+
+    def test_is_supported(self) -> None:
+        self.assertTrue(ChunkFormatter.is_supported("value = 1\n", Path("a.py")))
+        self.assertFalse(ChunkFormatter.is_supported("value = 1\n", Path("a.pyi")))
+        self.assertFalse(ChunkFormatter.is_supported("\n", Path("a.py")))
+        self.assertFalse(ChunkFormatter.is_supported("# fmt: off\n", Path("a.py")))
@@ -0,0 +1,186 @@
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import black
+
+from mypy_boto3_builder.import_helpers.import_record import ImportRecord
+from mypy_boto3_builder.import_helpers.import_record_group import ImportRecordGroup
+from mypy_boto3_builder.import_helpers.import_string import ImportString
+from mypy_boto3_builder.jinja_manager import JinjaManager
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+from mypy_boto3_builder.writers.code_emitter import (
+    CodeEmitter,
+    iter_type_defs,
+    render_constant,
+    render_import_record_groups,
+)
+from mypy_boto3_builder.writers.utils import Formatter, render_jinja2_template
+
+
+def blackify(content: str) -> str:
+    return black.format_str(content, mode=black.FileMode(line_length=100))
+
+
+class CodeEmitterTestCase(unittest.TestCase):
+    def test_render_constant(self) -> None:
+        for value in ("value", 'say "hi"', "it's", "it's \"a\" 'b'", "\\d", 123):
+            with self.subTest(value=value):
+                code = render_constant(value)
+                self.assertEqual(blackify(f"{code}\n"), f"{code}\n")
+                self.assertEqual(eval(code), value)  # pylint: disable=eval-used
+
+    def test_add_typed_dict(self) -> None:
+        long_literal = TypeLiteral(*[f"value{i}" for i in range(20)])
+        very_long_literal = TypeLiteral(*[f"very_long_value_{i}" for i in range(20)])
+        annotations = [
+            Type.str,
+            TypeSubscript(Type.Dict, [Type.str, Type.Any]),
+            long_literal,
+            TypeSubscript(Type.List, [very_long_literal]),
+            TypeSubscript(
+                Type.Dict, [Type.str, TypeSubscript(Type.List, [very_long_literal])],
+            ),
+        ]
+        for name in ("A", "VeryLongTypedDictName" * 3):
+            for count in range(1, 12, 5):
+                for index, annotation in enumerate(annotations):
+                    typed_dict = TypeTypedDict(name)
+                    for key_index in range(count):
+                        typed_dict.add_attribute(
+                            f"Key{key_index}", annotation, bool(key_index % 2)
+                        )
+                    with self.subTest(name=name, count=count, index=index):
+                        emitter = CodeEmitter()
+                        emitter.add_typed_dict(typed_dict)
+                        result = emitter.render()
+                        self.assertEqual(blackify(result), result)
+
+    def test_empty_lines(self) -> None:
+        emitter = CodeEmitter()
+        emitter.add_line("import sys")
+        emitter.add_line("if sys.version_info >= (3, 8):")
+        emitter.add_line("from typing import Literal", depth=1)
+        emitter.add_line("else:")
+        emitter.add_line("from typing_extensions import Literal", depth=1)
+        emitter.add_line("from typing import Any")
+        emitter.add_names(["A"], empty_lines=3)
+        typed_dict = TypeTypedDict("A")
+        typed_dict.add_attribute("a", Type.Any, True)
+        typed_dict.add_attribute("b", Type.Any, False)
+        emitter.add_typed_dict(typed_dict)
+        emitter.add_typed_dict(TypeTypedDict("B"))
+        result = emitter.render()
+        self.assertEqual(blackify(result), result)
+        self.assertIn("\n\nif sys.version_info", result)
+        self.assertIn('\n\n\n__all__ = ("A",)\n\n_RequiredA', result)
+        self.assertIn(
+            "\n\n\nclass A(_RequiredA, _OptionalA):\n    pass\n\n\nB = ", result
+        )
+
+    def test_render_import_record_groups(self) -> None:
+        import_records = [
+            ImportRecord(ImportString("typing"), "Any"),
+            ImportRecord(ImportString("typing"), "Dict"),
+            ImportRecord(ImportString("datetime"), "datetime"),
+            ImportRecord(ImportString("boto3")),
+            ImportRecord(
+                ImportString("typing"),
+                "Literal",
+                fallback=ImportRecord(ImportString("typing_extensions"), "Literal"),
+            ),
+            ImportRecord(ImportString("module", "client"), "Client", "Client_scope"),
+            *[
+                ImportRecord(ImportString("module", "type_defs"), f"LongTypeDefName{i}")
+                for i in range(8)
+            ],
+        ]
+        result = render_import_record_groups(
+            ImportRecordGroup.from_import_records(import_records)
+        )
+        self.assertEqual(blackify(result), result)
+        self.assertIn("    from typing_extensions import Literal\n", result)
+        self.assertIn("    LongTypeDefName7,\n)\n", result)
+        self.assertIn("else:\n    Client_scope = object\n", result)
+
+    def test_iter_type_defs(self) -> None:
+        typed_dict = TypeTypedDict("RequestTypeDef")
+        typed_dict.add_attribute("Name", Type.str, True)
+        typed_dict.add_attribute(
+            "Tags", TypeSubscript(Type.Dict, [Type.str, Type.Any]), False
+        )
+        long_typed_dict = TypeTypedDict("ResponseTypeDef")
+        long_typed_dict.add_attribute(
+            "Statuses",
+            TypeSubscript(
+                Type.List, [TypeLiteral(*[f"STATUS_{i}" for i in range(20)])],
+            ),
+            False,
+        )
+        import_record_groups = ImportRecordGroup.from_import_records(
+            [
+                ImportRecord(ImportString("typing"), "Any"),
+                ImportRecord(ImportString("typing"), "Dict"),
+                ImportRecord(ImportString("typing"), "List"),
+                ImportRecord(
+                    ImportString("typing"),
+                    "Literal",
+                    fallback=ImportRecord(ImportString("typing_extensions"), "Literal"),
+                ),
+            ]
+        )
+        names = [f"VeryLongTypedDictName{i}" for i in range(5)]
+        result = "".join(
+            iter_type_defs(import_record_groups, names, [typed_dict, long_typed_dict])
+        )
+        content = f'"""\nDocstring.\n"""\n{result}'
+        self.assertEqual(blackify(content), content)
+        self.assertIn(
+            "class RequestTypeDef(_RequiredRequestTypeDef, _OptionalRequestTypeDef):",
+            content,
+        )
+        self.assertIn('"STATUS_19",\n', content)
+
+        parts = list(
+            iter_type_defs(import_record_groups, names, [typed_dict, long_typed_dict])
+        )
+        self.assertEqual(len(parts), 3)
+        self.assertTrue(parts[1].startswith("\n_RequiredRequestTypeDef"))
+
+    @patch("mypy_boto3_builder.writers.utils.get_logger")
+    def test_type_defs_template(self, get_logger_mock: MagicMock) -> None:
+        typed_dicts = []
+        for index, annotation in enumerate(
+            (
+                Type.str,
+                TypeSubscript(Type.Dict, [Type.str, Type.Any]),
+                TypeLiteral(*[f"VALUE_{i}" for i in range(3)]),
+                TypeSubscript(
+                    Type.List, [TypeLiteral(*[f"VALUE_{i}" for i in range(30)])]
+                ),
+            )
+        ):
+            typed_dict = TypeTypedDict(f"Shape{index}TypeDef")
+            typed_dict.add_attribute("Name", annotation, True)
+            typed_dict.add_attribute(f"VeryLongAttributeName{index}", annotation, False)
+            typed_dicts.append(typed_dict)
+        service_name = MagicMock()
+        service_name.boto3_name = "s3"
+        service_name.import_name = "s3"
+        package = ServicePackage(
+            "name", "pypi_name", service_name, MagicMock(), typed_dicts=typed_dicts
+        )
+        JinjaManager.update_globals(master_module_name="mypy_boto3")
+        content = render_jinja2_template(
+            Path("service/service/type_defs.py.jinja2"), package=package
+        )
+        file_path = Path("type_defs.py")
+        formatted = Formatter._verify_content(  # pylint: disable=protected-access
+            file_path, content, blackify(content), is_emitted=True
+        )
+        self.assertEqual(formatted, content)
+        get_logger_mock().warning.assert_not_called()
@@ -6,12 +6,17 @@ from mypy_boto3_builder.writers.master_package import write_master_package
 
 
 class MasterPackageTestCase(unittest.TestCase):
-    @patch("mypy_boto3_builder.writers.master_package.blackify")
+    @patch("mypy_boto3_builder.writers.master_package.write_file")
+    @patch("mypy_boto3_builder.writers.master_package.Formatter")
     @patch("mypy_boto3_builder.writers.master_package.render_jinja2_template")
     def test_write_master_package(
-        self, render_jinja2_template_mock: MagicMock, blackify_mock: MagicMock
+        self,
+        render_jinja2_template_mock: MagicMock,
+        FormatterMock: MagicMock,
+        write_file_mock: MagicMock,
     ) -> None:
         package_mock = MagicMock()
+        FormatterMock.format_files.side_effect = lambda files: [i for _, i in files]
         output_path_mock = MagicMock()
         output_path_mock.__truediv__.return_value = output_path_mock
         self.assertEqual(
@@ -21,6 +26,13 @@ class MasterPackageTestCase(unittest.TestCase):
         render_jinja2_template_mock.assert_called_with(
             Path("master/master/submodules.py.jinja2"), package=package_mock,
         )
-        blackify_mock.assert_called_with(
-            render_jinja2_template_mock(), output_path_mock
+        rendered_files = FormatterMock.format_files.call_args[0][0]
+        self.assertEqual(
+            rendered_files[-1], (output_path_mock, render_jinja2_template_mock())
+        )
+        write_file_mock.assert_called_with(
+            output_path_mock, [render_jinja2_template_mock()]
         )
+
+        write_file_mock.return_value = False
+        self.assertEqual(write_master_package(package_mock, output_path_mock), [])
@@ -1,12 +1,22 @@
 import unittest
+from fnmatch import fnmatch
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from mypy_boto3_builder.shared_type_defs import get_typed_dict_signature
 from mypy_boto3_builder.structures.boto3_stubs_package import Boto3StubsPackage
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.structures.shared_package import SharedPackage
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
 from mypy_boto3_builder.writers.processors import (
+    collect_services_signatures,
     process_boto3_stubs,
+    process_ir_package,
     process_master,
     process_service,
+    process_services,
+    process_shared,
 )
 
 
@@ -33,7 +43,7 @@ class ProcessorsTestCase(unittest.TestCase):
         write_master_package_mock.return_value = [Path("modified_path")]
         result = process_master("session", Path("my_path"), ["service_name"])
         write_master_package_mock.assert_called_with(result, Path("my_path"))
-        parse_master_package_mock.assert_called_with("session", ["service_name"])
+        parse_master_package_mock.assert_called_with("session", ["service_name"], None)
         self.assertEqual(result, parse_master_package_mock())
 
     @patch("mypy_boto3_builder.writers.processors.parse_service_package")
@@ -52,5 +62,134 @@ class ProcessorsTestCase(unittest.TestCase):
         service_name_mock = MagicMock()
         result = process_service("session", service_name_mock, Path("my_path"))
         write_service_package_mock.assert_called_with(result, Path("my_path"))
-        parse_service_package_mock.assert_called_with("session", service_name_mock)
+        parse_service_package_mock.assert_called_with(
+            "session", service_name_mock, False
+        )
         self.assertEqual(result, parse_service_package_mock())
+
+        package_cache_mock = MagicMock()
+        package_cache_mock.load.return_value = None
+        result = process_service(
+            "session",
+            service_name_mock,
+            Path("my_path"),
+            package_cache=package_cache_mock,
+        )
+        package_cache_mock.get_key.assert_called_with("session", service_name_mock)
+        package_cache_mock.save.assert_called_with(
+            service_name_mock, package_cache_mock.get_key(), result
+        )
+
+        parse_service_package_mock.reset_mock()
+        package_cache_mock.load.return_value = "cached_package"
+        result = process_service(
+            "session",
+            service_name_mock,
+            Path("my_path"),
+            package_cache=package_cache_mock,
+        )
+        self.assertEqual(result, "cached_package")
+        parse_service_package_mock.assert_not_called()
+
+    @patch("mypy_boto3_builder.writers.processors.parse_service_package")
+    @patch("mypy_boto3_builder.writers.processors.write_service_package")
+    @patch("mypy_boto3_builder.writers.processors.logger")
+    @patch("mypy_boto3_builder.writers.processors.reset_peak_rss")
+    @patch("mypy_boto3_builder.writers.processors.get_peak_rss")
+    def test_process_service_peak_rss(
+        self,
+        get_peak_rss_mock: MagicMock,
+        reset_peak_rss_mock: MagicMock,
+        logger_mock: MagicMock,
+        write_service_package_mock: MagicMock,
+        _parse_service_package_mock: MagicMock,
+    ) -> None:
+        write_service_package_mock.return_value = []
+        service_name_mock = MagicMock()
+        service_name_mock.boto3_name = "s3"
+        get_peak_rss_mock.return_value = 150 * 1024 * 1024
+        process_service("session", service_name_mock, Path("my_path"))
+        reset_peak_rss_mock.assert_called_with()
+        logger_mock.debug.assert_called_with("Peak RSS for s3: 150.0 MB")
+
+        logger_mock.reset_mock()
+        get_peak_rss_mock.return_value = 0
+        process_service("session", service_name_mock, Path("my_path"))
+        self.assertNotIn("Peak", logger_mock.debug.call_args[0][0])
+
+    @patch("mypy_boto3_builder.writers.processors.parse_service_package")
+    @patch("mypy_boto3_builder.writers.processors.write_service_package")
+    @patch("mypy_boto3_builder.writers.processors.get_logger")
+    def test_process_service_shared(
+        self,
+        _get_logger_mock: MagicMock,
+        _write_service_package_mock: MagicMock,
+        parse_service_package_mock: MagicMock,
+    ) -> None:
+        typed_dict_a = TypeTypedDict("A")
+        typed_dict_a.add_attribute("key", Type.str, True)
+        typed_dict_b = TypeTypedDict("B")
+        parse_service_package_mock.return_value = ServicePackage(
+            "name",
+            "pypi_name",
+            MagicMock(),
+            MagicMock(),
+            typed_dicts=[typed_dict_a, typed_dict_b],
+        )
+        shared_signatures = {"A": get_typed_dict_signature(typed_dict_a)[0]}
+        result = process_service(
+            "session",
+            MagicMock(),
+            Path("my_path"),
+            shared_signatures=shared_signatures,
+        )
+        self.assertEqual(result.shared_typed_dicts, [typed_dict_a])
+        self.assertEqual(result.typed_dicts, [typed_dict_b])
+
+    @patch("mypy_boto3_builder.writers.processors.parse_service_package")
+    @patch("mypy_boto3_builder.writers.processors.get_logger")
+    def test_collect_services_signatures(
+        self, _get_logger_mock: MagicMock, parse_service_package_mock: MagicMock,
+    ) -> None:
+        service_name_mock = MagicMock()
+        service_name_mock.module_name = "module_name"
+        parse_service_package_mock().typed_dicts = [TypeTypedDict("A")]
+        result = collect_services_signatures("session", [service_name_mock])
+        self.assertEqual(list(result[0]), ["A"])
+
+    @patch("mypy_boto3_builder.writers.processors.process_service")
+    @patch("mypy_boto3_builder.writers.processors.logger")
+    def test_process_services(
+        self, _logger_mock: MagicMock, process_service_mock: MagicMock
+    ) -> None:
+        service_name_mock = MagicMock()
+        service_name_mock.module_name = "module_name"
+        result = process_services("session", [service_name_mock], Path("my_path"))
+        self.assertEqual(list(result), [service_name_mock])
+        process_service_mock.assert_called_with(
+            session="session",
+            service_name=service_name_mock,
+            output_path=Path("my_path/module_name_package"),
+            package_cache=None,
+            ir_path=None,
+            docstrings=False,
+            shared_signatures=None,
+        )
+
+    @patch("mypy_boto3_builder.writers.processors.write_shared_package")
+    @patch("mypy_boto3_builder.writers.processors.logger")
+    def test_process_shared(
+        self, _logger_mock: MagicMock, write_shared_package_mock: MagicMock
+    ) -> None:
+        write_shared_package_mock.return_value = []
+        shared_package = SharedPackage()
+        self.assertEqual(
+            process_shared(shared_package, Path("my_path")), shared_package
+        )
+        write_shared_package_mock.assert_called_with(shared_package, Path("my_path"))
+
+        result = process_ir_package(shared_package, Path("my_path"))
+        self.assertEqual(result.parent, Path("my_path"))
+        # release.sh publishes `mypy_boto3_*` and install.sh installs `*_package`
+        self.assertTrue(fnmatch(result.name, "mypy_boto3_*"))
+        self.assertTrue(fnmatch(result.name, "*_package"))
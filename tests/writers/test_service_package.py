@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -6,12 +7,21 @@ from mypy_boto3_builder.writers.service_package import write_service_package
 
 
 class ServicePackageTestCase(unittest.TestCase):
-    @patch("mypy_boto3_builder.writers.service_package.blackify")
+    @patch("mypy_boto3_builder.writers.service_package.write_file")
+    @patch("mypy_boto3_builder.writers.service_package.Formatter")
+    @patch("mypy_boto3_builder.writers.service_package.generate_jinja2_template")
     @patch("mypy_boto3_builder.writers.service_package.render_jinja2_template")
     def test_write_service_package(
-        self, render_jinja2_template_mock: MagicMock, blackify_mock: MagicMock
+        self,
+        render_jinja2_template_mock: MagicMock,
+        generate_jinja2_template_mock: MagicMock,
+        FormatterMock: MagicMock,
+        write_file_mock: MagicMock,
     ) -> None:
         package_mock = MagicMock()
+        package_mock.name = "mypy_boto3_s3"
+        FormatterMock.verify = True
+        FormatterMock.format_files.side_effect = lambda files, *_: [i for _, i in files]
         output_path_mock = MagicMock()
         output_path_mock.__truediv__.return_value = output_path_mock
         self.assertEqual(
@@ -23,6 +33,30 @@ class ServicePackageTestCase(unittest.TestCase):
             package=package_mock,
             service_name=package_mock.service_name,
         )
-        blackify_mock.assert_called_with(
-            render_jinja2_template_mock(), output_path_mock
+        rendered_files = FormatterMock.format_files.call_args[0][0]
+        self.assertEqual(
+            rendered_files[-1], (output_path_mock, render_jinja2_template_mock())
+        )
+        write_file_mock.assert_called_with(
+            output_path_mock, [render_jinja2_template_mock()]
         )
+        generate_jinja2_template_mock.assert_not_called()
+
+        FormatterMock.verify = False
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            type_defs_path = output_path / "mypy_boto3_s3" / "type_defs.py"
+            modified_paths = write_service_package(package_mock, output_path)
+            self.assertEqual(len(modified_paths), 11)
+            self.assertEqual(modified_paths[0], type_defs_path)
+            generate_jinja2_template_mock.assert_called_once_with(
+                Path("service/service/type_defs.py.jinja2"),
+                package=package_mock,
+                service_name=package_mock.service_name,
+            )
+            write_file_mock.assert_any_call(
+                type_defs_path, generate_jinja2_template_mock()
+            )
+            rendered_files = FormatterMock.format_files.call_args[0][0]
+            self.assertEqual(len(rendered_files), 10)
+            self.assertNotIn(type_defs_path, [i for i, _ in rendered_files])
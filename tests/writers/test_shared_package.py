@@ -0,0 +1,57 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from mypy_boto3_builder.writers.shared_package import write_shared_package
+
+
+class SharedPackageTestCase(unittest.TestCase):
+    @patch("mypy_boto3_builder.writers.shared_package.write_file")
+    @patch("mypy_boto3_builder.writers.shared_package.Formatter")
+    @patch("mypy_boto3_builder.writers.shared_package.generate_jinja2_template")
+    @patch("mypy_boto3_builder.writers.shared_package.render_jinja2_template")
+    def test_write_shared_package(
+        self,
+        render_jinja2_template_mock: MagicMock,
+        generate_jinja2_template_mock: MagicMock,
+        FormatterMock: MagicMock,
+        write_file_mock: MagicMock,
+    ) -> None:
+        package_mock = MagicMock()
+        package_mock.name = "mypy_boto3_shared"
+        FormatterMock.verify = True
+        FormatterMock.format_files.side_effect = lambda files, *_: [i for _, i in files]
+        output_path_mock = MagicMock()
+        output_path_mock.__truediv__.return_value = output_path_mock
+        self.assertEqual(
+            write_shared_package(package_mock, output_path_mock),
+            [output_path_mock] * 6,
+        )
+        render_jinja2_template_mock.assert_called_with(
+            Path("shared/shared/type_defs.py.jinja2"), package=package_mock,
+        )
+        rendered_files = FormatterMock.format_files.call_args[0][0]
+        self.assertEqual(
+            rendered_files[-1], (output_path_mock, render_jinja2_template_mock())
+        )
+        generate_jinja2_template_mock.assert_not_called()
+
+        FormatterMock.verify = False
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            type_defs_path = output_path / "mypy_boto3_shared" / "type_defs.py"
+            modified_paths = write_shared_package(package_mock, output_path)
+            self.assertEqual(len(modified_paths), 6)
+            self.assertEqual(modified_paths[0], type_defs_path)
+            generate_jinja2_template_mock.assert_called_once_with(
+                Path("shared/shared/type_defs.py.jinja2"), package=package_mock,
+            )
+            write_file_mock.assert_any_call(
+                type_defs_path, generate_jinja2_template_mock()
+            )
+
+        package_mock.typed_dicts = []
+        self.assertEqual(
+            len(write_shared_package(package_mock, output_path_mock)), 5,
+        )
@@ -1,9 +1,22 @@
+import tempfile
 import unittest
+from pathlib import Path
+from typing import Iterator
 from unittest.mock import patch, MagicMock
 
 from black import NothingChanged
+from jinja2 import TemplateNotFound
 
-from mypy_boto3_builder.writers.utils import blackify, render_jinja2_template
+from mypy_boto3_builder.build_stats import BuildStats
+from mypy_boto3_builder.format_cache import FormatCache
+from mypy_boto3_builder.writers.utils import (
+    Formatter,
+    blackify,
+    generate_jinja2_template,
+    get_file_hash,
+    render_jinja2_template,
+    write_file,
+)
 
 
 class UtilsTestCase(unittest.TestCase):
@@ -31,11 +44,105 @@ class UtilsTestCase(unittest.TestCase):
         black_mock.format_file_contents.side_effect = NothingChanged()
         self.assertEqual(blackify("my content", file_path_mock), "my content")
 
-    @patch("mypy_boto3_builder.writers.utils.TEMPLATES_PATH")
-    @patch("mypy_boto3_builder.writers.utils.JinjaManager")
-    def test_render_jinja2_template(
-        self, JinjaManagerMock: MagicMock, TEMPLATES_PATH_MOCK: MagicMock
+    @patch("mypy_boto3_builder.writers.utils.blackify")
+    def test_formatter(self, blackify_mock: MagicMock) -> None:
+        blackify_mock.side_effect = lambda content, file_path: f"{content} formatted"
+        files = [
+            (Path("README.md"), "readme"),
+            (Path("client.py"), "client"),
+            (Path("__init__.pyi"), "init"),
+        ]
+        result = Formatter.format_files(files)
+        self.assertEqual(result, ["readme", "client formatted", "init formatted"])
+        self.assertEqual(blackify_mock.call_count, 2)
+        BuildStats.pop()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            Formatter.cache = FormatCache(Path(temp_dir), 1024 * 1024)
+            try:
+                self.assertEqual(Formatter.format_files(files), result)
+                blackify_mock.reset_mock()
+                self.assertEqual(Formatter.format_files(files), result)
+                blackify_mock.assert_not_called()
+            finally:
+                Formatter.cache = None
+        counters, timers = BuildStats.pop()
+        self.assertEqual(counters, {"format_cache_hits": 2, "format_cache_misses": 2})
+        self.assertIn("format_time", timers)
+
+    @patch("mypy_boto3_builder.writers.utils.get_logger")
+    @patch("mypy_boto3_builder.writers.utils.blackify")
+    def test_formatter_formatted_paths(
+        self, blackify_mock: MagicMock, get_logger_mock: MagicMock
     ) -> None:
+        blackify_mock.side_effect = lambda content, file_path: "formatted"
+        files = [(Path("client.py"), "client"), (Path("type_defs.py"), "formatted")]
+        formatted_paths = {Path("type_defs.py")}
+        result = Formatter.format_files(files, formatted_paths)
+        self.assertEqual(result, ["formatted", "formatted"])
+        blackify_mock.assert_called_once_with("client", Path("client.py"))
+
+        Formatter.verify = True
+        try:
+            files = [(Path("type_defs.py"), "emitted")]
+            result = Formatter.format_files(files, formatted_paths)
+        finally:
+            Formatter.verify = False
+        self.assertEqual(result, ["formatted"])
+        get_logger_mock().warning.assert_called_with(
+            "Emitted code in type_defs.py differs from black output"
+        )
+        BuildStats.pop()
+
+    @patch("mypy_boto3_builder.writers.utils.CHUNK_FORMAT_SIZE", 0)
+    def test_formatter_chunks(self) -> None:
+        file_path = Path("client.py")
+        content = "class A:\n  x=1\n  def f(self): pass\n"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            Formatter.cache = FormatCache(Path(temp_dir), 1024 * 1024)
+            try:
+                result = Formatter.format_files([(file_path, content)])
+                Formatter.cache.get_path(
+                    Formatter.cache.get_key(content, file_path)
+                ).unlink()
+                self.assertEqual(Formatter.format_files([(file_path, content)]), result)
+            finally:
+                Formatter.cache = None
+        self.assertEqual(result, [blackify(content, file_path)])
+        counters, _ = BuildStats.pop()
+        self.assertEqual(
+            counters,
+            {
+                "format_cache_misses": 2,
+                "format_chunk_hits": 2,
+                "format_chunk_misses": 2,
+            },
+        )
+
+    @patch("mypy_boto3_builder.writers.utils.multiprocessing")
+    def test_formatter_pool(self, multiprocessing_mock: MagicMock) -> None:
+        pool_mock = multiprocessing_mock.Pool().__enter__()
+        pool_mock.starmap.return_value = ["a formatted", "b formatted"]
+        with Formatter.start_pool(2):
+            self.assertEqual(Formatter.pool, pool_mock)
+            multiprocessing_mock.Pool.assert_called_with(processes=2)
+            result = Formatter.format_files([(Path("a.py"), "a"), (Path("b.py"), "b")])
+        self.assertEqual(result, ["a formatted", "b formatted"])
+        self.assertEqual(
+            list(pool_mock.starmap.call_args[0][1]),
+            [("a", Path("a.py")), ("b", Path("b.py"))],
+        )
+        pool_mock.join.assert_called_with()
+        self.assertIsNone(Formatter.pool)
+        BuildStats.pop()
+
+        multiprocessing_mock.reset_mock()
+        with Formatter.start_pool(1):
+            self.assertIsNone(Formatter.pool)
+        multiprocessing_mock.Pool.assert_not_called()
+
+    @patch("mypy_boto3_builder.writers.utils.JinjaManager")
+    def test_render_jinja2_template(self, JinjaManagerMock: MagicMock) -> None:
         template_path_mock = MagicMock()
         result = render_jinja2_template(template_path_mock, "package", "service_name")
         JinjaManagerMock.get_environment.assert_called_with()
@@ -49,6 +156,50 @@ class UtilsTestCase(unittest.TestCase):
             result, JinjaManagerMock.get_environment().get_template().render(),
         )
 
-        TEMPLATES_PATH_MOCK.__truediv__().exists.return_value = False
+        JinjaManagerMock.get_environment().get_template.side_effect = TemplateNotFound(
+            "name"
+        )
         with self.assertRaises(ValueError):
             render_jinja2_template(template_path_mock, "package", "service_name")
+
+    @patch("mypy_boto3_builder.writers.utils.JinjaManager")
+    def test_generate_jinja2_template(self, JinjaManagerMock: MagicMock) -> None:
+        template_mock = JinjaManagerMock.get_environment().get_template()
+        template_mock.generate.return_value = iter(["part1", "part2"])
+        result = generate_jinja2_template(Path("template"), "package", "service_name")
+        template_mock.generate.assert_not_called()
+        self.assertEqual(list(result), ["part1", "part2"])
+        template_mock.generate.assert_called_with(
+            package="package", service_name="service_name"
+        )
+        self.assertIn("render_time", BuildStats.pop()[1])
+
+        JinjaManagerMock.get_environment().get_template.side_effect = TemplateNotFound(
+            "name"
+        )
+        with self.assertRaises(ValueError):
+            list(generate_jinja2_template(Path("template")))
+
+    def test_write_file(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "module.py"
+            self.assertIsNone(get_file_hash(file_path))
+            self.assertTrue(write_file(file_path, ["value = ", "1\n"]))
+            self.assertEqual(file_path.read_text(), "value = 1\n")
+            self.assertEqual(len(get_file_hash(file_path) or ""), 64)
+
+            mtime = file_path.stat().st_mtime_ns
+            self.assertFalse(write_file(file_path, ["value = 1\n"]))
+            self.assertEqual(file_path.stat().st_mtime_ns, mtime)
+            self.assertTrue(write_file(file_path, ["value = 2\n"]))
+            self.assertTrue(write_file(file_path, ["value = 22\n"]))
+            self.assertEqual(file_path.read_text(), "value = 22\n")
+
+            def parts() -> Iterator[str]:
+                yield "value = "
+                raise ValueError("error")
+
+            with self.assertRaises(ValueError):
+                write_file(file_path, parts())
+            self.assertEqual(file_path.read_text(), "value = 22\n")
+            self.assertEqual(list(Path(temp_dir).iterdir()), [file_path])